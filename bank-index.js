@@ -0,0 +1,93 @@
+// Generated by tests/compile_bank.py from data.js - do not edit by hand
+const questionBankIndex = {
+    "version": 3,
+    "contentHash": "f0da802cd7b6747a",
+    "questionCount": 50,
+    "categories": [
+        {
+            "name": "Communication",
+            "questionCount": 13,
+            "questionIndexes": [
+                0,
+                1,
+                2,
+                3,
+                4,
+                5,
+                6,
+                7,
+                8,
+                9,
+                10,
+                11,
+                12
+            ],
+            "maxScore": 52,
+            "minScore": 13
+        },
+        {
+            "name": "Leadership",
+            "questionCount": 12,
+            "questionIndexes": [
+                13,
+                14,
+                15,
+                16,
+                17,
+                18,
+                19,
+                20,
+                21,
+                22,
+                23,
+                24
+            ],
+            "maxScore": 48,
+            "minScore": 12
+        },
+        {
+            "name": "Stress Management",
+            "questionCount": 13,
+            "questionIndexes": [
+                25,
+                26,
+                27,
+                28,
+                29,
+                30,
+                31,
+                32,
+                33,
+                34,
+                35,
+                36,
+                37
+            ],
+            "maxScore": 52,
+            "minScore": 13
+        },
+        {
+            "name": "Teamwork",
+            "questionCount": 12,
+            "questionIndexes": [
+                38,
+                39,
+                40,
+                41,
+                42,
+                43,
+                44,
+                45,
+                46,
+                47,
+                48,
+                49
+            ],
+            "maxScore": 48,
+            "minScore": 12
+        }
+    ],
+    "chunkDir": "bank",
+    "chunkSize": 25,
+    "chunkCount": 2
+};
@@ -0,0 +1,758 @@
+// Generated by tests/compile_bank.py from data.js - do not edit by hand
+registerQuestionChunk(0, [
+    {
+        "id": 1,
+        "category": "Communication",
+        "question": "How comfortable are you expressing your ideas in a group setting?",
+        "options": [
+            {
+                "text": "Very uncomfortable",
+                "weight": 1
+            },
+            {
+                "text": "Somewhat uncomfortable",
+                "weight": 2
+            },
+            {
+                "text": "Comfortable",
+                "weight": 3
+            },
+            {
+                "text": "Very comfortable",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 2,
+        "category": "Communication",
+        "question": "How often do you actively listen to others without interrupting?",
+        "options": [
+            {
+                "text": "Rarely",
+                "weight": 1
+            },
+            {
+                "text": "Sometimes",
+                "weight": 2
+            },
+            {
+                "text": "Often",
+                "weight": 3
+            },
+            {
+                "text": "Always",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 3,
+        "category": "Communication",
+        "question": "How clearly can you explain complex concepts to others?",
+        "options": [
+            {
+                "text": "Struggle significantly",
+                "weight": 1
+            },
+            {
+                "text": "Manage with difficulty",
+                "weight": 2
+            },
+            {
+                "text": "Explain fairly well",
+                "weight": 3
+            },
+            {
+                "text": "Explain very clearly",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 4,
+        "category": "Communication",
+        "question": "How well do you handle constructive criticism?",
+        "options": [
+            {
+                "text": "Take it personally",
+                "weight": 1
+            },
+            {
+                "text": "Feel defensive",
+                "weight": 2
+            },
+            {
+                "text": "Accept it calmly",
+                "weight": 3
+            },
+            {
+                "text": "Welcome and use it",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 5,
+        "category": "Communication",
+        "question": "How effective are you at written communication (emails, reports)?",
+        "options": [
+            {
+                "text": "Often unclear",
+                "weight": 1
+            },
+            {
+                "text": "Somewhat clear",
+                "weight": 2
+            },
+            {
+                "text": "Clear and concise",
+                "weight": 3
+            },
+            {
+                "text": "Highly effective",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 6,
+        "category": "Communication",
+        "question": "How well do you read non-verbal cues in conversations?",
+        "options": [
+            {
+                "text": "Rarely notice",
+                "weight": 1
+            },
+            {
+                "text": "Sometimes notice",
+                "weight": 2
+            },
+            {
+                "text": "Usually notice",
+                "weight": 3
+            },
+            {
+                "text": "Always attentive",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 7,
+        "category": "Communication",
+        "question": "How comfortable are you giving presentations?",
+        "options": [
+            {
+                "text": "Extremely anxious",
+                "weight": 1
+            },
+            {
+                "text": "Nervous but manage",
+                "weight": 2
+            },
+            {
+                "text": "Fairly comfortable",
+                "weight": 3
+            },
+            {
+                "text": "Very confident",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 8,
+        "category": "Communication",
+        "question": "How well do you adapt your communication style to different audiences?",
+        "options": [
+            {
+                "text": "Use same style always",
+                "weight": 1
+            },
+            {
+                "text": "Minimal adaptation",
+                "weight": 2
+            },
+            {
+                "text": "Adapt moderately",
+                "weight": 3
+            },
+            {
+                "text": "Adapt seamlessly",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 9,
+        "category": "Communication",
+        "question": "How effectively do you resolve misunderstandings?",
+        "options": [
+            {
+                "text": "Often struggle",
+                "weight": 1
+            },
+            {
+                "text": "Eventually resolve",
+                "weight": 2
+            },
+            {
+                "text": "Resolve efficiently",
+                "weight": 3
+            },
+            {
+                "text": "Prevent and resolve expertly",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 10,
+        "category": "Communication",
+        "question": "How open are you to different viewpoints?",
+        "options": [
+            {
+                "text": "Stick to my views",
+                "weight": 1
+            },
+            {
+                "text": "Somewhat open",
+                "weight": 2
+            },
+            {
+                "text": "Open-minded",
+                "weight": 3
+            },
+            {
+                "text": "Actively seek diverse views",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 11,
+        "category": "Communication",
+        "question": "How well do you articulate your feelings and emotions?",
+        "options": [
+            {
+                "text": "Very difficult",
+                "weight": 1
+            },
+            {
+                "text": "Somewhat difficult",
+                "weight": 2
+            },
+            {
+                "text": "Express adequately",
+                "weight": 3
+            },
+            {
+                "text": "Express clearly",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 12,
+        "category": "Communication",
+        "question": "How effectively do you use feedback to improve communication?",
+        "options": [
+            {
+                "text": "Ignore feedback",
+                "weight": 1
+            },
+            {
+                "text": "Consider sometimes",
+                "weight": 2
+            },
+            {
+                "text": "Usually implement",
+                "weight": 3
+            },
+            {
+                "text": "Actively seek and apply",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 13,
+        "category": "Communication",
+        "question": "How well do you maintain professional relationships through communication?",
+        "options": [
+            {
+                "text": "Often have conflicts",
+                "weight": 1
+            },
+            {
+                "text": "Maintain basic relationships",
+                "weight": 2
+            },
+            {
+                "text": "Build good relationships",
+                "weight": 3
+            },
+            {
+                "text": "Excel at relationship building",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 14,
+        "category": "Leadership",
+        "question": "How often do you take initiative in group projects?",
+        "options": [
+            {
+                "text": "Never",
+                "weight": 1
+            },
+            {
+                "text": "Occasionally",
+                "weight": 2
+            },
+            {
+                "text": "Frequently",
+                "weight": 3
+            },
+            {
+                "text": "Always lead",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 15,
+        "category": "Leadership",
+        "question": "How well do you motivate others to achieve goals?",
+        "options": [
+            {
+                "text": "Unable to motivate",
+                "weight": 1
+            },
+            {
+                "text": "Motivate with difficulty",
+                "weight": 2
+            },
+            {
+                "text": "Motivate effectively",
+                "weight": 3
+            },
+            {
+                "text": "Inspire and energize",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 16,
+        "category": "Leadership",
+        "question": "How do you handle decision-making under pressure?",
+        "options": [
+            {
+                "text": "Freeze or avoid",
+                "weight": 1
+            },
+            {
+                "text": "Make hasty decisions",
+                "weight": 2
+            },
+            {
+                "text": "Decide thoughtfully",
+                "weight": 3
+            },
+            {
+                "text": "Excel under pressure",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 17,
+        "category": "Leadership",
+        "question": "How well do you delegate tasks to team members?",
+        "options": [
+            {
+                "text": "Do everything myself",
+                "weight": 1
+            },
+            {
+                "text": "Delegate reluctantly",
+                "weight": 2
+            },
+            {
+                "text": "Delegate appropriately",
+                "weight": 3
+            },
+            {
+                "text": "Empower others effectively",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 18,
+        "category": "Leadership",
+        "question": "How do you respond when your leadership decisions are questioned?",
+        "options": [
+            {
+                "text": "Become defensive",
+                "weight": 1
+            },
+            {
+                "text": "Feel uncertain",
+                "weight": 2
+            },
+            {
+                "text": "Listen and explain",
+                "weight": 3
+            },
+            {
+                "text": "Welcome dialogue",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 19,
+        "category": "Leadership",
+        "question": "How effectively do you set clear goals for your team?",
+        "options": [
+            {
+                "text": "Goals are unclear",
+                "weight": 1
+            },
+            {
+                "text": "Goals somewhat clear",
+                "weight": 2
+            },
+            {
+                "text": "Set clear goals",
+                "weight": 3
+            },
+            {
+                "text": "Set inspiring, clear goals",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 20,
+        "category": "Leadership",
+        "question": "How well do you handle conflicts within your team?",
+        "options": [
+            {
+                "text": "Avoid conflicts",
+                "weight": 1
+            },
+            {
+                "text": "Struggle to resolve",
+                "weight": 2
+            },
+            {
+                "text": "Mediate effectively",
+                "weight": 3
+            },
+            {
+                "text": "Turn conflicts into growth",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 21,
+        "category": "Leadership",
+        "question": "How do you balance being authoritative and approachable?",
+        "options": [
+            {
+                "text": "Struggle with balance",
+                "weight": 1
+            },
+            {
+                "text": "Lean too much one way",
+                "weight": 2
+            },
+            {
+                "text": "Maintain good balance",
+                "weight": 3
+            },
+            {
+                "text": "Master the balance",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 22,
+        "category": "Leadership",
+        "question": "How well do you recognize and appreciate team members' contributions?",
+        "options": [
+            {
+                "text": "Rarely acknowledge",
+                "weight": 1
+            },
+            {
+                "text": "Occasionally recognize",
+                "weight": 2
+            },
+            {
+                "text": "Regularly appreciate",
+                "weight": 3
+            },
+            {
+                "text": "Consistently celebrate success",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 23,
+        "category": "Leadership",
+        "question": "How do you handle failure or setbacks as a leader?",
+        "options": [
+            {
+                "text": "Blame others",
+                "weight": 1
+            },
+            {
+                "text": "Get discouraged",
+                "weight": 2
+            },
+            {
+                "text": "Learn and move forward",
+                "weight": 3
+            },
+            {
+                "text": "Turn failures into opportunities",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 24,
+        "category": "Leadership",
+        "question": "How well do you mentor and develop others?",
+        "options": [
+            {
+                "text": "Don't mentor",
+                "weight": 1
+            },
+            {
+                "text": "Provide basic guidance",
+                "weight": 2
+            },
+            {
+                "text": "Actively mentor",
+                "weight": 3
+            },
+            {
+                "text": "Develop future leaders",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 25,
+        "category": "Leadership",
+        "question": "How effectively do you communicate vision and direction?",
+        "options": [
+            {
+                "text": "No clear vision",
+                "weight": 1
+            },
+            {
+                "text": "Vision unclear to others",
+                "weight": 2
+            },
+            {
+                "text": "Communicate vision well",
+                "weight": 3
+            },
+            {
+                "text": "Inspire with compelling vision",
+                "weight": 4
+            }
+        ]
+    }
+], {
+    "idToIndex": {
+        "1": 0,
+        "2": 1,
+        "3": 2,
+        "4": 3,
+        "5": 4,
+        "6": 5,
+        "7": 6,
+        "8": 7,
+        "9": 8,
+        "10": 9,
+        "11": 10,
+        "12": 11,
+        "13": 12,
+        "14": 13,
+        "15": 14,
+        "16": 15,
+        "17": 16,
+        "18": 17,
+        "19": 18,
+        "20": 19,
+        "21": 20,
+        "22": 21,
+        "23": 22,
+        "24": 23,
+        "25": 24
+    },
+    "optionText": [
+        {
+            "1": "Very uncomfortable",
+            "2": "Somewhat uncomfortable",
+            "3": "Comfortable",
+            "4": "Very comfortable"
+        },
+        {
+            "1": "Rarely",
+            "2": "Sometimes",
+            "3": "Often",
+            "4": "Always"
+        },
+        {
+            "1": "Struggle significantly",
+            "2": "Manage with difficulty",
+            "3": "Explain fairly well",
+            "4": "Explain very clearly"
+        },
+        {
+            "1": "Take it personally",
+            "2": "Feel defensive",
+            "3": "Accept it calmly",
+            "4": "Welcome and use it"
+        },
+        {
+            "1": "Often unclear",
+            "2": "Somewhat clear",
+            "3": "Clear and concise",
+            "4": "Highly effective"
+        },
+        {
+            "1": "Rarely notice",
+            "2": "Sometimes notice",
+            "3": "Usually notice",
+            "4": "Always attentive"
+        },
+        {
+            "1": "Extremely anxious",
+            "2": "Nervous but manage",
+            "3": "Fairly comfortable",
+            "4": "Very confident"
+        },
+        {
+            "1": "Use same style always",
+            "2": "Minimal adaptation",
+            "3": "Adapt moderately",
+            "4": "Adapt seamlessly"
+        },
+        {
+            "1": "Often struggle",
+            "2": "Eventually resolve",
+            "3": "Resolve efficiently",
+            "4": "Prevent and resolve expertly"
+        },
+        {
+            "1": "Stick to my views",
+            "2": "Somewhat open",
+            "3": "Open-minded",
+            "4": "Actively seek diverse views"
+        },
+        {
+            "1": "Very difficult",
+            "2": "Somewhat difficult",
+            "3": "Express adequately",
+            "4": "Express clearly"
+        },
+        {
+            "1": "Ignore feedback",
+            "2": "Consider sometimes",
+            "3": "Usually implement",
+            "4": "Actively seek and apply"
+        },
+        {
+            "1": "Often have conflicts",
+            "2": "Maintain basic relationships",
+            "3": "Build good relationships",
+            "4": "Excel at relationship building"
+        },
+        {
+            "1": "Never",
+            "2": "Occasionally",
+            "3": "Frequently",
+            "4": "Always lead"
+        },
+        {
+            "1": "Unable to motivate",
+            "2": "Motivate with difficulty",
+            "3": "Motivate effectively",
+            "4": "Inspire and energize"
+        },
+        {
+            "1": "Freeze or avoid",
+            "2": "Make hasty decisions",
+            "3": "Decide thoughtfully",
+            "4": "Excel under pressure"
+        },
+        {
+            "1": "Do everything myself",
+            "2": "Delegate reluctantly",
+            "3": "Delegate appropriately",
+            "4": "Empower others effectively"
+        },
+        {
+            "1": "Become defensive",
+            "2": "Feel uncertain",
+            "3": "Listen and explain",
+            "4": "Welcome dialogue"
+        },
+        {
+            "1": "Goals are unclear",
+            "2": "Goals somewhat clear",
+            "3": "Set clear goals",
+            "4": "Set inspiring, clear goals"
+        },
+        {
+            "1": "Avoid conflicts",
+            "2": "Struggle to resolve",
+            "3": "Mediate effectively",
+            "4": "Turn conflicts into growth"
+        },
+        {
+            "1": "Struggle with balance",
+            "2": "Lean too much one way",
+            "3": "Maintain good balance",
+            "4": "Master the balance"
+        },
+        {
+            "1": "Rarely acknowledge",
+            "2": "Occasionally recognize",
+            "3": "Regularly appreciate",
+            "4": "Consistently celebrate success"
+        },
+        {
+            "1": "Blame others",
+            "2": "Get discouraged",
+            "3": "Learn and move forward",
+            "4": "Turn failures into opportunities"
+        },
+        {
+            "1": "Don't mentor",
+            "2": "Provide basic guidance",
+            "3": "Actively mentor",
+            "4": "Develop future leaders"
+        },
+        {
+            "1": "No clear vision",
+            "2": "Vision unclear to others",
+            "3": "Communicate vision well",
+            "4": "Inspire with compelling vision"
+        }
+    ]
+});
@@ -0,0 +1,758 @@
+// Generated by tests/compile_bank.py from data.js - do not edit by hand
+registerQuestionChunk(1, [
+    {
+        "id": 26,
+        "category": "Stress Management",
+        "question": "How well do you cope with tight deadlines?",
+        "options": [
+            {
+                "text": "Overwhelmed and anxious",
+                "weight": 1
+            },
+            {
+                "text": "Stressed but complete tasks",
+                "weight": 2
+            },
+            {
+                "text": "Handle well with planning",
+                "weight": 3
+            },
+            {
+                "text": "Thrive under deadlines",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 27,
+        "category": "Stress Management",
+        "question": "How do you react to unexpected changes or challenges?",
+        "options": [
+            {
+                "text": "Panic or freeze",
+                "weight": 1
+            },
+            {
+                "text": "Feel anxious but adapt slowly",
+                "weight": 2
+            },
+            {
+                "text": "Adapt reasonably well",
+                "weight": 3
+            },
+            {
+                "text": "Embrace change confidently",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 28,
+        "category": "Stress Management",
+        "question": "How well do you maintain work-life balance?",
+        "options": [
+            {
+                "text": "No balance, always stressed",
+                "weight": 1
+            },
+            {
+                "text": "Struggle to balance",
+                "weight": 2
+            },
+            {
+                "text": "Maintain decent balance",
+                "weight": 3
+            },
+            {
+                "text": "Excellent balance",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 29,
+        "category": "Stress Management",
+        "question": "How do you handle criticism or negative feedback?",
+        "options": [
+            {
+                "text": "Very stressed, take personally",
+                "weight": 1
+            },
+            {
+                "text": "Feel upset but recover",
+                "weight": 2
+            },
+            {
+                "text": "Handle constructively",
+                "weight": 3
+            },
+            {
+                "text": "Use as growth opportunity",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 30,
+        "category": "Stress Management",
+        "question": "How well do you manage multiple priorities simultaneously?",
+        "options": [
+            {
+                "text": "Feel overwhelmed",
+                "weight": 1
+            },
+            {
+                "text": "Manage with difficulty",
+                "weight": 2
+            },
+            {
+                "text": "Prioritize effectively",
+                "weight": 3
+            },
+            {
+                "text": "Excel at multitasking",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 31,
+        "category": "Stress Management",
+        "question": "How often do you practice stress-relief techniques?",
+        "options": [
+            {
+                "text": "Never",
+                "weight": 1
+            },
+            {
+                "text": "Rarely",
+                "weight": 2
+            },
+            {
+                "text": "Regularly",
+                "weight": 3
+            },
+            {
+                "text": "Daily routine",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 32,
+        "category": "Stress Management",
+        "question": "How well do you recognize your stress triggers?",
+        "options": [
+            {
+                "text": "Unaware of triggers",
+                "weight": 1
+            },
+            {
+                "text": "Somewhat aware",
+                "weight": 2
+            },
+            {
+                "text": "Clearly identify triggers",
+                "weight": 3
+            },
+            {
+                "text": "Proactively manage triggers",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 33,
+        "category": "Stress Management",
+        "question": "How do you handle conflict in high-pressure situations?",
+        "options": [
+            {
+                "text": "Avoid or escalate",
+                "weight": 1
+            },
+            {
+                "text": "Struggle to manage",
+                "weight": 2
+            },
+            {
+                "text": "Handle calmly",
+                "weight": 3
+            },
+            {
+                "text": "De-escalate effectively",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 34,
+        "category": "Stress Management",
+        "question": "How well do you maintain focus during stressful periods?",
+        "options": [
+            {
+                "text": "Lose focus easily",
+                "weight": 1
+            },
+            {
+                "text": "Focus wavers",
+                "weight": 2
+            },
+            {
+                "text": "Maintain focus mostly",
+                "weight": 3
+            },
+            {
+                "text": "Laser-focused always",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 35,
+        "category": "Stress Management",
+        "question": "How do you recover after a stressful day?",
+        "options": [
+            {
+                "text": "Carry stress for days",
+                "weight": 1
+            },
+            {
+                "text": "Take time to recover",
+                "weight": 2
+            },
+            {
+                "text": "Recover by next day",
+                "weight": 3
+            },
+            {
+                "text": "Bounce back immediately",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 36,
+        "category": "Stress Management",
+        "question": "How well do you ask for help when overwhelmed?",
+        "options": [
+            {
+                "text": "Never ask for help",
+                "weight": 1
+            },
+            {
+                "text": "Reluctant to ask",
+                "weight": 2
+            },
+            {
+                "text": "Ask when necessary",
+                "weight": 3
+            },
+            {
+                "text": "Proactively seek support",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 37,
+        "category": "Stress Management",
+        "question": "How do you handle failure or mistakes under pressure?",
+        "options": [
+            {
+                "text": "Dwell on mistakes",
+                "weight": 1
+            },
+            {
+                "text": "Feel guilty, then move on",
+                "weight": 2
+            },
+            {
+                "text": "Learn and improve",
+                "weight": 3
+            },
+            {
+                "text": "Quick learner, resilient",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 38,
+        "category": "Stress Management",
+        "question": "How well do you maintain positive attitude during challenges?",
+        "options": [
+            {
+                "text": "Become negative",
+                "weight": 1
+            },
+            {
+                "text": "Struggle to stay positive",
+                "weight": 2
+            },
+            {
+                "text": "Mostly stay positive",
+                "weight": 3
+            },
+            {
+                "text": "Always optimistic",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 39,
+        "category": "Teamwork",
+        "question": "How well do you collaborate with diverse team members?",
+        "options": [
+            {
+                "text": "Prefer working alone",
+                "weight": 1
+            },
+            {
+                "text": "Work with similar people only",
+                "weight": 2
+            },
+            {
+                "text": "Collaborate well with most",
+                "weight": 3
+            },
+            {
+                "text": "Thrive in diverse teams",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 40,
+        "category": "Teamwork",
+        "question": "How do you contribute to team discussions?",
+        "options": [
+            {
+                "text": "Rarely participate",
+                "weight": 1
+            },
+            {
+                "text": "Contribute minimally",
+                "weight": 2
+            },
+            {
+                "text": "Active participant",
+                "weight": 3
+            },
+            {
+                "text": "Drive meaningful discussions",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 41,
+        "category": "Teamwork",
+        "question": "How well do you support team members who are struggling?",
+        "options": [
+            {
+                "text": "Focus on my work only",
+                "weight": 1
+            },
+            {
+                "text": "Help if asked",
+                "weight": 2
+            },
+            {
+                "text": "Proactively offer help",
+                "weight": 3
+            },
+            {
+                "text": "Mentor and support actively",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 42,
+        "category": "Teamwork",
+        "question": "How do you handle disagreements within the team?",
+        "options": [
+            {
+                "text": "Create more conflict",
+                "weight": 1
+            },
+            {
+                "text": "Stay silent",
+                "weight": 2
+            },
+            {
+                "text": "Express views respectfully",
+                "weight": 3
+            },
+            {
+                "text": "Facilitate consensus",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 43,
+        "category": "Teamwork",
+        "question": "How well do you share credit for team achievements?",
+        "options": [
+            {
+                "text": "Take credit myself",
+                "weight": 1
+            },
+            {
+                "text": "Acknowledge some contributions",
+                "weight": 2
+            },
+            {
+                "text": "Share credit fairly",
+                "weight": 3
+            },
+            {
+                "text": "Highlight others' contributions",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 44,
+        "category": "Teamwork",
+        "question": "How reliable are you in meeting team commitments?",
+        "options": [
+            {
+                "text": "Often miss deadlines",
+                "weight": 1
+            },
+            {
+                "text": "Sometimes late",
+                "weight": 2
+            },
+            {
+                "text": "Usually reliable",
+                "weight": 3
+            },
+            {
+                "text": "Always dependable",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 45,
+        "category": "Teamwork",
+        "question": "How well do you adapt to different team roles?",
+        "options": [
+            {
+                "text": "Inflexible with roles",
+                "weight": 1
+            },
+            {
+                "text": "Prefer specific roles",
+                "weight": 2
+            },
+            {
+                "text": "Adapt to needed roles",
+                "weight": 3
+            },
+            {
+                "text": "Excel in any role",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 46,
+        "category": "Teamwork",
+        "question": "How do you contribute to team morale?",
+        "options": [
+            {
+                "text": "Bring negativity",
+                "weight": 1
+            },
+            {
+                "text": "Neutral presence",
+                "weight": 2
+            },
+            {
+                "text": "Positive contributor",
+                "weight": 3
+            },
+            {
+                "text": "Boost team spirit actively",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 47,
+        "category": "Teamwork",
+        "question": "How well do you give constructive feedback to teammates?",
+        "options": [
+            {
+                "text": "Never provide feedback",
+                "weight": 1
+            },
+            {
+                "text": "Give critical feedback only",
+                "weight": 2
+            },
+            {
+                "text": "Provide balanced feedback",
+                "weight": 3
+            },
+            {
+                "text": "Excel at constructive feedback",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 48,
+        "category": "Teamwork",
+        "question": "How do you handle team members who don't pull their weight?",
+        "options": [
+            {
+                "text": "Complain or ignore",
+                "weight": 1
+            },
+            {
+                "text": "Do their work myself",
+                "weight": 2
+            },
+            {
+                "text": "Address issue diplomatically",
+                "weight": 3
+            },
+            {
+                "text": "Coach and support improvement",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 49,
+        "category": "Teamwork",
+        "question": "How well do you build trust within your team?",
+        "options": [
+            {
+                "text": "Trust issues common",
+                "weight": 1
+            },
+            {
+                "text": "Basic trust level",
+                "weight": 2
+            },
+            {
+                "text": "Build good trust",
+                "weight": 3
+            },
+            {
+                "text": "Create strong, trusting bonds",
+                "weight": 4
+            }
+        ]
+    },
+    {
+        "id": 50,
+        "category": "Teamwork",
+        "question": "How effectively do you celebrate team successes?",
+        "options": [
+            {
+                "text": "Don't celebrate",
+                "weight": 1
+            },
+            {
+                "text": "Minimal acknowledgment",
+                "weight": 2
+            },
+            {
+                "text": "Celebrate appropriately",
+                "weight": 3
+            },
+            {
+                "text": "Create memorable celebrations",
+                "weight": 4
+            }
+        ]
+    }
+], {
+    "idToIndex": {
+        "26": 25,
+        "27": 26,
+        "28": 27,
+        "29": 28,
+        "30": 29,
+        "31": 30,
+        "32": 31,
+        "33": 32,
+        "34": 33,
+        "35": 34,
+        "36": 35,
+        "37": 36,
+        "38": 37,
+        "39": 38,
+        "40": 39,
+        "41": 40,
+        "42": 41,
+        "43": 42,
+        "44": 43,
+        "45": 44,
+        "46": 45,
+        "47": 46,
+        "48": 47,
+        "49": 48,
+        "50": 49
+    },
+    "optionText": [
+        {
+            "1": "Overwhelmed and anxious",
+            "2": "Stressed but complete tasks",
+            "3": "Handle well with planning",
+            "4": "Thrive under deadlines"
+        },
+        {
+            "1": "Panic or freeze",
+            "2": "Feel anxious but adapt slowly",
+            "3": "Adapt reasonably well",
+            "4": "Embrace change confidently"
+        },
+        {
+            "1": "No balance, always stressed",
+            "2": "Struggle to balance",
+            "3": "Maintain decent balance",
+            "4": "Excellent balance"
+        },
+        {
+            "1": "Very stressed, take personally",
+            "2": "Feel upset but recover",
+            "3": "Handle constructively",
+            "4": "Use as growth opportunity"
+        },
+        {
+            "1": "Feel overwhelmed",
+            "2": "Manage with difficulty",
+            "3": "Prioritize effectively",
+            "4": "Excel at multitasking"
+        },
+        {
+            "1": "Never",
+            "2": "Rarely",
+            "3": "Regularly",
+            "4": "Daily routine"
+        },
+        {
+            "1": "Unaware of triggers",
+            "2": "Somewhat aware",
+            "3": "Clearly identify triggers",
+            "4": "Proactively manage triggers"
+        },
+        {
+            "1": "Avoid or escalate",
+            "2": "Struggle to manage",
+            "3": "Handle calmly",
+            "4": "De-escalate effectively"
+        },
+        {
+            "1": "Lose focus easily",
+            "2": "Focus wavers",
+            "3": "Maintain focus mostly",
+            "4": "Laser-focused always"
+        },
+        {
+            "1": "Carry stress for days",
+            "2": "Take time to recover",
+            "3": "Recover by next day",
+            "4": "Bounce back immediately"
+        },
+        {
+            "1": "Never ask for help",
+            "2": "Reluctant to ask",
+            "3": "Ask when necessary",
+            "4": "Proactively seek support"
+        },
+        {
+            "1": "Dwell on mistakes",
+            "2": "Feel guilty, then move on",
+            "3": "Learn and improve",
+            "4": "Quick learner, resilient"
+        },
+        {
+            "1": "Become negative",
+            "2": "Struggle to stay positive",
+            "3": "Mostly stay positive",
+            "4": "Always optimistic"
+        },
+        {
+            "1": "Prefer working alone",
+            "2": "Work with similar people only",
+            "3": "Collaborate well with most",
+            "4": "Thrive in diverse teams"
+        },
+        {
+            "1": "Rarely participate",
+            "2": "Contribute minimally",
+            "3": "Active participant",
+            "4": "Drive meaningful discussions"
+        },
+        {
+            "1": "Focus on my work only",
+            "2": "Help if asked",
+            "3": "Proactively offer help",
+            "4": "Mentor and support actively"
+        },
+        {
+            "1": "Create more conflict",
+            "2": "Stay silent",
+            "3": "Express views respectfully",
+            "4": "Facilitate consensus"
+        },
+        {
+            "1": "Take credit myself",
+            "2": "Acknowledge some contributions",
+            "3": "Share credit fairly",
+            "4": "Highlight others' contributions"
+        },
+        {
+            "1": "Often miss deadlines",
+            "2": "Sometimes late",
+            "3": "Usually reliable",
+            "4": "Always dependable"
+        },
+        {
+            "1": "Inflexible with roles",
+            "2": "Prefer specific roles",
+            "3": "Adapt to needed roles",
+            "4": "Excel in any role"
+        },
+        {
+            "1": "Bring negativity",
+            "2": "Neutral presence",
+            "3": "Positive contributor",
+            "4": "Boost team spirit actively"
+        },
+        {
+            "1": "Never provide feedback",
+            "2": "Give critical feedback only",
+            "3": "Provide balanced feedback",
+            "4": "Excel at constructive feedback"
+        },
+        {
+            "1": "Complain or ignore",
+            "2": "Do their work myself",
+            "3": "Address issue diplomatically",
+            "4": "Coach and support improvement"
+        },
+        {
+            "1": "Trust issues common",
+            "2": "Basic trust level",
+            "3": "Build good trust",
+            "4": "Create strong, trusting bonds"
+        },
+        {
+            "1": "Don't celebrate",
+            "2": "Minimal acknowledgment",
+            "3": "Celebrate appropriately",
+            "4": "Create memorable celebrations"
+        }
+    ]
+});
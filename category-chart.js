@@ -0,0 +1,163 @@
+/**
+ * Psychological Assessment System - Category Chart
+ * Dependency-free category bar chart for result.html and the PDF export
+ *
+ * categoryChartLayout() computes the bars, gridlines and labels once in
+ * abstract units; renderCategoryChartSvg() turns that layout into inline SVG
+ * markup and drawCategoryChartPdf() draws it with jsPDF vector calls. No
+ * DOM access, so the same code also runs inside a Web Worker.
+ *
+ * categories: [{ name, maxScore }] in display order (bank-index.js categories)
+ */
+
+// Bar colors per category, as RGB (same palette as the former Chart.js chart)
+const CHART_COLORS = {
+    'Communication': [54, 162, 235],
+    'Leadership': [255, 99, 132],
+    'Stress Management': [255, 206, 86],
+    'Teamwork': [75, 192, 192]
+};
+const CHART_DEFAULT_COLOR = [99, 102, 241];
+const CHART_FILL_OPACITY = 0.7;
+const CHART_TICK_STEP = 10;
+const CHART_GRID_COLOR = [229, 231, 235];
+const CHART_TEXT_COLOR = [102, 102, 102];
+
+/**
+ * Compute chart geometry for a width x height drawing area
+ * The value axis runs from 0 to the largest category maximum.
+ */
+function categoryChartLayout(categoryScores, categories, width, height) {
+    const fontSize = height * 0.04;
+    const plot = {
+        x: fontSize * 3,
+        y: fontSize,
+        width: width - fontSize * 3.5,
+        height: height - fontSize * 4
+    };
+    const max = Math.max(...categories.map(category => category.maxScore));
+    const valueToY = value => plot.y + plot.height - (value / max) * plot.height;
+
+    const ticks = [];
+    for (let value = 0; value <= max; value += CHART_TICK_STEP) {
+        ticks.push({ value: value, y: valueToY(value) });
+    }
+
+    // Bars take 60% of each category slot, centred
+    const slot = plot.width / categories.length;
+    const bars = categories.map((category, index) => {
+        const score = Math.min(categoryScores[category.name] || 0, max);
+        const top = valueToY(score);
+        return {
+            name: category.name,
+            score: categoryScores[category.name] || 0,
+            maxScore: category.maxScore,
+            color: CHART_COLORS[category.name] || CHART_DEFAULT_COLOR,
+            x: plot.x + slot * index + slot * 0.2,
+            y: top,
+            width: slot * 0.6,
+            height: plot.y + plot.height - top,
+            labelX: plot.x + slot * index + slot / 2
+        };
+    });
+
+    return {
+        width: width,
+        height: height,
+        fontSize: fontSize,
+        plot: plot,
+        max: max,
+        ticks: ticks,
+        bars: bars,
+        labelY: plot.y + plot.height + fontSize * 2
+    };
+}
+
+/**
+ * Escape text for SVG markup
+ */
+function escapeChartText(text) {
+    return String(text)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
+/**
+ * Render the chart as an inline SVG string
+ * Each bar carries a <title>, shown by the browser as its tooltip.
+ */
+function renderCategoryChartSvg(categoryScores, categories, width = 600, height = 300) {
+    const layout = categoryChartLayout(categoryScores, categories, width, height);
+    const rgb = color => color.join(', ');
+    const num = value => Number(value.toFixed(2));
+    const plotLeft = num(layout.plot.x);
+    const plotRight = num(layout.plot.x + layout.plot.width);
+    const parts = [];
+
+    parts.push(
+        `<svg class="category-chart" viewBox="0 0 ${width} ${height}" role="img" ` +
+        `aria-label="Category scores" xmlns="http://www.w3.org/2000/svg" ` +
+        `font-family="sans-serif" font-size="${num(layout.fontSize)}">`
+    );
+
+    layout.ticks.forEach(tick => {
+        parts.push(
+            `<line x1="${plotLeft}" y1="${num(tick.y)}" x2="${plotRight}" y2="${num(tick.y)}" ` +
+            `stroke="rgb(${rgb(CHART_GRID_COLOR)})" stroke-width="1"/>`,
+            `<text x="${num(layout.plot.x - layout.fontSize * 0.5)}" y="${num(tick.y)}" text-anchor="end" ` +
+            `dominant-baseline="middle" fill="rgb(${rgb(CHART_TEXT_COLOR)})">${tick.value}</text>`
+        );
+    });
+
+    layout.bars.forEach(bar => {
+        parts.push(
+            `<rect class="category-chart-bar" x="${num(bar.x)}" y="${num(bar.y)}" ` +
+            `width="${num(bar.width)}" height="${num(bar.height)}" ` +
+            `fill="rgba(${rgb(bar.color)}, ${CHART_FILL_OPACITY})" stroke="rgb(${rgb(bar.color)})" stroke-width="2">` +
+            `<title>${escapeChartText(bar.name)}\nScore: ${bar.score}</title></rect>`,
+            `<text x="${num(bar.labelX)}" y="${num(layout.labelY)}" text-anchor="middle" ` +
+            `fill="rgb(${rgb(CHART_TEXT_COLOR)})">${escapeChartText(bar.name)}</text>`
+        );
+    });
+
+    parts.push('</svg>');
+    return parts.join('');
+}
+
+/**
+ * Draw the chart with jsPDF vector calls inside the box at (x, y), in PDF units
+ */
+function drawCategoryChartPdf(pdf, categoryScores, categories, x, y, width, height) {
+    const layout = categoryChartLayout(categoryScores, categories, width, height);
+    // PDF fills are opaque, so pre-blend the bar color with the white page
+    const blend = color => color.map(channel =>
+        Math.round(channel * CHART_FILL_OPACITY + 255 * (1 - CHART_FILL_OPACITY))
+    );
+    // jsPDF font sizes are in points; layout units are the document's (mm)
+    const fontSize = layout.fontSize * 72 / 25.4;
+
+    pdf.setFontSize(fontSize);
+    pdf.setFont('helvetica', 'normal');
+    pdf.setLineWidth(0.2);
+
+    layout.ticks.forEach(tick => {
+        pdf.setDrawColor(...CHART_GRID_COLOR);
+        pdf.line(x + layout.plot.x, y + tick.y, x + layout.plot.x + layout.plot.width, y + tick.y);
+        pdf.setTextColor(...CHART_TEXT_COLOR);
+        pdf.text(String(tick.value), x + layout.plot.x - layout.fontSize * 0.5, y + tick.y, {
+            align: 'right',
+            baseline: 'middle'
+        });
+    });
+
+    layout.bars.forEach(bar => {
+        pdf.setFillColor(...blend(bar.color));
+        pdf.setDrawColor(...bar.color);
+        pdf.rect(x + bar.x, y + bar.y, bar.width, bar.height, 'FD');
+        pdf.setTextColor(...CHART_TEXT_COLOR);
+        pdf.text(bar.name, x + bar.labelX, y + layout.labelY, { align: 'center' });
+        pdf.text(String(bar.score), x + bar.labelX, y + bar.y - layout.fontSize * 0.5, { align: 'center' });
+    });
+}
@@ -0,0 +1,81 @@
+/**
+ * Psychological Assessment System - Motion Profile
+ * Scales the app's deliberate delays (the auto-advance after an answer) and
+ * animations (counting scores, score bars, the Chart.js draw, CSS effects)
+ *
+ *   normal    as designed
+ *   reduced   no animations, delays kept (default with prefers-reduced-motion)
+ *   fast      no animations and no delays (the Selenium suites use this)
+ *
+ * Pick one with ?motion=normal|reduced|fast, or scale both with a factor,
+ * e.g. ?motion=0.25. Like ?timing=on, the choice is kept in sessionStorage
+ * for the rest of the tab, so the results page follows it; ?motion=auto
+ * goes back to the prefers-reduced-motion default.
+ *
+ * motion.pending counts delays and animations still running; automation
+ * waits for it to reach 0 instead of sleeping (see tests/readiness.py).
+ */
+
+const MOTION_KEY = 'motionProfile';
+
+// Multipliers for delay and animation durations (0 = skip straight to the end)
+const MOTION_PROFILES = {
+    normal: { delays: 1, animations: 1 },
+    reduced: { delays: 1, animations: 0 },
+    fast: { delays: 0, animations: 0 }
+};
+
+const motion = (() => {
+    const param = new URLSearchParams(window.location.search).get('motion');
+    if (param === 'auto') {
+        sessionStorage.removeItem(MOTION_KEY);
+    } else if (param && (MOTION_PROFILES[param] || Number(param) >= 0)) {
+        sessionStorage.setItem(MOTION_KEY, param);
+    }
+
+    const reducedMotion = window.matchMedia && window.matchMedia('(prefers-reduced-motion: reduce)').matches;
+    const profile = sessionStorage.getItem(MOTION_KEY) || (reducedMotion ? 'reduced' : 'normal');
+    const scales = MOTION_PROFILES[profile] || { delays: Number(profile), animations: Number(profile) };
+
+    return {
+        profile,                          // Profile name, or the scale factor as given
+        delayScale: scales.delays,
+        animationScale: scales.animations,
+        pending: 0,                       // Delays and animations still running
+        settledAt: 0                      // performance.now() when pending last dropped to 0
+    };
+})();
+
+// style.css turns CSS animations and transitions off for these profiles
+document.documentElement.dataset.motion = motion.animationScale === 0 ? 'off' : motion.profile;
+
+/**
+ * Duration of a deliberate pause, in ms, for the current profile
+ */
+function motionDelay(ms) {
+    return ms * motion.delayScale;
+}
+
+/**
+ * Duration of an animation (or the stagger before it), in ms, for the current profile
+ */
+function motionDuration(ms) {
+    return ms * motion.animationScale;
+}
+
+/**
+ * Count a delay or animation as running until the matching endMotion()
+ */
+function beginMotion() {
+    motion.pending++;
+}
+
+/**
+ * Mark a delay or animation started with beginMotion() as finished
+ */
+function endMotion() {
+    motion.pending--;
+    if (motion.pending === 0) {
+        motion.settledAt = performance.now();
+    }
+}
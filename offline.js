@@ -0,0 +1,69 @@
+/**
+ * Psychological Assessment System - Offline Support
+ * Registers service-worker.js, which precaches the app shell and question
+ * bank so repeat visits load from the cache and work without a network
+ *
+ * ?sw=off skips registration and removes an installed worker, for
+ * measuring loads without it.
+ */
+
+// Service worker state that automation can wait on
+const offlineSupport = {
+    enabled: 'serviceWorker' in navigator && new URLSearchParams(window.location.search).get('sw') !== 'off',
+    ready: false,         // Precache installed and a worker active
+    updateWaiting: false, // A newer version is installed and waiting to take over
+    safePoint: false      // This page allows a waiting version to take over
+};
+let appServiceWorkerRegistration = null;
+
+/**
+ * Register the service worker once the page has finished loading
+ */
+function registerAppServiceWorker() {
+    if (!('serviceWorker' in navigator)) return;
+
+    if (!offlineSupport.enabled) {
+        navigator.serviceWorker.getRegistrations()
+            .then(registrations => registrations.forEach(registration => registration.unregister()));
+        return;
+    }
+
+    window.addEventListener('load', () => {
+        // updateViaCache 'none': update checks always see the latest precache-manifest.js
+        navigator.serviceWorker.register('service-worker.js', { updateViaCache: 'none' })
+            .then(registration => {
+                appServiceWorkerRegistration = registration;
+                activateWaitingServiceWorker();
+                registration.addEventListener('updatefound', () => {
+                    registration.installing.addEventListener('statechange', activateWaitingServiceWorker);
+                });
+                return navigator.serviceWorker.ready;
+            })
+            .then(() => {
+                offlineSupport.ready = true;
+            })
+            .catch(error => console.error('Service worker registration failed:', error));
+    });
+}
+
+/**
+ * Note a waiting new version, and let it take over if this page is a safe point
+ */
+function activateWaitingServiceWorker() {
+    const waiting = appServiceWorkerRegistration && appServiceWorkerRegistration.waiting;
+    offlineSupport.updateWaiting = Boolean(waiting);
+    if (waiting && offlineSupport.safePoint) {
+        waiting.postMessage({ type: 'SKIP_WAITING' });
+    }
+}
+
+/**
+ * Mark this page as a safe point for updates (no quiz in progress)
+ * The new version then serves the next page load.
+ */
+function allowServiceWorkerUpdate() {
+    offlineSupport.safePoint = true;
+    activateWaitingServiceWorker();
+}
+
+registerAppServiceWorker();
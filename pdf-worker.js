@@ -0,0 +1,49 @@
+/**
+ * Psychological Assessment System - PDF Worker
+ * Builds the PDF report off the main thread so the results page stays
+ * responsive while the download is prepared
+ *
+ * Message in:  { id, results, categories }
+ * Message out: { id, blob } or { id, error }
+ */
+
+const JSPDF_LOCAL = 'vendor/jspdf.umd.min.js';
+const JSPDF_CDN = 'https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js';
+
+/**
+ * Whether precache-manifest.js lists a file (false if the manifest cannot be loaded)
+ */
+function isPrecached(url) {
+    try {
+        importScripts('precache-manifest.js');
+        return PRECACHE_MANIFEST.files.some(entry => entry.url === url);
+    } catch (error) {
+        return false;
+    }
+}
+
+// jsPDF: vendored copy when the manifest lists one, pinned CDN otherwise (same as LIBRARIES in result.html)
+let jspdfLoaded = false;
+if (isPrecached(JSPDF_LOCAL)) {
+    try {
+        importScripts(JSPDF_LOCAL);
+        jspdfLoaded = true;
+    } catch (error) {
+        // Fall back to the CDN below
+    }
+}
+if (!jspdfLoaded) {
+    importScripts(JSPDF_CDN);
+}
+importScripts('category-chart.js', 'report-content.js', 'report-pdf.js');
+
+self.addEventListener('message', event => {
+    const { id, results, categories } = event.data;
+
+    try {
+        const pdf = buildReportPdf(self.jspdf.jsPDF, results, categories);
+        self.postMessage({ id: id, blob: pdf.output('blob') });
+    } catch (error) {
+        self.postMessage({ id: id, error: error.message });
+    }
+});
@@ -0,0 +1,74 @@
+// Generated by tests/build_precache.py - do not edit by hand
+const PRECACHE_MANIFEST = {
+    "version": "21586f5d859a8c6f",
+    "files": [
+        {
+            "url": "index.html",
+            "hash": "5a091faedb4a921f"
+        },
+        {
+            "url": "result.html",
+            "hash": "ff0f2b15fbe8224b"
+        },
+        {
+            "url": "offline.html",
+            "hash": "5519b8b6c34f2187"
+        },
+        {
+            "url": "style.css",
+            "hash": "fe71300d534b813c"
+        },
+        {
+            "url": "bank-index.js",
+            "hash": "5c67493a1e988369"
+        },
+        {
+            "url": "storage.js",
+            "hash": "01ef146b262c4ae7"
+        },
+        {
+            "url": "offline.js",
+            "hash": "4c5394123bbd9e50"
+        },
+        {
+            "url": "user-timing.js",
+            "hash": "9679be8399cdcb53"
+        },
+        {
+            "url": "motion.js",
+            "hash": "fd72933094e0a5e5"
+        },
+        {
+            "url": "script.js",
+            "hash": "3fb7cc7e200949f7"
+        },
+        {
+            "url": "category-chart.js",
+            "hash": "e4b3d22c0ec3191c"
+        },
+        {
+            "url": "report-content.js",
+            "hash": "bce16fdc60098e4c"
+        },
+        {
+            "url": "score-percentiles.js",
+            "hash": "53337eeb18cf1ac8"
+        },
+        {
+            "url": "report-pdf.js",
+            "hash": "c8ece3ab4618a80f"
+        },
+        {
+            "url": "pdf-worker.js",
+            "hash": "654ac82a333bbc9f"
+        },
+        {
+            "url": "bank/chunk-000.js",
+            "hash": "53bae888c7c8e5ef"
+        },
+        {
+            "url": "bank/chunk-001.js",
+            "hash": "729a6dd766aa50ab"
+        }
+    ]
+};
@@ -0,0 +1,112 @@
+/**
+ * Psychological Assessment System - Report Content
+ * Classification, analysis and suggestion texts shared by result.html, the
+ * PDF report (report-pdf.js) and tests/bulk_reports.py; no DOM access, so
+ * it also loads in a worker
+ */
+
+// Heading, description and CSS class per classification
+const PERSONALITY_TYPES = {
+    'Needs Improvement': {
+        title: '🌱 Needs Improvement',
+        description: 'You have significant room for growth in your professional skills. Focus on building foundational competencies.',
+        className: 'needs-improvement'
+    },
+    'Balanced Personality': {
+        title: '⚖️ Balanced Personality',
+        description: 'You demonstrate a well-rounded set of professional skills with good potential for further development.',
+        className: 'balanced'
+    },
+    'Strong Professional Personality': {
+        title: '⭐ Strong Professional Personality',
+        description: 'You exhibit exceptional professional traits and strong leadership qualities. Continue to mentor others.',
+        className: 'strong'
+    }
+};
+
+// Analysis text per category for scores below 50%, below 75% and from 75% of the maximum
+const CATEGORY_ANALYSES = {
+    'Communication': {
+        low: 'Your communication skills need significant development. Focus on active listening, clear expression, and adapting your style to different audiences.',
+        medium: 'You have decent communication abilities. Work on articulating complex ideas more clearly and reading non-verbal cues better.',
+        high: 'Excellent communication skills! You express yourself clearly, listen actively, and adapt your style effectively. Keep refining these strengths.'
+    },
+    'Leadership': {
+        low: 'Leadership is an area requiring substantial growth. Start by taking small initiatives and learning to motivate team members.',
+        medium: 'You show leadership potential. Develop your decision-making under pressure and learn to delegate more effectively.',
+        high: 'Outstanding leadership qualities! You inspire others, make sound decisions, and handle team dynamics excellently.'
+    },
+    'Stress Management': {
+        low: 'Stress management is challenging for you. Develop coping strategies, practice mindfulness, and learn to recognize your stress triggers.',
+        medium: 'You manage stress reasonably well. Focus on maintaining work-life balance and developing proactive stress-relief techniques.',
+        high: 'Exceptional stress resilience! You handle pressure well, maintain focus, and recover quickly from setbacks.'
+    },
+    'Teamwork': {
+        low: 'Teamwork skills need improvement. Practice collaboration, learn to appreciate diverse perspectives, and become more reliable.',
+        medium: 'You collaborate fairly well with others. Enhance your ability to support struggling teammates and handle conflicts constructively.',
+        high: 'Excellent team player! You collaborate seamlessly, support others effectively, and contribute positively to team dynamics.'
+    }
+};
+
+// Suggestions for the lowest-scoring categories
+const IMPROVEMENT_SUGGESTIONS = {
+    'Communication': [
+        'Join a public speaking club like Toastmasters',
+        'Practice active listening by summarizing what others say',
+        'Read books on effective communication',
+        'Seek feedback on your communication style regularly'
+    ],
+    'Leadership': [
+        'Take on leadership roles in small projects',
+        'Study successful leaders and their strategies',
+        'Practice decision-making in low-risk situations',
+        'Attend leadership workshops or seminars'
+    ],
+    'Stress Management': [
+        'Develop a daily meditation or mindfulness practice',
+        'Exercise regularly to build physical and mental resilience',
+        'Learn time management and prioritization techniques',
+        'Maintain a stress journal to identify patterns'
+    ],
+    'Teamwork': [
+        'Volunteer for team-based projects',
+        'Practice giving and receiving constructive feedback',
+        'Learn about different personality types and working styles',
+        'Celebrate team successes and acknowledge contributions'
+    ]
+};
+
+/**
+ * Get analysis text based on category and score
+ */
+function getAnalysisText(category, score, maxScore) {
+    const percentage = (score / maxScore) * 100;
+
+    if (percentage < 50) return CATEGORY_ANALYSES[category].low;
+    if (percentage < 75) return CATEGORY_ANALYSES[category].medium;
+    return CATEGORY_ANALYSES[category].high;
+}
+
+/**
+ * Category scores as a percentage of each category maximum, lowest first
+ * categories: [{ name, maxScore }] (bank-index.js categories)
+ */
+function rankCategoryPercentages(categoryScores, categories) {
+    return categories
+        .map(category => [category.name, (categoryScores[category.name] / category.maxScore) * 100])
+        .sort((a, b) => a[1] - b[1]);
+}
+
+/**
+ * The two categories needing most improvement, with their percentages
+ */
+function getFocusAreas(categoryScores, categories) {
+    return rankCategoryPercentages(categoryScores, categories).slice(0, 2);
+}
+
+/**
+ * The two strongest categories, with their percentages
+ */
+function getTopStrengths(categoryScores, categories) {
+    return rankCategoryPercentages(categoryScores, categories).reverse().slice(0, 2);
+}
@@ -0,0 +1,104 @@
+/**
+ * Psychological Assessment System - PDF Report
+ * Builds the downloadable report from the results data alone, with jsPDF
+ * vector text and shapes (no page screenshots)
+ *
+ * Runs in pdf-worker.js, or on the main thread when workers are
+ * unavailable (e.g. result.html opened from file://). Needs
+ * category-chart.js and report-content.js.
+ */
+
+/**
+ * Build the report and return the jsPDF document
+ * results: calculateResults()/decodeResults() object
+ * categories: [{ name, maxScore }] (bank-index.js categories)
+ */
+function buildReportPdf(jsPDF, results, categories) {
+    const pdf = new jsPDF('p', 'mm', 'a4');
+
+    // PDF dimensions
+    const pageWidth = pdf.internal.pageSize.getWidth();
+    const pageHeight = pdf.internal.pageSize.getHeight();
+    const margin = 15;
+    const textWidth = pageWidth - margin * 2;
+
+    // Header
+    pdf.setFillColor(99, 102, 241);
+    pdf.rect(0, 0, pageWidth, 40, 'F');
+
+    pdf.setTextColor(255, 255, 255);
+    pdf.setFontSize(24);
+    pdf.setFont('helvetica', 'bold');
+    pdf.text('Psychological Assessment Report', pageWidth / 2, 20, { align: 'center' });
+
+    pdf.setFontSize(12);
+    pdf.setFont('helvetica', 'normal');
+    pdf.text(`Date: ${new Date(results.timestamp).toLocaleDateString()}`, pageWidth / 2, 30, { align: 'center' });
+
+    // Final Score Section
+    pdf.setTextColor(0, 0, 0);
+    pdf.setFontSize(16);
+    pdf.setFont('helvetica', 'bold');
+    pdf.text('Overall Score', margin, 55);
+
+    pdf.setFontSize(32);
+    pdf.setTextColor(99, 102, 241);
+    pdf.text(`${results.finalScore}`, margin, 70);
+
+    pdf.setFontSize(14);
+    pdf.setTextColor(0, 0, 0);
+    pdf.setFont('helvetica', 'normal');
+    pdf.text(results.classification, margin, 80);
+
+    // Category Scores, the same chart as the page (category-chart.js)
+    pdf.setFontSize(16);
+    pdf.setFont('helvetica', 'bold');
+    pdf.text('Category Breakdown', margin, 100);
+
+    drawCategoryChartPdf(pdf, results.categoryScores, categories, margin, 105, textWidth, 70);
+    let yPos = 188;
+    pdf.setTextColor(0, 0, 0);
+
+    // Strengths
+    pdf.setFontSize(16);
+    pdf.setFont('helvetica', 'bold');
+    pdf.text('Top Strengths', margin, yPos);
+    yPos += 8;
+
+    pdf.setFontSize(11);
+    pdf.setFont('helvetica', 'normal');
+    getTopStrengths(results.categoryScores, categories).forEach(([category, percentage], index) => {
+        pdf.text(`${index + 1}. ${category}: ${percentage.toFixed(1)}% of the category maximum`, margin + 5, yPos);
+        yPos += 7;
+    });
+
+    // Improvement suggestions
+    yPos += 5;
+    pdf.setFontSize(16);
+    pdf.setFont('helvetica', 'bold');
+    pdf.text('Improvement Suggestions', margin, yPos);
+    yPos += 8;
+
+    getFocusAreas(results.categoryScores, categories).forEach(([category, percentage]) => {
+        pdf.setFontSize(12);
+        pdf.setFont('helvetica', 'bold');
+        pdf.text(`Focus Area: ${category} (${percentage.toFixed(1)}%)`, margin + 5, yPos);
+        yPos += 6;
+
+        pdf.setFontSize(10);
+        pdf.setFont('helvetica', 'normal');
+        IMPROVEMENT_SUGGESTIONS[category].forEach(suggestion => {
+            const lines = pdf.splitTextToSize(`• ${suggestion}`, textWidth - 10);
+            pdf.text(lines, margin + 10, yPos);
+            yPos += lines.length * 5;
+        });
+        yPos += 3;
+    });
+
+    // Footer
+    pdf.setFontSize(8);
+    pdf.setTextColor(107, 114, 128);
+    pdf.text('© 2026 Psychological Assessment System', pageWidth / 2, pageHeight - 10, { align: 'center' });
+
+    return pdf;
+}
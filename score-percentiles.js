@@ -0,0 +1,2 @@
+// Generated by tests/score_distribution.py from data.js - do not edit by hand
+const scorePercentiles = {"version": 1, "contentHash": "f0da802cd7b6747a", "prior": "uniform", "finalScore": {"scale": 10, "min": 869, "max": 2306, "thresholds": [0, 500, 521, 536, 548, 557, 566, 573, 580, 586, 592, 597, 602, 607, 612, 616, 620, 624, 628, 632, 635, 639, 642, 646, 649, 652, 655, 658, 661, 664, 667, 670, 673, 676, 679, 681, 684, 687, 689, 692, 695, 697, 700, 702, 705, 708, 710, 713, 715, 718, 720, 723, 725, 728, 730, 733, 736, 738, 741, 743, 746, 749, 751, 754, 757, 759, 762, 765, 768, 771, 774, 777, 780, 783, 786, 789, 792, 796, 799, 803, 806, 810, 814, 818, 822, 826, 831, 836, 841, 846, 852, 858, 865, 872, 881, 890, 902, 917, 938]}, "categories": {"Communication": {"scale": 1, "min": 13, "max": 52, "thresholds": [0, 11, 12, 13, 13, 14, 14, 14, 14, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 25, 25, 25, 25, 25, 26, 26, 26, 26, 27, 27, 28, 29]}, "Leadership": {"scale": 1, "min": 12, "max": 48, "thresholds": [0, 10, 11, 11, 12, 12, 13, 13, 13, 13, 14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 24, 24, 24, 24, 25, 25, 26, 26, 27]}, "Stress Management": {"scale": 1, "min": 13, "max": 52, "thresholds": [0, 11, 12, 13, 13, 14, 14, 14, 14, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 25, 25, 25, 25, 25, 26, 26, 26, 26, 27, 27, 28, 29]}, "Teamwork": {"scale": 1, "min": 12, "max": 48, "thresholds": [0, 10, 11, 11, 12, 12, 13, 13, 13, 13, 14, 14, 14, 14, 14, 15, 15, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 24, 24, 24, 24, 25, 25, 26, 26, 27]}}};
@@ -10,21 +10,277 @@ let currentQuestionIndex = 0;
 let userAnswers = {}; // Store user answers: { questionId: weight }
 let startTime = null;
 let progressRestored = false;
+let autoAdvanceTimer = null;
+const optionSlots = []; // Reused option elements: { div, radio, label } per position
+const reviewItems = []; // Built review grid items: { item, answer } per question index
+const reviewDirty = new Set(); // Question indexes whose review item needs patching
+let reviewGrid = null;
+let reviewObserver = null;
+
+// Review items built per windowed render step
+const REVIEW_RENDER_CHUNK = 100;
+let pendingProgressLog = []; // Answer deltas not yet written to localStorage
+let progressFlushScheduled = false;
+
+// Deltas kept in quizProgressLog before they are folded into a full snapshot
+const PROGRESS_LOG_LIMIT = 32;
+
+// ?persist=sync writes a full snapshot on every click (pre-deferral behaviour, for measurement)
+const SYNC_PERSISTENCE = new URLSearchParams(window.location.search).get('persist') === 'sync';
+
+// ===========================
+// Question Bank Loading
+// ===========================
+/**
+ * bank-index.js is the manifest compiled by tests/compile_bank.py (category
+ * question lists and maxima, chunk count); the questions arrive in chunk
+ * scripts that call registerQuestionChunk() with their precompiled lookup
+ * tables. The first chunk is requested on load and the rest are prefetched
+ * in the background, so the first question never waits for the whole bank.
+ */
+const bankIndex = {
+    ...questionBankIndex,
+    idToIndex: {},  // question id -> position, merged per chunk
+    optionText: []  // weight -> option text per position, merged per chunk
+};
+
+// Question slots in bank order; a slot stays empty until its chunk arrives
+const questionsData = new Array(bankIndex.questionCount);
+const chunkLoads = []; // Pending/settled load per chunk number
+
+/**
+ * Store the questions of one chunk and merge its compiled lookup tables
+ * (called by the bank/chunk-NNN.js scripts)
+ */
+function registerQuestionChunk(chunkNumber, questions, lookup) {
+    const start = chunkNumber * bankIndex.chunkSize;
+
+    questions.forEach((question, offset) => {
+        questionsData[start + offset] = question;
+        bankIndex.optionText[start + offset] = lookup.optionText[offset];
+    });
+    Object.assign(bankIndex.idToIndex, lookup.idToIndex);
+
+    readiness.chunksLoaded++;
+    readiness.bankLoaded = readiness.chunksLoaded === bankIndex.chunkCount;
+}
+
+/**
+ * Path of a chunk script (mirrors chunk_path() in tests/compile_bank.py)
+ */
+function chunkFile(chunkNumber) {
+    return `${bankIndex.chunkDir}/chunk-${String(chunkNumber).padStart(3, '0')}.js`;
+}
+
+/**
+ * Load one chunk script; repeated calls share the same promise
+ */
+function loadQuestionChunk(chunkNumber) {
+    if (!chunkLoads[chunkNumber]) {
+        chunkLoads[chunkNumber] = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = chunkFile(chunkNumber);
+            script.onload = resolve;
+            script.onerror = () => {
+                // Allow a later call to retry
+                chunkLoads[chunkNumber] = null;
+                reject(new Error(`Could not load ${script.src}`));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return chunkLoads[chunkNumber];
+}
+
+/**
+ * Resolve once the question at an index is available
+ */
+function ensureQuestion(index) {
+    if (questionsData[index]) return Promise.resolve();
+    return loadQuestionChunk(Math.floor(index / bankIndex.chunkSize));
+}
+
+/**
+ * Resolve once every chunk has arrived (resume and the review page need them all)
+ */
+function whenBankLoaded() {
+    const loads = [];
+    for (let chunkNumber = 0; chunkNumber < bankIndex.chunkCount; chunkNumber++) {
+        loads.push(loadQuestionChunk(chunkNumber));
+    }
+    return Promise.all(loads);
+}
+
+/**
+ * Load the remaining chunks one at a time while the browser is idle
+ */
+function prefetchQuestionChunks(chunkNumber = 1) {
+    if (chunkNumber >= bankIndex.chunkCount) return;
+
+    const next = () => loadQuestionChunk(chunkNumber)
+        .then(() => prefetchQuestionChunks(chunkNumber + 1))
+        .catch(error => console.error('Question prefetch failed:', error));
+
+    if (window.requestIdleCallback) {
+        window.requestIdleCallback(next, { timeout: 1000 });
+    } else {
+        setTimeout(next, 50);
+    }
+}
+
+// ===========================
+// Running Score Tallies
+// ===========================
+/**
+ * Per-category totals and answered count, kept in step with userAnswers
+ * so submit and the navigation checks never re-scan the bank.
+ */
+let categoryTotals = createEmptyCategoryTotals();
+let answeredCount = 0;
+
+/**
+ * Create a zeroed category score object
+ */
+function createEmptyCategoryTotals() {
+    const totals = {};
+    bankIndex.categories.forEach(category => {
+        totals[category.name] = 0;
+    });
+    return totals;
+}
+
+/**
+ * Store an answer and apply the change to the running tallies
+ */
+function recordAnswer(questionId, weight) {
+    const questionIndex = bankIndex.idToIndex[questionId];
+    const previous = userAnswers[questionId];
+
+    userAnswers[questionId] = weight;
+    if (questionIndex === undefined) return;
+
+    const question = questionsData[questionIndex];
+    reviewDirty.add(questionIndex);
+
+    if (previous === undefined) {
+        answeredCount++;
+    } else {
+        categoryTotals[question.category] -= previous;
+    }
+    categoryTotals[question.category] += weight;
+}
+
+/**
+ * Replace all answers (fresh start or restore) and rebuild the tallies once
+ */
+function resetAnswers(answers = {}) {
+    userAnswers = {};
+    categoryTotals = createEmptyCategoryTotals();
+    answeredCount = 0;
+
+    // Every review item built so far may now be out of date
+    reviewItems.forEach((_, index) => reviewDirty.add(index));
+
+    Object.entries(answers).forEach(([questionId, weight]) => {
+        recordAnswer(questionId, weight);
+    });
+}
+
+// Category weights of the final score; unlisted categories count at 1
+const CATEGORY_MULTIPLIERS = {
+    'Communication': 1.2,
+    'Leadership': 1.5,
+    'Stress Management': 1.1,
+    'Teamwork': 1.3
+};
+
+/**
+ * Apply the weighted formula to category scores, in bank category order
+ * FinalScore = (Communication * 1.2) + (Leadership * 1.5) + (Stress * 1.1) + (Teamwork * 1.3)
+ */
+function computeWeightedScore(categoryScores) {
+    return bankIndex.categories.reduce((total, category) =>
+        total + categoryScores[category.name] * (CATEGORY_MULTIPLIERS[category.name] ?? 1), 0);
+}
+
+// ===========================
+// Readiness Signals
+// ===========================
+/**
+ * Render/persist state that automation can wait on instead of sleeping.
+ * Counters only ever increase.
+ */
+const readiness = {
+    questionIndex: -1,   // Question currently rendered on the quiz card (-1 = none)
+    autoAdvancedTo: -1,  // Question the auto-advance moved to, until another is shown (-1 = none)
+    renders: 0,          // Completed displayQuestion() calls
+    answers: 0,          // Answers recorded by selectOption()
+    saves: 0,            // Completed writes to localStorage
+    pendingSaves: 0,     // Answers recorded but not yet written
+    reviewOpen: false,   // Review page is on screen
+    chunksLoaded: 0,     // Question bank chunks registered
+    bankLoaded: false,   // Every chunk registered
+    interactiveAt: 0     // performance.now() when start-btn can show question 1 (first chunk in)
+};
 
 // ===========================
 // Progress Management
 // ===========================
 /**
- * Save current progress to localStorage
+ * Save current progress to localStorage (compact format, see storage.js)
  */
 function saveProgress() {
-    const progressData = {
-        currentQuestionIndex,
-        userAnswers,
-        startTime: startTime ? startTime.toISOString() : null,
-        timestamp: new Date().toISOString()
-    };
-    localStorage.setItem('quizProgress', JSON.stringify(progressData));
+    localStorage.setItem('quizProgress', encodeProgress(currentQuestionIndex, userAnswers, startTime, questionsData));
+    localStorage.removeItem('quizProgressLog');
+    pendingProgressLog = [];
+    readiness.pendingSaves = 0;
+    readiness.saves++;
+}
+
+/**
+ * Queue an answer delta and persist it when the browser is idle
+ * Keeps the localStorage write off the click handler.
+ */
+function queueProgressSave(questionIndex, optionIndex) {
+    if (SYNC_PERSISTENCE) {
+        saveProgress();
+        return;
+    }
+
+    pendingProgressLog.push(encodeProgressDelta(questionIndex, optionIndex));
+    readiness.pendingSaves = pendingProgressLog.length;
+
+    if (!progressFlushScheduled) {
+        progressFlushScheduled = true;
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(flushProgress, { timeout: 1000 });
+        } else {
+            setTimeout(flushProgress, 200);
+        }
+    }
+}
+
+/**
+ * Write queued answer deltas to localStorage
+ * Appends to quizProgressLog, or writes a full snapshot when there is no
+ * snapshot yet or the log has grown past PROGRESS_LOG_LIMIT.
+ */
+function flushProgress() {
+    progressFlushScheduled = false;
+    if (pendingProgressLog.length === 0) return;
+
+    const savedLog = localStorage.getItem('quizProgressLog');
+    const logEntries = savedLog ? savedLog.split(',') : [];
+
+    if (!hasSavedProgress() || logEntries.length + pendingProgressLog.length > PROGRESS_LOG_LIMIT) {
+        saveProgress();
+        return;
+    }
+
+    localStorage.setItem('quizProgressLog', logEntries.concat(pendingProgressLog).join(','));
+    pendingProgressLog = [];
+    readiness.pendingSaves = 0;
+    readiness.saves++;
 }
 
 /**
@@ -42,11 +298,19 @@ function restoreProgress() {
     if (!savedData) return false;
 
     try {
-        const progressData = JSON.parse(savedData);
-        currentQuestionIndex = progressData.currentQuestionIndex || 0;
-        userAnswers = progressData.userAnswers || {};
-        startTime = progressData.startTime ? new Date(progressData.startTime) : new Date();
+        const progressData = decodeProgress(savedData, questionsData);
+        if (!progressData) return false;
+        applyProgressLog(progressData, localStorage.getItem('quizProgressLog'), questionsData);
+
+        currentQuestionIndex = progressData.currentQuestionIndex;
+        resetAnswers(progressData.userAnswers);
+        startTime = progressData.startTime || new Date();
         progressRestored = true;
+
+        // Rewrite legacy JSON saves in the compact format
+        if (progressData.legacy) {
+            saveProgress();
+        }
         return true;
     } catch (e) {
         console.error('Error restoring progress:', e);
@@ -58,7 +322,10 @@ function restoreProgress() {
  * Clear saved progress
  */
 function clearProgress() {
+    pendingProgressLog = [];
+    readiness.pendingSaves = 0;
     localStorage.removeItem('quizProgress');
+    localStorage.removeItem('quizProgressLog');
 }
 
 // DOM Elements
@@ -79,6 +346,16 @@ const questionText = document.getElementById('question-text');
 const optionsContainer = document.getElementById('options-container');
 const progressAlert = document.getElementById('progress-alert');
 
+// Review page panel, shown in place of the question elements
+const reviewPanel = document.createElement('div');
+reviewPanel.className = 'review-panel';
+reviewPanel.style.display = 'none';
+questionCard.appendChild(reviewPanel);
+
+// ?timing=on: performance.measure() spans around the hot paths (user-timing.js)
+// Wrapped before the listeners below take references to them
+instrumentFunctions(['displayQuestion', 'displayOptions', 'selectOption', 'saveProgress', 'showReviewPage', 'calculateResults']);
+
 // ===========================
 // Event Listeners
 // ===========================
@@ -90,6 +367,7 @@ if (startFreshBtn) startFreshBtn.addEventListener('click', () => {
 });
 prevBtn.addEventListener('click', showPreviousQuestion);
 nextBtn.addEventListener('click', showNextQuestion);
+optionsContainer.addEventListener('click', handleOptionClick);
 if (reviewBtn) reviewBtn.addEventListener('click', showReviewPage);
 submitBtn.addEventListener('click', submitQuiz);
 
@@ -104,20 +382,33 @@ function startQuiz(resume = false) {
     welcomeScreen.classList.remove('active');
     quizScreen.classList.add('active');
 
-    if (resume && restoreProgress()) {
-        // Progress restored
-        console.log(`Resuming from question ${currentQuestionIndex + 1}`);
-        displayQuestion();
+    if (resume) {
+        // Saved answers can point anywhere in the bank, so wait for every chunk
+        whenBankLoaded().then(() => {
+            if (restoreProgress()) {
+                // Progress restored
+                console.log(`Resuming from question ${currentQuestionIndex + 1}`);
+                displayQuestion();
+            } else {
+                startFreshQuiz();
+            }
+        }).catch(error => console.error('Error loading questions:', error));
     } else {
-        // Start fresh
-        startTime = new Date();
-        currentQuestionIndex = 0;
-        userAnswers = {};
-        clearProgress();
-        displayQuestion();
+        startFreshQuiz();
     }
 }
 
+/**
+ * Reset state and show the first question
+ */
+function startFreshQuiz() {
+    startTime = new Date();
+    currentQuestionIndex = 0;
+    resetAnswers();
+    clearProgress();
+    displayQuestion();
+}
+
 // ===========================
 // Question Display Logic
 // ===========================
@@ -125,22 +416,24 @@ function startQuiz(resume = false) {
  * Display the current question and its options
  */
 function displayQuestion() {
+    cancelAutoAdvance();
     const question = questionsData[currentQuestionIndex];
 
-    // Re-query DOM elements in case they were replaced
-    const currentQuestionText = document.getElementById('question-text');
-    const currentCategoryBadge = document.getElementById('category-badge');
+    if (!question) {
+        // Its chunk is still on the way; render once it arrives
+        questionText.textContent = 'Loading question...';
+        ensureQuestion(currentQuestionIndex).then(() => {
+            if (!readiness.reviewOpen) displayQuestion();
+        }).catch(error => console.error('Error loading questions:', error));
+        return;
+    }
 
     // Update question text
-    if (currentQuestionText) {
-        currentQuestionText.textContent = question.question;
-    }
+    questionText.textContent = question.question;
 
     // Update category badge
-    if (currentCategoryBadge) {
-        currentCategoryBadge.textContent = question.category;
-        updateCategoryBadgeColor(question.category);
-    }
+    categoryBadge.textContent = question.category;
+    updateCategoryBadgeColor(question.category);
 
     // Update progress
     updateProgress();
@@ -150,88 +443,138 @@ function displayQuestion() {
 
     // Update button states
     updateNavigationButtons();
+
+    readiness.questionIndex = currentQuestionIndex;
+    if (readiness.autoAdvancedTo !== currentQuestionIndex) {
+        readiness.autoAdvancedTo = -1;
+    }
+    readiness.reviewOpen = false;
+    readiness.renders++;
 }
 
 /**
- * Display options for the current question
+ * Get the reusable option element for a position, creating it on first use
  */
-function displayOptions(question) {
-    // Re-query the options container
-    const currentOptionsContainer = document.getElementById('options-container');
-
-    if (!currentOptionsContainer) return;
-
-    // Clear existing options
-    currentOptionsContainer.innerHTML = '';
-
-    // Create option elements
-    question.options.forEach((option, index) => {
+function getOptionSlot(index) {
+    if (!optionSlots[index]) {
         const optionDiv = document.createElement('div');
         optionDiv.className = 'option';
-
-        // Check if this option was previously selected
-        const isSelected = userAnswers[question.id] === option.weight;
-        if (isSelected) {
-            optionDiv.classList.add('selected');
-        }
+        optionDiv.dataset.optionIndex = index;
 
         // Create radio input
         const radio = document.createElement('input');
         radio.type = 'radio';
-        radio.name = `question-${question.id}`;
-        radio.value = option.weight;
         radio.className = 'option-radio';
-        radio.id = `option-${question.id}-${index}`;
-        radio.checked = isSelected;
 
         // Create label
         const label = document.createElement('label');
         label.className = 'option-label';
-        label.htmlFor = `option-${question.id}-${index}`;
-        label.textContent = option.text;
-
-        // Add event listener
-        optionDiv.addEventListener('click', () => selectOption(question.id, option.weight, optionDiv));
 
-        // Append elements
         optionDiv.appendChild(radio);
         optionDiv.appendChild(label);
-        currentOptionsContainer.appendChild(optionDiv);
+        optionsContainer.appendChild(optionDiv);
+
+        optionSlots[index] = { div: optionDiv, radio: radio, label: label };
+    }
+    return optionSlots[index];
+}
+
+/**
+ * Display options for the current question
+ * Option elements are built once and only their text, ids, value and
+ * selected state change per question; clicks are handled by one
+ * delegated listener on the options container.
+ */
+function displayOptions(question) {
+    const selectedWeight = userAnswers[question.id];
+
+    question.options.forEach((option, index) => {
+        const slot = getOptionSlot(index);
+        const isSelected = selectedWeight === option.weight;
+        const optionId = `option-${question.id}-${index}`;
+
+        slot.div.style.display = '';
+        slot.div.classList.toggle('selected', isSelected);
+
+        slot.radio.name = `question-${question.id}`;
+        slot.radio.value = option.weight;
+        slot.radio.id = optionId;
+        slot.radio.checked = isSelected;
+
+        slot.label.htmlFor = optionId;
+        slot.label.textContent = option.text;
     });
+
+    // Hide slots left over from questions with more options
+    for (let i = question.options.length; i < optionSlots.length; i++) {
+        optionSlots[i].div.style.display = 'none';
+    }
 }
 
 /**
- * Handle option selection
+ * Delegated click handler for all option slots
  */
-function selectOption(questionId, weight, selectedDiv) {
-    // Store the answer
-    userAnswers[questionId] = weight;
+function handleOptionClick(event) {
+    // A label click is forwarded to its radio, which bubbles here as well
+    if (event.target.tagName === 'LABEL') return;
 
-    // Update UI - remove 'selected' class from all options
-    const currentOptionsContainer = document.getElementById('options-container');
-    if (currentOptionsContainer) {
-        const allOptions = currentOptionsContainer.querySelectorAll('.option');
-        allOptions.forEach(opt => opt.classList.remove('selected'));
+    const optionDiv = event.target.closest('.option');
+    if (!optionDiv) return;
+
+    const question = questionsData[currentQuestionIndex];
+    if (!question) return;
+
+    const option = question.options[Number(optionDiv.dataset.optionIndex)];
+    if (option) {
+        selectOption(question.id, option.weight, optionDiv);
     }
+}
 
-    // Add 'selected' class to clicked option
-    selectedDiv.classList.add('selected');
+/**
+ * Handle option selection
+ */
+function selectOption(questionId, weight, selectedDiv) {
+    // Store the answer
+    recordAnswer(questionId, weight);
 
-    // Check the radio button
-    const radio = selectedDiv.querySelector('input[type="radio"]');
-    radio.checked = true;
+    // Update UI - move 'selected' class and the checked radio to the clicked option
+    optionSlots.forEach(slot => {
+        const isSelected = slot.div === selectedDiv;
+        slot.div.classList.toggle('selected', isSelected);
+        slot.radio.checked = isSelected;
+    });
 
     // Update navigation buttons (enables submit button on last question)
     updateNavigationButtons();
 
-    // Save progress after each answer
-    saveProgress();
+    // Save progress after each answer (written when the browser is idle)
+    const question = questionsData[bankIndex.idToIndex[questionId]];
+    queueProgressSave(currentQuestionIndex, question.options.findIndex(option => option.weight === weight));
+    readiness.answers++;
 
     // Auto-advance after selection (optional - can be removed if not desired)
+    // The pause follows the motion profile (motion.js); ?motion=fast moves on at once
+    cancelAutoAdvance();
+    readiness.autoAdvancedTo = -1;
     if (currentQuestionIndex < questionsData.length - 1) {
-        setTimeout(() => {
+        beginMotion();
+        autoAdvanceTimer = setTimeout(() => {
+            autoAdvanceTimer = null;
             showNextQuestion();
-        }, 500);
+            readiness.autoAdvancedTo = currentQuestionIndex;
+            endMotion();
+        }, motionDelay(500));
+    }
+}
+
+/**
+ * Cancel a pending auto-advance so manual navigation never skips a question
+ */
+function cancelAutoAdvance() {
+    if (autoAdvanceTimer !== null) {
+        clearTimeout(autoAdvanceTimer);
+        autoAdvanceTimer = null;
+        endMotion();
     }
 }
 
@@ -270,7 +613,7 @@ function updateNavigationButtons() {
     const isAnswered = userAnswers.hasOwnProperty(currentQuestion.id);
 
     // Show review button if there are any answers
-    if (Object.keys(userAnswers).length > 0) {
+    if (answeredCount > 0) {
         reviewBtn.style.display = 'inline-block';
     }
 
@@ -289,73 +632,189 @@ function updateNavigationButtons() {
 }
 
 // Review Answers Page
+/**
+ * Show the review page
+ * The grid is built once, in windowed chunks as it scrolls into view;
+ * later opens only patch the items whose answers changed.
+ */
 function showReviewPage() {
+    cancelAutoAdvance();
+
+    // Every question is listed, so wait for the rest of the bank first
+    if (!readiness.bankLoaded) {
+        whenBankLoaded()
+            .then(showReviewPage)
+            .catch(error => console.error('Error loading questions:', error));
+        return;
+    }
+
     // Hide navigation buttons
     document.querySelector('.nav-buttons').style.display = 'none';
 
-    const reviewHTML = `
+    if (!reviewGrid) {
+        buildReviewPanel();
+    }
+
+    // Patch items whose answers changed since the last open
+    reviewDirty.forEach(index => {
+        if (reviewItems[index]) {
+            patchReviewItem(index);
+        }
+    });
+    reviewDirty.clear();
+
+    reviewPanel.querySelector('#submit-from-review-btn').disabled = answeredCount < questionsData.length;
+
+    // Show the review in its own panel so the question elements stay intact
+    questionText.style.display = 'none';
+    optionsContainer.style.display = 'none';
+    reviewPanel.style.display = '';
+
+    readiness.questionIndex = -1;
+    readiness.autoAdvancedTo = -1;
+    readiness.reviewOpen = true;
+}
+
+/**
+ * Build the static review page structure and its single delegated listener
+ */
+function buildReviewPanel() {
+    reviewPanel.innerHTML = `
         <div class="review-container">
             <h2>Review Your Answers</h2>
             <p class="review-info">Review your responses before submitting. Click on any question to edit your answer.</p>
-            <div class="review-grid">
-                ${questionsData.map((q, idx) => {
-        const answer = userAnswers[q.id];
-        const answered = answer !== undefined;
-        return `
-                        <div class="review-item ${answered ? 'answered' : 'unanswered'}" data-question-index="${idx}">
-                            <div class="review-header">
-                                <strong>Question ${idx + 1}</strong>
-                                <span class="category-badge">${q.category}</span>
-                            </div>
-                            <p class="review-question">${q.question}</p>
-                            ${answered ?
-                `<p class="review-answer">✓ ${q.options.find(opt => opt.weight === answer).text}</p>` :
-                `<p class="review-unanswered">Not answered yet</p>`
-            }
-                        </div>
-                    `;
-    }).join('')}
-            </div>
+            <div class="review-grid"></div>
+            <div class="review-sentinel"></div>
             <div class="review-actions">
                 <button id="back-to-quiz-btn" class="btn btn-secondary">Back to Quiz</button>
-                <button id="submit-from-review-btn" class="btn btn-primary" ${Object.keys(userAnswers).length < questionsData.length ? 'disabled' : ''}>
+                <button id="submit-from-review-btn" class="btn btn-primary">
                     Submit Test
                 </button>
             </div>
         </div>
     `;
+    reviewGrid = reviewPanel.querySelector('.review-grid');
 
-    questionCard.innerHTML = reviewHTML;
+    reviewPanel.addEventListener('click', handleReviewClick);
 
-    // Add click handlers for review items
-    document.querySelectorAll('.review-item').forEach(item => {
-        item.addEventListener('click', () => {
-            const questionIndex = parseInt(item.dataset.questionIndex);
-            currentQuestionIndex = questionIndex;
-            restoreQuestionDisplay();
-        });
-    });
+    // Render the first window now and the rest as the sentinel nears the viewport
+    renderReviewChunk();
+    if (reviewItems.length < questionsData.length && window.IntersectionObserver) {
+        reviewObserver = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                renderReviewChunk();
+            }
+        }, { rootMargin: '600px' });
+        reviewObserver.observe(reviewPanel.querySelector('.review-sentinel'));
+    } else {
+        while (reviewItems.length < questionsData.length) {
+            renderReviewChunk();
+        }
+    }
+}
+
+/**
+ * Append the next REVIEW_RENDER_CHUNK review items to the grid
+ */
+function renderReviewChunk() {
+    const end = Math.min(reviewItems.length + REVIEW_RENDER_CHUNK, questionsData.length);
+    const fragment = document.createDocumentFragment();
+
+    for (let index = reviewItems.length; index < end; index++) {
+        fragment.appendChild(createReviewItem(index));
+    }
+    reviewGrid.appendChild(fragment);
+
+    if (reviewItems.length === questionsData.length && reviewObserver) {
+        reviewObserver.disconnect();
+        reviewObserver = null;
+    }
+}
 
-    // Back to quiz button
-    document.getElementById('back-to-quiz-btn').addEventListener('click', () => {
+/**
+ * Create the review item for one question
+ */
+function createReviewItem(index) {
+    const question = questionsData[index];
+
+    const item = document.createElement('div');
+    item.className = 'review-item';
+    item.dataset.questionIndex = index;
+
+    const header = document.createElement('div');
+    header.className = 'review-header';
+    const title = document.createElement('strong');
+    title.textContent = `Question ${index + 1}`;
+    const badge = document.createElement('span');
+    badge.className = 'category-badge';
+    badge.textContent = question.category;
+    header.appendChild(title);
+    header.appendChild(badge);
+
+    const questionLine = document.createElement('p');
+    questionLine.className = 'review-question';
+    questionLine.textContent = question.question;
+
+    const answer = document.createElement('p');
+
+    item.appendChild(header);
+    item.appendChild(questionLine);
+    item.appendChild(answer);
+
+    reviewItems[index] = { item: item, answer: answer };
+    patchReviewItem(index);
+    return item;
+}
+
+/**
+ * Update one review item's answered state and answer text
+ */
+function patchReviewItem(index) {
+    const { item, answer } = reviewItems[index];
+    const weight = userAnswers[questionsData[index].id];
+    const answered = weight !== undefined;
+
+    item.classList.toggle('answered', answered);
+    item.classList.toggle('unanswered', !answered);
+
+    if (answered) {
+        answer.className = 'review-answer';
+        answer.textContent = `✓ ${bankIndex.optionText[index][weight]}`;
+    } else {
+        answer.className = 'review-unanswered';
+        answer.textContent = 'Not answered yet';
+    }
+}
+
+/**
+ * Delegated click handler for the review page
+ */
+function handleReviewClick(event) {
+    if (event.target.closest('#back-to-quiz-btn')) {
         restoreQuestionDisplay();
-    });
+        return;
+    }
 
-    // Submit from review
-    document.getElementById('submit-from-review-btn').addEventListener('click', () => {
+    if (event.target.closest('#submit-from-review-btn')) {
         submitQuiz();
-    });
+        return;
+    }
+
+    const item = event.target.closest('.review-item');
+    if (item) {
+        currentQuestionIndex = parseInt(item.dataset.questionIndex);
+        restoreQuestionDisplay();
+    }
 }
 
 /**
  * Restore normal question display from review page
  */
 function restoreQuestionDisplay() {
-    // Clear review content
-    questionCard.innerHTML = `
-        <h2 id="question-text" class="question-text"></h2>
-        <div id="options-container" class="options-container"></div>
-    `;
+    // Hide review content and bring back the question elements
+    reviewPanel.style.display = 'none';
+    questionText.style.display = '';
+    optionsContainer.style.display = '';
 
     // Show navigation buttons
     document.querySelector('.nav-buttons').style.display = 'flex';
@@ -411,7 +870,7 @@ function updateCategoryBadgeColor(category) {
  */
 function submitQuiz() {
     // Validate all questions are answered
-    if (Object.keys(userAnswers).length !== questionsData.length) {
+    if (answeredCount !== questionsData.length) {
         alert('Please answer all questions before submitting.');
         return;
     }
@@ -420,7 +879,7 @@ function submitQuiz() {
     const results = calculateResults();
 
     // Store results in localStorage
-    localStorage.setItem('assessmentResults', JSON.stringify(results));
+    localStorage.setItem('assessmentResults', encodeResults(results));
 
     // Redirect to results page
     window.location.href = 'result.html';
@@ -431,32 +890,12 @@ function submitQuiz() {
  * Apply weighted formula for final score
  */
 function calculateResults() {
-    // Initialize category scores
-    const categoryScores = {
-        'Communication': 0,
-        'Leadership': 0,
-        'Stress Management': 0,
-        'Teamwork': 0
-    };
-
-    // Calculate total score and category scores
-    let totalScore = 0;
-
-    questionsData.forEach(question => {
-        const answer = userAnswers[question.id];
-        if (answer !== undefined) {
-            totalScore += answer;
-            categoryScores[question.category] += answer;
-        }
-    });
+    // Category scores come from the running tallies kept by recordAnswer()
+    const categoryScores = { ...categoryTotals };
+    const totalScore = Object.values(categoryScores).reduce((sum, score) => sum + score, 0);
 
     // Apply weighted formula
-    // FinalScore = (Communication * 1.2) + (Leadership * 1.5) + (Stress * 1.1) + (Teamwork * 1.3)
-    const finalScore =
-        (categoryScores.Communication * 1.2) +
-        (categoryScores.Leadership * 1.5) +
-        (categoryScores['Stress Management'] * 1.1) +
-        (categoryScores.Teamwork * 1.3);
+    const finalScore = computeWeightedScore(categoryScores);
 
     // Calculate time taken
     const endTime = new Date();
@@ -481,7 +920,60 @@ function calculateResults() {
         timeTaken: timeTaken,
         timestamp: new Date().toISOString(),
         totalQuestions: questionsData.length,
-        answeredQuestions: Object.keys(userAnswers).length
+        answeredQuestions: answeredCount
+    };
+}
+
+// ===========================
+// Test Harness Hooks
+// ===========================
+/**
+ * Answer many questions in one call ("turbo" mode for automation)
+ * plan: option index per question in questionsData order (null or -1 = skip)
+ * Each answer goes through the real displayQuestion/selectOption path,
+ * without waiting for the auto-advance timer.
+ */
+function runAnswerPlan(plan) {
+    if (!readiness.bankLoaded) {
+        throw new Error('Question bank is still loading');
+    }
+
+    if (!quizScreen.classList.contains('active')) {
+        startQuiz(false);
+    } else if (readiness.reviewOpen) {
+        restoreQuestionDisplay();
+    }
+
+    let lastAnswered = currentQuestionIndex;
+
+    plan.forEach((optionIndex, index) => {
+        const question = questionsData[index];
+        if (!question || optionIndex === null || optionIndex < 0 || optionIndex >= question.options.length) {
+            return;
+        }
+
+        currentQuestionIndex = index;
+        displayQuestion();
+
+        selectOption(question.id, question.options[optionIndex].weight, optionSlots[optionIndex].div);
+        cancelAutoAdvance();
+        lastAnswered = index;
+    });
+
+    // Leave the last answered question on screen
+    currentQuestionIndex = lastAnswered;
+    displayQuestion();
+    flushProgress();
+
+    // What a reload would restore: the snapshot plus the answers appended to its log
+    const quizProgress = decodeProgress(localStorage.getItem('quizProgress'), questionsData);
+    if (quizProgress) {
+        applyProgressLog(quizProgress, localStorage.getItem('quizProgressLog'), questionsData);
+    }
+
+    return {
+        userAnswers: userAnswers,
+        quizProgress: quizProgress
     };
 }
 
@@ -508,8 +1000,8 @@ function getCategoryPercentage(score, maxScore) {
 // Keyboard Navigation Support
 // ===========================
 document.addEventListener('keydown', (e) => {
-    // Only handle keyboard events when quiz is active
-    if (!quizScreen.classList.contains('active')) return;
+    // Only handle keyboard events when a question is on screen
+    if (!quizScreen.classList.contains('active') || readiness.reviewOpen) return;
 
     switch (e.key) {
         case 'ArrowLeft':
@@ -528,9 +1020,9 @@ document.addEventListener('keydown', (e) => {
         case '4':
             // Select option by number key
             const optionIndex = parseInt(e.key) - 1;
-            const options = optionsContainer.querySelectorAll('.option');
-            if (options[optionIndex]) {
-                options[optionIndex].click();
+            if (questionsData[currentQuestionIndex] &&
+                optionIndex < questionsData[currentQuestionIndex].options.length) {
+                getOptionSlot(optionIndex).div.click();
             }
             break;
         case 'Enter':
@@ -561,48 +1053,52 @@ window.addEventListener('load', () => {
 
 /**
  * Validate question data structure
+ * Questions are validated by tests/compile_bank.py when the chunks are
+ * built; here only the manifest is checked.
  */
 function validateQuestionData() {
-    if (!questionsData || questionsData.length === 0) {
+    if (!bankIndex.questionCount || bankIndex.chunkCount === 0) {
         console.error('Question data is missing or empty!');
         return;
     }
 
-    // Check if we have exactly 50 questions
-    if (questionsData.length !== 50) {
-        console.warn(`Expected 50 questions, found ${questionsData.length}`);
-    }
-
-    // Validate each question has required properties
-    questionsData.forEach((question, index) => {
-        if (!question.id || !question.category || !question.question || !question.options) {
-            console.error(`Question ${index + 1} is missing required properties`);
-        }
-
-        // Validate options
-        if (question.options.length !== 4) {
-            console.warn(`Question ${question.id} should have 4 options, has ${question.options.length}`);
-        }
-    });
-
-    console.log('✅ Question data validation complete');
+    console.log(`✅ Question bank ${bankIndex.contentHash}: ${bankIndex.chunkCount} chunk(s), validated at build`);
 }
 
 // ===========================
 // Prevent Accidental Page Exit
 // ===========================
 window.addEventListener('beforeunload', (e) => {
+    // Never lose answers still waiting for an idle flush
+    flushProgress();
+
     // Only show warning if quiz is in progress
-    if (quizScreen.classList.contains('active') && Object.keys(userAnswers).length > 0) {
+    if (quizScreen.classList.contains('active') && answeredCount > 0) {
         e.preventDefault();
         e.returnValue = 'You have unsaved progress. Are you sure you want to leave?';
         return e.returnValue;
     }
 });
 
+// Flush queued answers when the tab is hidden (mobile browsers may not fire beforeunload)
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+        flushProgress();
+    }
+});
+window.addEventListener('pagehide', flushProgress);
+
 // ===========================
 // Page Load Initialization
 // ===========================
+// Request the first chunk now and prefetch the rest once it is in
+loadQuestionChunk(0)
+    .then(() => {
+        readiness.interactiveAt = performance.now();
+        return prefetchQuestionChunks();
+    })
+    .catch(error => console.error('Error loading questions:', error));
+
 window.addEventListener('DOMContentLoaded', () => {
     // Check for saved progress on page load
     if (hasSavedProgress()) {
@@ -0,0 +1,160 @@
+/**
+ * Psychological Assessment System - Service Worker
+ * Serves the app shell and question bank from a versioned precache, so
+ * repeat visits make no network requests and the assessment works offline
+ *
+ * - precache-manifest.js (tests/build_precache.py) lists every app file
+ *   with its content hash; the cache is named after the manifest version
+ * - Files cached under the same hash by an earlier version are copied
+ *   instead of downloaded again, and a download is only accepted if it
+ *   matches its hash
+ * - Precached files are served cache-first. A new version installs in the
+ *   background and takes over at a safe point (the results page, see
+ *   offline.js), so a quiz never mixes files from two versions
+ * - precache-manifest.js itself is answered with this version's manifest,
+ *   which the results page reads to see whether vendor/ copies exist
+ * - Other GET requests (CDN libraries) are stale-while-revalidate
+ * - Navigations that fail offline get offline.html
+ */
+
+importScripts('precache-manifest.js');
+
+const PRECACHE_PREFIX = 'psych-precache-';
+const PRECACHE = PRECACHE_PREFIX + PRECACHE_MANIFEST.version;
+const RUNTIME_CACHE = 'psych-runtime';
+const OFFLINE_PAGE = 'offline.html';
+const MANIFEST_SCRIPT = 'precache-manifest.js';
+
+// Manifest entries by absolute URL
+const precacheEntries = new Map(
+    PRECACHE_MANIFEST.files.map(entry => [new URL(entry.url, self.registration.scope).href, entry])
+);
+
+/**
+ * Cache key of a manifest entry; includes the hash, so versions can share unchanged files
+ */
+function precacheKey(entry) {
+    return new URL(`${entry.url}?precache=${entry.hash}`, self.registration.scope).href;
+}
+
+/**
+ * Manifest entry for a request URL (query ignored; the scope root is index.html)
+ */
+function findPrecacheEntry(url) {
+    let path = url.split(/[?#]/)[0];
+    if (path === self.registration.scope) {
+        path += 'index.html';
+    }
+    return precacheEntries.get(path);
+}
+
+/**
+ * First 16 hex digits of the SHA-256 of a response body (same as build_precache.py)
+ */
+async function contentHash(response) {
+    const digest = await crypto.subtle.digest('SHA-256', await response.clone().arrayBuffer());
+    return Array.from(new Uint8Array(digest).slice(0, 8), byte => byte.toString(16).padStart(2, '0')).join('');
+}
+
+/**
+ * Put one manifest file in the new cache, reusing an earlier version's copy if the hash matches
+ */
+async function precacheFile(cache, entry) {
+    const key = precacheKey(entry);
+    let response = await caches.match(key);
+
+    if (!response) {
+        response = await fetch(new Request(entry.url, { cache: 'reload' }));
+        if (!response.ok) {
+            throw new Error(`${entry.url}: HTTP ${response.status}`);
+        }
+        const hash = await contentHash(response);
+        if (hash !== entry.hash) {
+            throw new Error(`${entry.url} does not match precache-manifest.js (${hash}, expected ${entry.hash})`);
+        }
+    }
+
+    await cache.put(key, response);
+}
+
+/**
+ * Serve from the runtime cache at once and refresh it from the network in the background
+ */
+async function staleWhileRevalidate(event) {
+    const cache = await caches.open(RUNTIME_CACHE);
+    const cached = await cache.match(event.request);
+    const network = fetch(event.request).then(response => {
+        // Cross-origin <script> responses are opaque (status 0) but still usable
+        if (response.ok || response.type === 'opaque') {
+            cache.put(event.request, response.clone());
+        }
+        return response;
+    });
+
+    if (cached) {
+        event.waitUntil(network.catch(() => {}));
+        return cached;
+    }
+    return network;
+}
+
+self.addEventListener('install', event => {
+    // All or nothing: a failed download keeps the previous version in charge
+    event.waitUntil(
+        caches.open(PRECACHE).then(cache =>
+            Promise.all(PRECACHE_MANIFEST.files.map(entry => precacheFile(cache, entry)))
+        )
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith(PRECACHE_PREFIX) && name !== PRECACHE)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+// offline.js asks a waiting version to take over once no quiz is in progress
+self.addEventListener('message', event => {
+    if (event.data && event.data.type === 'SKIP_WAITING') {
+        self.skipWaiting();
+    }
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    if (request.url.split(/[?#]/)[0] === new URL(MANIFEST_SCRIPT, self.registration.scope).href) {
+        event.respondWith(new Response(`const PRECACHE_MANIFEST = ${JSON.stringify(PRECACHE_MANIFEST)};\n`, {
+            headers: { 'Content-Type': 'text/javascript' }
+        }));
+        return;
+    }
+
+    const entry = findPrecacheEntry(request.url);
+    if (entry) {
+        event.respondWith(
+            caches.open(PRECACHE)
+                .then(cache => cache.match(precacheKey(entry)))
+                .then(response => response || fetch(request))
+        );
+        return;
+    }
+
+    if (request.mode === 'navigate') {
+        event.respondWith(
+            fetch(request).catch(() =>
+                caches.open(PRECACHE).then(cache => cache.match(precacheKey(findPrecacheEntry(
+                    new URL(OFFLINE_PAGE, self.registration.scope).href
+                ))))
+            )
+        );
+        return;
+    }
+
+    event.respondWith(staleWhileRevalidate(event));
+});
@@ -0,0 +1,218 @@
+/**
+ * Psychological Assessment System - Storage Codec
+ * Compact, versioned encoding for saved progress and results in localStorage
+ *
+ * Progress (quizProgress):
+ *   2|<currentQuestionIndex>|<startTime ms>|<saved ms>|<question count>|<base64 answers>
+ *   The answer payload is an answered bitmap (1 bit per question) followed by
+ *   the selected option index (2 bits per question), in questionsData order.
+ *
+ * Progress log (quizProgressLog):
+ *   <question index>.<option index>,... answer deltas written since the snapshot;
+ *   replayed on top of quizProgress by applyProgressLog()
+ *
+ * Results (assessmentResults):
+ *   2|<finalScore x 100>|<totalScore>|<category scores>|<classification>|<timeTaken>|<timestamp ms>|<total>|<answered>
+ *
+ * Version 1 was plain JSON; decoders still accept it so old saves migrate.
+ */
+
+const STORAGE_FORMAT_VERSION = '2';
+
+// Category order of the packed category scores (bank order, from bank-index.js when loaded)
+const RESULT_CATEGORIES = typeof questionBankIndex !== 'undefined'
+    ? questionBankIndex.categories.map(category => category.name)
+    : ['Communication', 'Leadership', 'Stress Management', 'Teamwork'];
+
+const RESULT_CLASSIFICATIONS = [
+    'Needs Improvement',
+    'Balanced Personality',
+    'Strong Professional Personality'
+];
+
+/**
+ * Check whether a stored value uses the legacy JSON format
+ */
+function isLegacyJson(raw) {
+    return raw.charAt(0) === '{';
+}
+
+/**
+ * Encode bytes as base64
+ */
+function bytesToBase64(bytes) {
+    let binary = '';
+    for (let i = 0; i < bytes.length; i++) {
+        binary += String.fromCharCode(bytes[i]);
+    }
+    return btoa(binary);
+}
+
+/**
+ * Decode base64 into bytes
+ */
+function base64ToBytes(base64) {
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+/**
+ * Encode quiz progress
+ * userAnswers maps question id -> selected weight; weights are stored as
+ * the index of the matching option of each question.
+ */
+function encodeProgress(currentQuestionIndex, userAnswers, startTime, questions) {
+    const count = questions.length;
+    const maskBytes = Math.ceil(count / 8);
+    const bytes = new Uint8Array(maskBytes + Math.ceil(count / 4));
+
+    for (let i = 0; i < count; i++) {
+        const question = questions[i];
+        if (!question) continue; // Chunk not loaded yet, so it has no answer
+
+        const weight = userAnswers[question.id];
+        if (weight === undefined) continue;
+
+        const optionIndex = question.options.findIndex(option => option.weight === weight);
+        if (optionIndex < 0 || optionIndex > 3) continue;
+
+        bytes[i >> 3] |= 1 << (i & 7);
+        bytes[maskBytes + (i >> 2)] |= optionIndex << ((i & 3) * 2);
+    }
+
+    return [
+        STORAGE_FORMAT_VERSION,
+        currentQuestionIndex,
+        startTime ? startTime.getTime() : '',
+        Date.now(),
+        count,
+        bytesToBase64(bytes)
+    ].join('|');
+}
+
+/**
+ * Decode quiz progress into { currentQuestionIndex, userAnswers, startTime, timestamp, legacy }
+ * Returns null when the value cannot be decoded against this question bank.
+ */
+function decodeProgress(raw, questions) {
+    if (!raw) return null;
+
+    if (isLegacyJson(raw)) {
+        const data = JSON.parse(raw);
+        return {
+            currentQuestionIndex: data.currentQuestionIndex || 0,
+            userAnswers: data.userAnswers || {},
+            startTime: data.startTime ? new Date(data.startTime) : null,
+            timestamp: data.timestamp ? new Date(data.timestamp) : null,
+            legacy: true
+        };
+    }
+
+    const fields = raw.split('|');
+    if (fields[0] !== STORAGE_FORMAT_VERSION || Number(fields[4]) !== questions.length) {
+        return null;
+    }
+
+    const count = questions.length;
+    const maskBytes = Math.ceil(count / 8);
+    const bytes = base64ToBytes(fields[5]);
+    const userAnswers = {};
+
+    for (let i = 0; i < count; i++) {
+        if (!(bytes[i >> 3] & (1 << (i & 7)))) continue;
+
+        const optionIndex = (bytes[maskBytes + (i >> 2)] >> ((i & 3) * 2)) & 3;
+        const option = questions[i].options[optionIndex];
+        if (option) {
+            userAnswers[questions[i].id] = option.weight;
+        }
+    }
+
+    return {
+        currentQuestionIndex: Number(fields[1]) || 0,
+        userAnswers: userAnswers,
+        startTime: fields[2] ? new Date(Number(fields[2])) : null,
+        timestamp: new Date(Number(fields[3])),
+        legacy: false
+    };
+}
+
+/**
+ * Encode one answer delta for the progress log
+ */
+function encodeProgressDelta(questionIndex, optionIndex) {
+    return `${questionIndex}.${optionIndex}`;
+}
+
+/**
+ * Replay logged answer deltas on top of decoded progress (modifies it in place)
+ * The current question becomes the one answered last, as a full save would record.
+ */
+function applyProgressLog(progressData, rawLog, questions) {
+    if (!rawLog) return progressData;
+
+    rawLog.split(',').forEach(entry => {
+        const [questionIndex, optionIndex] = entry.split('.').map(Number);
+        const question = questions[questionIndex];
+        const option = question && question.options[optionIndex];
+        if (!option) return;
+
+        progressData.userAnswers[question.id] = option.weight;
+        progressData.currentQuestionIndex = questionIndex;
+    });
+
+    return progressData;
+}
+
+/**
+ * Encode a calculateResults() object
+ */
+function encodeResults(results) {
+    return [
+        STORAGE_FORMAT_VERSION,
+        Math.round(results.finalScore * 100),
+        results.totalScore,
+        RESULT_CATEGORIES.map(category => results.categoryScores[category]).join(','),
+        RESULT_CLASSIFICATIONS.indexOf(results.classification),
+        results.timeTaken,
+        new Date(results.timestamp).getTime(),
+        results.totalQuestions,
+        results.answeredQuestions
+    ].join('|');
+}
+
+/**
+ * Decode stored results back into the calculateResults() object shape
+ * Returns null for missing or unrecognised values.
+ */
+function decodeResults(raw) {
+    if (!raw) return null;
+
+    if (isLegacyJson(raw)) {
+        return JSON.parse(raw);
+    }
+
+    const fields = raw.split('|');
+    if (fields[0] !== STORAGE_FORMAT_VERSION) return null;
+
+    const scores = fields[3].split(',');
+    const categoryScores = {};
+    RESULT_CATEGORIES.forEach((category, index) => {
+        categoryScores[category] = Number(scores[index]);
+    });
+
+    return {
+        totalScore: Number(fields[2]),
+        finalScore: Number(fields[1]) / 100,
+        categoryScores: categoryScores,
+        classification: RESULT_CLASSIFICATIONS[Number(fields[4])],
+        timeTaken: Number(fields[5]),
+        timestamp: new Date(Number(fields[6])).toISOString(),
+        totalQuestions: Number(fields[7]),
+        answeredQuestions: Number(fields[8])
+    };
+}
@@ -0,0 +1,192 @@
+"""
+Batch Scoring Engine for Psychology Assessment System
+Vectorized NumPy port of calculateResults() for scoring answer sheets offline
+
+Usage:
+    python3 batch_scoring.py                   # benchmark at 10k, 1M and 10M rows
+    python3 batch_scoring.py 50000 2000000     # benchmark custom row counts
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from question_bank import CATEGORIES, load_questions
+
+# FinalScore = (Communication * 1.2) + (Leadership * 1.5) + (Stress * 1.1) + (Teamwork * 1.3)
+CATEGORY_MULTIPLIERS = {
+    "Communication": 1.2,
+    "Leadership": 1.5,
+    "Stress Management": 1.1,
+    "Teamwork": 1.3,
+}
+
+# Classification thresholds (finalScore < 80, 80-130 inclusive, > 130)
+NEEDS_IMPROVEMENT_BELOW = 80
+STRONG_ABOVE = 130
+
+CLASSIFICATIONS = (
+    "Needs Improvement",
+    "Balanced Personality",
+    "Strong Professional Personality",
+)
+
+# Rows scored per pass; keeps float32 temporaries around 50 MB
+DEFAULT_CHUNK_SIZE = 262144
+
+
+class BatchScorer:
+    """Scores (N x questions) answer arrays with the same rules as calculateResults()"""
+
+    def __init__(self, questions=None):
+        """Build the question-by-category and question-by-option matrices"""
+        self.questions = questions if questions is not None else load_questions()
+        self.question_ids = [q["id"] for q in self.questions]
+
+        num_questions = len(self.questions)
+        max_options = max(len(q["options"]) for q in self.questions)
+
+        # category_matrix[q, c] = 1 when question q belongs to category c
+        self.category_matrix = np.zeros((num_questions, len(CATEGORIES)), dtype=np.float32)
+        # option_weights[q, o] = weight of option o of question q (0 = no such option)
+        self.option_weights = np.zeros((num_questions, max_options + 1), dtype=np.int8)
+
+        for q_index, question in enumerate(self.questions):
+            if question["category"] not in CATEGORIES:
+                raise ValueError(
+                    f"Question {question['id']} has unknown category '{question['category']}'"
+                )
+            self.category_matrix[q_index, CATEGORIES.index(question["category"])] = 1
+            for o_index, option in enumerate(question["options"]):
+                self.option_weights[q_index, o_index] = option["weight"]
+
+        self.multipliers = [CATEGORY_MULTIPLIERS[c] for c in CATEGORIES]
+
+    @property
+    def num_questions(self):
+        return len(self.questions)
+
+    def weights_from_options(self, option_indexes):
+        """
+        Convert option indexes (0-based, -1 = unanswered) into selected weights
+
+        Unanswered questions map to weight 0, which calculateResults() skips.
+        """
+        option_indexes = np.asarray(option_indexes)
+        self._check_shape(option_indexes)
+
+        # Column -1 of option_weights is the zero padding column
+        lookup = np.where(option_indexes < 0, self.option_weights.shape[1] - 1, option_indexes)
+        rows = np.arange(self.num_questions)
+        return self.option_weights[rows, lookup]
+
+    def score(self, weights, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Score a (N x questions) array of selected weights (0 = unanswered)
+
+        Returns a dict of arrays keyed like the calculateResults() object:
+        totalScore, finalScore, categoryScores (N x 4, CATEGORIES order),
+        classification (index into CLASSIFICATIONS) and answeredQuestions.
+        """
+        weights = np.asarray(weights)
+        self._check_shape(weights)
+        num_rows = weights.shape[0]
+
+        category_scores = np.empty((num_rows, len(CATEGORIES)), dtype=np.int32)
+        final_scores = np.empty(num_rows, dtype=np.float64)
+        answered = np.empty(num_rows, dtype=np.int32)
+
+        for start in range(0, num_rows, chunk_size):
+            chunk = weights[start:start + chunk_size]
+
+            # Sums of small integers are exact in float32, and BLAS is fast
+            sums = chunk.astype(np.float32) @ self.category_matrix
+            category_scores[start:start + chunk_size] = sums
+            answered[start:start + chunk_size] = np.count_nonzero(chunk, axis=1)
+
+            # Accumulate in the same order as the JS formula so rounding matches
+            final = sums[:, 0].astype(np.float64) * self.multipliers[0]
+            for c_index in range(1, len(CATEGORIES)):
+                final += sums[:, c_index].astype(np.float64) * self.multipliers[c_index]
+            final_scores[start:start + chunk_size] = final
+
+        # Classification uses the unrounded score, exactly like calculateResults()
+        classification = np.where(
+            final_scores < NEEDS_IMPROVEMENT_BELOW,
+            0,
+            np.where(final_scores <= STRONG_ABOVE, 1, 2),
+        ).astype(np.int8)
+
+        return {
+            "totalScore": category_scores.sum(axis=1),
+            # Math.round(finalScore * 100) / 100
+            "finalScore": np.floor(final_scores * 100 + 0.5) / 100,
+            "categoryScores": category_scores,
+            "classification": classification,
+            "answeredQuestions": answered,
+        }
+
+    def score_options(self, option_indexes, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Score a (N x questions) array of option indexes (-1 = unanswered)"""
+        return self.score(self.weights_from_options(option_indexes), chunk_size=chunk_size)
+
+    def to_result(self, batch, row):
+        """Build the assessmentResults-shaped dict for one row of a scored batch"""
+        return {
+            "totalScore": int(batch["totalScore"][row]),
+            "finalScore": float(batch["finalScore"][row]),
+            "categoryScores": {
+                category: int(batch["categoryScores"][row, c_index])
+                for c_index, category in enumerate(CATEGORIES)
+            },
+            "classification": CLASSIFICATIONS[batch["classification"][row]],
+            "totalQuestions": self.num_questions,
+            "answeredQuestions": int(batch["answeredQuestions"][row]),
+        }
+
+    def _check_shape(self, array):
+        if array.ndim != 2 or array.shape[1] != self.num_questions:
+            raise ValueError(
+                f"Expected an (N x {self.num_questions}) array, got shape {array.shape}"
+            )
+
+
+def benchmark(row_counts=(10_000, 1_000_000, 10_000_000), seed=42):
+    """Print sheets per second for random option sheets at each row count"""
+    scorer = BatchScorer()
+    rng = np.random.default_rng(seed)
+
+    print("=" * 60)
+    print("⚡ BATCH SCORING BENCHMARK")
+    print("=" * 60)
+    print(f"Questions: {scorer.num_questions}")
+
+    for rows in row_counts:
+        option_indexes = rng.integers(0, 4, size=(rows, scorer.num_questions), dtype=np.int8)
+
+        start = time.perf_counter()
+        batch = scorer.score_options(option_indexes)
+        elapsed = time.perf_counter() - start
+
+        counts = np.bincount(batch["classification"], minlength=len(CLASSIFICATIONS))
+        print(f"\n📊 {rows:,} sheets in {elapsed:.3f}s → {rows / elapsed:,.0f} sheets/s")
+        for name, count in zip(CLASSIFICATIONS, counts):
+            print(f"  - {name}: {count:,}")
+
+        del option_indexes, batch
+
+    print("=" * 60)
+
+
+def main():
+    """Main execution function"""
+    row_counts = [int(arg.replace("_", "")) for arg in sys.argv[1:]]
+    if row_counts:
+        benchmark(row_counts)
+    else:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
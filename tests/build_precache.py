@@ -0,0 +1,124 @@
+"""
+Precache Manifest Builder for Psychology Assessment System
+Lists every file the app needs offline, with its content hash, in
+precache-manifest.js for service-worker.js:
+
+    version    hash over every entry; names the service worker's cache, and
+               any change to it makes browsers install the new version
+    files      [{ url, hash }] - a download is only cached if its content
+               matches the hash, and unchanged files are copied from the
+               previous version's cache instead of downloaded again
+
+Rebuild it after changing any app file, including the generated ones
+(compile_bank.py, score_distribution.py) and vendor/ (vendor_libs.py).
+
+Usage:
+    python3 build_precache.py            # (re)write ../precache-manifest.js
+    python3 build_precache.py --check    # fail if the manifest is missing or stale
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+from compile_bank import read_text
+from question_bank import BASE_DIR
+
+MANIFEST_JS_PATH = os.path.join(BASE_DIR, "precache-manifest.js")
+
+# App shell, in the order index.html and result.html load it
+APP_FILES = (
+    "index.html",
+    "result.html",
+    "offline.html",
+    "style.css",
+    "bank-index.js",
+    "storage.js",
+    "offline.js",
+    "user-timing.js",
+    "motion.js",
+    "script.js",
+    "category-chart.js",
+    "report-content.js",
+    "score-percentiles.js",
+    "report-pdf.js",
+    "pdf-worker.js",
+)
+# Question chunks, plus the local library copies when vendor_libs.py has fetched them
+APP_GLOBS = ("bank/chunk-*.js", "vendor/*.js")
+
+HEADER = "// Generated by tests/build_precache.py - do not edit by hand\n"
+
+
+def file_hash(path):
+    """First 16 hex digits of the file's SHA-256 (computed the same way in service-worker.js)"""
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()[:16]
+
+
+def precache_files(root=BASE_DIR):
+    """Repository-relative URLs of every file to precache"""
+    urls = list(APP_FILES)
+    for pattern in APP_GLOBS:
+        urls += sorted(os.path.relpath(path, root).replace(os.sep, "/")
+                       for path in glob.glob(os.path.join(root, pattern)))
+    return urls
+
+
+def build_manifest(root=BASE_DIR):
+    """Build the manifest dict; every listed file must exist"""
+    missing = [url for url in APP_FILES if not os.path.isfile(os.path.join(root, url))]
+    if missing:
+        raise FileNotFoundError(f"Missing app files: {', '.join(missing)}")
+
+    files = [{"url": url, "hash": file_hash(os.path.join(root, url))} for url in precache_files(root)]
+    listing = "".join(f"{entry['url']} {entry['hash']}\n" for entry in files)
+    return {
+        "version": hashlib.sha256(listing.encode("utf-8")).hexdigest()[:16],
+        "files": files,
+    }
+
+
+def render_manifest(manifest):
+    """Render the manifest as the precache-manifest.js script"""
+    body = json.dumps(manifest, indent=4)
+    return f"{HEADER}const PRECACHE_MANIFEST = {body};\n"
+
+
+def write_manifest(path=MANIFEST_JS_PATH):
+    """Rebuild the manifest, write it to path and return it"""
+    manifest = build_manifest()
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(render_manifest(manifest))
+    return manifest
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=MANIFEST_JS_PATH, help="manifest path")
+    parser.add_argument("--check", action="store_true", help="verify the manifest is up to date")
+    args = parser.parse_args()
+
+    if args.check:
+        manifest = build_manifest()
+        if read_text(args.output) != render_manifest(manifest):
+            print(f"❌ {args.output} is missing or stale - run python3 build_precache.py")
+            return 1
+        print(f"✅ {args.output} is up to date (version {manifest['version']})")
+        return 0
+
+    manifest = write_manifest(args.output)
+
+    total = sum(os.path.getsize(os.path.join(BASE_DIR, entry["url"])) for entry in manifest["files"])
+    print(f"✅ Precache manifest → {args.output}")
+    print(f"  - Version: {manifest['version']}")
+    print(f"  - {len(manifest['files'])} files, {total / 1024:.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
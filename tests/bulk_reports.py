@@ -0,0 +1,603 @@
+"""
+Bulk Report Generator for Psychology Assessment System
+Renders the result.html report for many scored sessions at once, to PDF or
+self-contained HTML, across a pool of worker processes
+
+Each input line is one JSON object, in any of these shapes:
+
+    {"id": "alice", "finalScore": 161.3, "classification": "Strong Professional Personality",
+     "categoryScores": {"Communication": 43, ...}, "totalQuestions": 50,
+     "answeredQuestions": 50, "timestamp": "2026-01-08T15:10:38Z"}
+                                        scored results: the object calculateResults()
+                                        returns (timestamp and the counts optional)
+    {"id": "bob", "answers": {"1": 4, "2": 3, ...}}
+                                        answer sheet: question id → selected weight
+    {"id": "carol", "options": [3, 2, 0, ...]}
+                                        answer plan: option index per question
+
+Like the quiz, which cannot be submitted until every question is answered,
+sheets must answer every question; incomplete sheets and results are
+logged as errors instead of rendered. Answer sheets are scored with
+batch_scoring.BatchScorer. Texts come from
+../report-content.js and the chart from the same layout as
+../category-chart.js, so reports match the results page.
+
+Reports are written one file per session as they finish, named after "id"
+(or the input line number); a later line whose id maps to a file already
+taken in the same run is logged as an error. Rerunning skips sessions whose report already
+exists, so an interrupted run picks up where it stopped; index.jsonl in the
+output directory lists every report written.
+
+Usage:
+    python3 bulk_reports.py sessions.jsonl                         # PDFs into reports/
+    python3 bulk_reports.py sessions.jsonl --format html --output out/
+    python3 bulk_reports.py sessions.jsonl --workers 8 --batch-size 200 --force
+"""
+
+import argparse
+import collections
+import html
+import json
+import multiprocessing
+import os
+import re
+import time
+from datetime import datetime
+
+import numpy as np
+
+from batch_scoring import BatchScorer
+from compile_bank import compile_index
+from pdf_writer import PAGE_HEIGHT, PAGE_WIDTH, POINTS_PER_MM, PdfDocument
+from question_bank import BASE_DIR, load_js_constant, load_questions
+
+REPORT_CONTENT_JS = os.path.join(BASE_DIR, "report-content.js")
+CATEGORY_CHART_JS = os.path.join(BASE_DIR, "category-chart.js")
+
+FORMATS = ("pdf", "html")
+INDEX_FILE = "index.jsonl"
+DEFAULT_BATCH_SIZE = 100
+
+# Chart styling read from category-chart.js, so reports cannot drift from the results page
+CHART_DEFAULT_COLOR = tuple(load_js_constant(CATEGORY_CHART_JS, "CHART_DEFAULT_COLOR"))
+CHART_FILL_OPACITY = load_js_constant(CATEGORY_CHART_JS, "CHART_FILL_OPACITY")
+CHART_TICK_STEP = load_js_constant(CATEGORY_CHART_JS, "CHART_TICK_STEP")
+CHART_GRID_COLOR = tuple(load_js_constant(CATEGORY_CHART_JS, "CHART_GRID_COLOR"))
+CHART_TEXT_COLOR = tuple(load_js_constant(CATEGORY_CHART_JS, "CHART_TEXT_COLOR"))
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+# Loaded once per worker process by _init_worker()
+_worker = None
+
+
+class ReportContent:
+    """Bank categories, report texts and the answer-sheet scorer"""
+
+    def __init__(self):
+        questions = load_questions()
+        self.categories = compile_index(questions)["categories"]
+        self.scorer = BatchScorer(questions)
+        self.question_index = {str(q_id): index for index, q_id in enumerate(self.scorer.question_ids)}
+        # Weights a sheet may select, per question position
+        self.option_weights = [[option["weight"] for option in question["options"]] for question in questions]
+        self.personality_types = load_js_constant(REPORT_CONTENT_JS, "PERSONALITY_TYPES")
+        self.analyses = load_js_constant(REPORT_CONTENT_JS, "CATEGORY_ANALYSES")
+        self.suggestions = load_js_constant(REPORT_CONTENT_JS, "IMPROVEMENT_SUGGESTIONS")
+        self.colors = load_js_constant(CATEGORY_CHART_JS, "CHART_COLORS")
+
+
+def report_filename(record, line_number, fmt):
+    """Output file name for one session"""
+    session_id = _UNSAFE_FILENAME.sub("_", str(record.get("id", ""))).strip("._")
+    return f"{session_id or f'line-{line_number:07d}'}.{fmt}"
+
+
+def score_sheets(content, records):
+    """
+    Score the answer-sheet records among records in one batch
+
+    Returns {position in records: assessmentResults dict}.
+    """
+    rows = [position for position, record in enumerate(records)
+            if "categoryScores" not in record]
+    if not rows:
+        return {}
+
+    question_ids = content.scorer.question_ids
+    weights = np.zeros((len(rows), content.scorer.num_questions), dtype=np.int8)
+    for row, position in enumerate(rows):
+        record = records[position]
+        if "answers" in record:
+            answered = {str(question_id) for question_id in record["answers"]}
+            unanswered = [q_id for q_id in question_ids if str(q_id) not in answered]
+            for question_id, weight in record["answers"].items():
+                if str(question_id) not in content.question_index:
+                    raise ValueError(f"unknown question id {question_id}")
+                index = content.question_index[str(question_id)]
+                if isinstance(weight, bool) or weight not in content.option_weights[index]:
+                    raise ValueError(f"question {question_id} has no option with weight {weight!r}")
+                weights[row, index] = weight
+        elif "options" in record:
+            options = [-1 if option is None else option for option in record["options"]]
+            if len(options) > content.scorer.num_questions:
+                raise ValueError(f"{len(options)} options for {content.scorer.num_questions} questions")
+            for index, option in enumerate(options):
+                if isinstance(option, bool) or not isinstance(option, int) \
+                        or not -1 <= option < len(content.option_weights[index]):
+                    raise ValueError(f"question {question_ids[index]} has no option {option!r}")
+            unanswered = [q_id for index, q_id in enumerate(question_ids)
+                          if index >= len(options) or options[index] == -1]
+            if not unanswered:
+                weights[row] = content.scorer.weights_from_options([options])[0]
+        else:
+            raise ValueError("record has neither categoryScores, answers nor options")
+
+        if unanswered:
+            raise ValueError(f"{len(unanswered)} of {len(question_ids)} questions unanswered "
+                             f"(first: question {unanswered[0]})")
+
+    batch = content.scorer.score(weights)
+    return {position: content.scorer.to_result(batch, row) for row, position in enumerate(rows)}
+
+
+def build_report(content, results):
+    """Everything the results page shows, computed from one results object"""
+    scores = results["categoryScores"]
+    percentages = [(category["name"], scores[category["name"]] / category["maxScore"] * 100)
+                   for category in content.categories]
+    # Stable sort, like rankCategoryPercentages()
+    ranked = sorted(percentages, key=lambda item: item[1])
+
+    analysis = []
+    for category in content.categories:
+        name = category["name"]
+        percentage = scores[name] / category["maxScore"] * 100
+        # getAnalysisText(): below 50%, below 75%, otherwise high
+        level = "low" if percentage < 50 else "medium" if percentage < 75 else "high"
+        analysis.append({
+            "category": name,
+            "score": scores[name],
+            "maxScore": category["maxScore"],
+            "text": content.analyses[name][level],
+        })
+
+    return {
+        "results": results,
+        "type": content.personality_types[results["classification"]],
+        "analysis": analysis,
+        "strengths": list(reversed(ranked))[:2],
+        "focusAreas": [(name, percentage, content.suggestions[name]) for name, percentage in ranked[:2]],
+    }
+
+
+def _report_date(results):
+    """Date line for the header; the session timestamp when the record has one"""
+    timestamp = results.get("timestamp")
+    if not timestamp:
+        return datetime.now().strftime("%Y-%m-%d")
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+
+
+def chart_layout(content, category_scores, width, height):
+    """Port of categoryChartLayout() from category-chart.js"""
+    font_size = height * 0.04
+    plot = {"x": font_size * 3, "y": font_size,
+            "width": width - font_size * 3.5, "height": height - font_size * 4}
+    maximum = max(category["maxScore"] for category in content.categories)
+
+    def value_to_y(value):
+        return plot["y"] + plot["height"] - value / maximum * plot["height"]
+
+    ticks = [(value, value_to_y(value)) for value in range(0, maximum + 1, CHART_TICK_STEP)]
+
+    slot = plot["width"] / len(content.categories)
+    bars = []
+    for index, category in enumerate(content.categories):
+        score = category_scores.get(category["name"], 0)
+        top = value_to_y(min(score, maximum))
+        bars.append({
+            "name": category["name"],
+            "score": score,
+            "color": tuple(content.colors.get(category["name"], CHART_DEFAULT_COLOR)),
+            "x": plot["x"] + slot * index + slot * 0.2,
+            "y": top,
+            "width": slot * 0.6,
+            "height": plot["y"] + plot["height"] - top,
+            "labelX": plot["x"] + slot * index + slot / 2,
+        })
+
+    return {"fontSize": font_size, "plot": plot, "ticks": ticks, "bars": bars,
+            "labelY": plot["y"] + plot["height"] + font_size * 2}
+
+
+def render_chart_svg(content, category_scores, width=600, height=300):
+    """Port of renderCategoryChartSvg()"""
+    layout = chart_layout(content, category_scores, width, height)
+    plot = layout["plot"]
+    text_color = ", ".join(map(str, CHART_TEXT_COLOR))
+    grid_color = ", ".join(map(str, CHART_GRID_COLOR))
+    parts = [
+        f'<svg class="category-chart" viewBox="0 0 {width} {height}" role="img" '
+        f'aria-label="Category scores" xmlns="http://www.w3.org/2000/svg" '
+        f'font-family="sans-serif" font-size="{layout["fontSize"]:g}">'
+    ]
+
+    for value, y in layout["ticks"]:
+        parts.append(
+            f'<line x1="{plot["x"]:.2f}" y1="{y:.2f}" x2="{plot["x"] + plot["width"]:.2f}" y2="{y:.2f}" '
+            f'stroke="rgb({grid_color})" stroke-width="1"/>'
+            f'<text x="{plot["x"] - layout["fontSize"] * 0.5:.2f}" y="{y:.2f}" text-anchor="end" '
+            f'dominant-baseline="middle" fill="rgb({text_color})">{value}</text>'
+        )
+
+    for bar in layout["bars"]:
+        color = ", ".join(map(str, bar["color"]))
+        name = html.escape(bar["name"])
+        parts.append(
+            f'<rect class="category-chart-bar" x="{bar["x"]:.2f}" y="{bar["y"]:.2f}" '
+            f'width="{bar["width"]:.2f}" height="{bar["height"]:.2f}" '
+            f'fill="rgba({color}, {CHART_FILL_OPACITY})" stroke="rgb({color})" stroke-width="2">'
+            f'<title>{name}\nScore: {bar["score"]}</title></rect>'
+            f'<text x="{bar["labelX"]:.2f}" y="{layout["labelY"]:.2f}" text-anchor="middle" '
+            f'fill="rgb({text_color})">{name}</text>'
+        )
+
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def draw_chart_pdf(content, pdf, category_scores, x, y, width, height):
+    """Port of drawCategoryChartPdf()"""
+    layout = chart_layout(content, category_scores, width, height)
+    plot = layout["plot"]
+    pdf.set_font(size=layout["fontSize"] * POINTS_PER_MM, bold=False)
+
+    for value, tick_y in layout["ticks"]:
+        pdf.set_draw_color(*CHART_GRID_COLOR)
+        pdf.line(x + plot["x"], y + tick_y, x + plot["x"] + plot["width"], y + tick_y)
+        pdf.set_text_color(*CHART_TEXT_COLOR)
+        # jsPDF baseline 'middle': drop the baseline by about a third of the font height
+        pdf.text(x + plot["x"] - layout["fontSize"] * 0.5, y + tick_y + layout["fontSize"] * 0.35,
+                 str(value), align="right")
+
+    for bar in layout["bars"]:
+        pdf.set_fill_color(*(round(channel * CHART_FILL_OPACITY + 255 * (1 - CHART_FILL_OPACITY))
+                             for channel in bar["color"]))
+        pdf.set_draw_color(*bar["color"])
+        pdf.rect(x + bar["x"], y + bar["y"], bar["width"], bar["height"], "FD")
+        pdf.set_text_color(*CHART_TEXT_COLOR)
+        pdf.text(x + bar["labelX"], y + layout["labelY"], bar["name"], align="center")
+        pdf.text(x + bar["labelX"], y + bar["y"] - layout["fontSize"] * 0.5, str(bar["score"]), align="center")
+
+
+def render_pdf(content, report):
+    """The report-pdf.js layout, as PDF bytes"""
+    results = report["results"]
+    pdf = PdfDocument()
+    margin = 15
+    text_width = PAGE_WIDTH - margin * 2
+
+    # Header
+    pdf.set_fill_color(99, 102, 241)
+    pdf.rect(0, 0, PAGE_WIDTH, 40, "F")
+    pdf.set_text_color(255, 255, 255)
+    pdf.set_font(24, bold=True)
+    pdf.text(PAGE_WIDTH / 2, 20, "Psychological Assessment Report", align="center")
+    pdf.set_font(12, bold=False)
+    pdf.text(PAGE_WIDTH / 2, 30, f"Date: {_report_date(results)}", align="center")
+
+    # Final Score Section
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_font(16, bold=True)
+    pdf.text(margin, 55, "Overall Score")
+    pdf.set_font(32)
+    pdf.set_text_color(99, 102, 241)
+    pdf.text(margin, 70, f"{results['finalScore']:g}")
+    pdf.set_font(14, bold=False)
+    pdf.set_text_color(0, 0, 0)
+    pdf.text(margin, 80, results["classification"])
+
+    # Category Scores
+    pdf.set_font(16, bold=True)
+    pdf.text(margin, 100, "Category Breakdown")
+    draw_chart_pdf(content, pdf, results["categoryScores"], margin, 105, text_width, 70)
+    y_pos = 188
+    pdf.set_text_color(0, 0, 0)
+
+    # Strengths
+    pdf.set_font(16, bold=True)
+    pdf.text(margin, y_pos, "Top Strengths")
+    y_pos += 8
+    pdf.set_font(11, bold=False)
+    for index, (category, percentage) in enumerate(report["strengths"], start=1):
+        pdf.text(margin + 5, y_pos, f"{index}. {category}: {percentage:.1f}% of the category maximum")
+        y_pos += 7
+
+    # Improvement suggestions
+    y_pos += 5
+    pdf.set_font(16, bold=True)
+    pdf.text(margin, y_pos, "Improvement Suggestions")
+    y_pos += 8
+    for category, percentage, suggestions in report["focusAreas"]:
+        pdf.set_font(12, bold=True)
+        pdf.text(margin + 5, y_pos, f"Focus Area: {category} ({percentage:.1f}%)")
+        y_pos += 6
+        pdf.set_font(10, bold=False)
+        for suggestion in suggestions:
+            for line in pdf.split_text(f"• {suggestion}", text_width - 10):
+                pdf.text(margin + 10, y_pos, line)
+                y_pos += 5
+        y_pos += 3
+
+    # Category analysis, as shown on the results page
+    pdf.add_page()
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_font(16, bold=True)
+    pdf.text(margin, 25, "Detailed Analysis")
+    y_pos = 37
+    for item in report["analysis"]:
+        pdf.set_font(12, bold=True)
+        pdf.text(margin, y_pos, f"{item['category']} (Score: {item['score']}/{item['maxScore']})")
+        y_pos += 6
+        pdf.set_font(10, bold=False)
+        for line in pdf.split_text(item["text"], text_width):
+            pdf.text(margin, y_pos, line)
+            y_pos += 5
+        y_pos += 6
+
+    pdf.set_font(14, bold=True)
+    pdf.text(margin, y_pos + 4, "Personality Type")
+    y_pos += 12
+    pdf.set_font(10, bold=False)
+    for line in pdf.split_text(report["type"]["description"], text_width):
+        pdf.text(margin, y_pos, line)
+        y_pos += 5
+
+    # Footer on every page
+    pdf.set_font(8, bold=False)
+    pdf.set_text_color(107, 114, 128)
+    for page in range(len(pdf.pages)):
+        pdf.set_page(page)
+        pdf.text(PAGE_WIDTH / 2, PAGE_HEIGHT - 10, "© 2026 Psychological Assessment System", align="center")
+
+    return pdf.to_bytes()
+
+
+HTML_STYLE = """
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; color: #1f2937;
+       max-width: 800px; margin: 0 auto; padding: 24px; line-height: 1.5; }
+header { background: #6366f1; color: #fff; text-align: center; padding: 24px; border-radius: 12px; }
+header h1 { margin: 0 0 8px; }
+.final-score { font-size: 48px; font-weight: 700; color: #6366f1; }
+.personality-type { padding: 16px; border-radius: 12px; margin: 16px 0; }
+.personality-type.needs-improvement { background: #fef3c7; }
+.personality-type.balanced { background: #dbeafe; }
+.personality-type.strong { background: #d1fae5; }
+.analysis-item, .suggestion-category { border-left: 4px solid #6366f1; padding: 4px 16px; margin: 12px 0; }
+footer { text-align: center; color: #6b7280; font-size: 12px; margin-top: 32px; }
+"""
+
+
+def render_html(content, report):
+    """The results page content as one self-contained HTML document"""
+    results = report["results"]
+    escape = html.escape
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en"><head><meta charset="UTF-8">',
+        "<title>Psychological Assessment Report</title>",
+        f"<style>{HTML_STYLE}</style></head><body>",
+        "<header><h1>Psychological Assessment Report</h1>",
+        f"<div>Date: {_report_date(results)}</div></header>",
+        "<section><h2>Overall Score</h2>",
+        f'<div class="final-score">{results["finalScore"]:g}</div>',
+        f'<div class="personality-type {escape(report["type"]["className"])}">',
+        f'<h3>{escape(report["type"]["title"])}</h3><p>{escape(report["type"]["description"])}</p></div>',
+        "</section>",
+        "<section><h2>Category Breakdown</h2>",
+        render_chart_svg(content, results["categoryScores"]),
+        "</section>",
+        "<section><h2>Detailed Analysis</h2>",
+    ]
+
+    for item in report["analysis"]:
+        parts.append(
+            f'<div class="analysis-item"><h3>{escape(item["category"])} '
+            f'(Score: {item["score"]}/{item["maxScore"]})</h3><p>{escape(item["text"])}</p></div>'
+        )
+
+    parts.append('</section><section><h2>Improvement Suggestions</h2><div class="suggestions-list">')
+    for category, percentage, suggestions in report["focusAreas"]:
+        items = "".join(f"<li>{escape(suggestion)}</li>" for suggestion in suggestions)
+        parts.append(
+            f'<div class="suggestion-category"><h3>Focus Area: {escape(category)} ({percentage:.1f}%)</h3>'
+            f"<ul>{items}</ul></div>"
+        )
+
+    parts.append("</div></section><footer>&copy; 2026 Psychological Assessment System</footer></body></html>")
+    return "\n".join(parts)
+
+
+def _init_worker():
+    """Load the bank, texts and scorer once per worker process"""
+    global _worker
+    _worker = ReportContent()
+
+
+def _render_batch(job):
+    """Score, render and write one batch of (line number, file name, record) entries"""
+    output_dir, fmt, entries = job
+    records = [record for _, _, record in entries]
+    errors = {}
+
+    try:
+        scored = score_sheets(_worker, records)
+    except Exception:
+        # Score one record at a time so a bad sheet only fails itself
+        scored = {}
+        for position, record in enumerate(records):
+            try:
+                scored[position] = score_sheets(_worker, [record]).get(0, record)
+            except Exception as e:
+                errors[position] = f"{type(e).__name__}: {e}"
+
+    index = []
+    for position, (line_number, filename, record) in enumerate(entries):
+        entry = {"line": line_number, "id": record.get("id"), "file": filename, "error": errors.get(position, "")}
+        if not entry["error"]:
+            try:
+                results = scored.get(position, record)
+                total = results.get("totalQuestions")
+                answered = results.get("answeredQuestions", total)
+                if answered != total:
+                    raise ValueError(f"{total - answered} of {total} questions unanswered")
+                report = build_report(_worker, results)
+                if fmt == "pdf":
+                    data = render_pdf(_worker, report)
+                else:
+                    data = render_html(_worker, report).encode("utf-8")
+
+                # Write under a temporary name so an interrupted run never leaves a partial report
+                path = os.path.join(output_dir, filename)
+                with open(path + ".tmp", "wb") as handle:
+                    handle.write(data)
+                os.replace(path + ".tmp", path)
+
+                entry["finalScore"] = results["finalScore"]
+                entry["classification"] = results["classification"]
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+        index.append(entry)
+
+    return index
+
+
+def read_sessions(path, output_dir, fmt, force, rejected):
+    """
+    Yield (line number, file name, record) for every session still to render
+
+    Lines that are not a JSON object are not yielded; their index entries
+    are appended to rejected instead, so one bad line only fails itself.
+    """
+    # File name → line it was taken by; a duplicate id would overwrite that report
+    taken = {}
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                rejected.append({"line": line_number, "error": f"JSONDecodeError: {e}"})
+                continue
+            if not isinstance(record, dict):
+                rejected.append({"line": line_number,
+                                 "error": f"ValueError: expected an object, got {type(record).__name__}"})
+                continue
+            filename = report_filename(record, line_number, fmt)
+            if filename in taken:
+                rejected.append({"line": line_number, "id": record.get("id"),
+                                 "error": f"ValueError: duplicate id, {filename} is line {taken[filename]}'s report"})
+                continue
+            taken[filename] = line_number
+            if not force and os.path.exists(os.path.join(output_dir, filename)):
+                continue
+            yield line_number, filename, record
+
+
+def _batches(entries, size):
+    """Group an iterable into lists of at most size items"""
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def generate_reports(input_path, output_dir="reports", fmt="pdf", workers=None,
+                     batch_size=DEFAULT_BATCH_SIZE, force=False):
+    """Render a report for every session in input_path; returns the failure count"""
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+
+    print("=" * 60)
+    print("🧠 BULK REPORT GENERATOR")
+    print("=" * 60)
+    print(f"✓ Input: {input_path}")
+    print(f"✓ Output: {output_dir} ({fmt.upper()})")
+    print(f"✓ Workers: {workers}, {batch_size} sessions per batch")
+    print(f"✓ Existing reports: {'re-rendered' if force else 'skipped'}\n")
+
+    done = 0
+    failures = 0
+    start = time.perf_counter()
+    rejected = []
+    jobs = ((output_dir, fmt, batch) for batch in
+            _batches(read_sessions(input_path, output_dir, fmt, force, rejected), batch_size))
+
+    with open(os.path.join(output_dir, INDEX_FILE), "a", encoding="utf-8") as index, \
+            multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        # Keep a couple of batches per worker in flight, so the input is read as it is consumed
+        pending = collections.deque()
+        for job in jobs:
+            pending.append(pool.apply_async(_render_batch, (job,)))
+            while len(pending) >= workers * 2 or (pending and pending[0].ready()):
+                done, failures = _record_batch(index, pending.popleft().get(), done, failures)
+            # Lines read_sessions() could not parse fail on their own
+            done, failures = _record_batch(index, rejected, done, failures)
+            rejected.clear()
+        done, failures = _record_batch(index, rejected, done, failures)
+        while pending:
+            done, failures = _record_batch(index, pending.popleft().get(), done, failures)
+        pool.close()
+        pool.join()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    rate = f" → {done / elapsed:.1f} reports/s" if done else ""
+    print(f"📊 {done} session(s) in {elapsed:.1f}s{rate}")
+    print(f"Failures: {failures}")
+    print("=" * 60)
+
+    return failures
+
+
+def _record_batch(index, entries, done, failures):
+    """Append a finished batch to index.jsonl and report progress"""
+    for entry in entries:
+        index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        if entry["error"]:
+            failures += 1
+            label = f"line {entry['line']}" + (f" ({entry['id']})" if entry.get("id") is not None else "")
+            print(f"  ❌ {label}: {entry['error']}")
+    index.flush()
+
+    previous = done
+    done += len(entries)
+    if done // 1000 != previous // 1000:
+        print(f"  ✓ Rendered {done} sessions")
+    return done, failures
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help="JSONL of results records or answer sheets")
+    parser.add_argument("--output", default="reports", help="output directory")
+    parser.add_argument("--format", choices=FORMATS, default="pdf")
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="sessions per worker task")
+    parser.add_argument("--force", action="store_true", help="re-render reports that already exist")
+    args = parser.parse_args()
+
+    failures = generate_reports(args.input, args.output, args.format, args.workers,
+                                args.batch_size, args.force)
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    exit(main())
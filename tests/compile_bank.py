@@ -0,0 +1,212 @@
+"""
+Question Bank Compiler for Psychology Assessment System
+Validates data.js and writes the files index.html and result.html load
+instead of it:
+
+    bank-index.js        manifest: question count, per-category question
+                         positions and max/min scores, chunk count and a
+                         content hash
+    bank/chunk-NNN.js    the questions themselves, CHUNK_SIZE per file, each
+                         with its id -> position and weight -> text tables
+
+The first question only waits for the manifest and the first chunk;
+script.js prefetches the remaining chunks in the background. The lookup
+tables are compiled here, so the browser never rebuilds them.
+
+Usage:
+    python3 compile_bank.py                    # validate and (re)write the bank files
+    python3 compile_bank.py --chunk-size 100   # fewer, larger chunks
+    python3 compile_bank.py --check            # fail if any bank file is missing or stale
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+from question_bank import BASE_DIR, DATA_JS_PATH, load_questions
+
+INDEX_JS_PATH = os.path.join(BASE_DIR, "bank-index.js")
+CHUNK_DIR = "bank"
+INDEX_FORMAT_VERSION = 3
+CHUNK_SIZE = 25
+
+HEADER = "// Generated by tests/compile_bank.py from data.js - do not edit by hand\n"
+
+
+def validate_questions(questions):
+    """Return a list of problems found in the question bank (empty when valid)"""
+    errors = []
+    seen_ids = set()
+
+    if not questions:
+        return ["Question data is missing or empty"]
+
+    for position, question in enumerate(questions, start=1):
+        # id 0 is a valid id, so only absent or empty values count as missing
+        missing = [
+            key for key in ("id", "category", "question", "options")
+            if key not in question or question[key] in (None, "", [])
+        ]
+        if missing:
+            errors.append(f"Question {position} is missing {', '.join(missing)}")
+            continue
+
+        if question["id"] in seen_ids:
+            errors.append(f"Question {position} reuses id {question['id']}")
+        seen_ids.add(question["id"])
+
+        weights = [option.get("weight") for option in question["options"]]
+        if len(weights) != 4:
+            errors.append(f"Question {question['id']} should have 4 options, has {len(weights)}")
+        if any(not isinstance(weight, int) or isinstance(weight, bool) for weight in weights):
+            errors.append(f"Question {question['id']} has a non-integer option weight")
+        elif len(set(weights)) != len(weights):
+            errors.append(f"Question {question['id']} has duplicate option weights")
+        if any(not option.get("text") for option in question["options"]):
+            errors.append(f"Question {question['id']} has an option without text")
+
+    return errors
+
+
+def content_hash(questions):
+    """Stable hash of the bank content, independent of data.js formatting"""
+    canonical = json.dumps(questions, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def compile_index(questions, chunk_size=CHUNK_SIZE):
+    """Build the bank manifest dict from a validated question list"""
+    categories = {}
+    for position, question in enumerate(questions):
+        weights = [option["weight"] for option in question["options"]]
+        category = categories.setdefault(question["category"], {
+            "name": question["category"],
+            "questionCount": 0,
+            "questionIndexes": [],
+            "maxScore": 0,
+            "minScore": 0,
+        })
+        category["questionCount"] += 1
+        category["questionIndexes"].append(position)
+        category["maxScore"] += max(weights)
+        category["minScore"] += min(weights)
+
+    return {
+        "version": INDEX_FORMAT_VERSION,
+        "contentHash": content_hash(questions),
+        "questionCount": len(questions),
+        # Categories in order of first appearance, which is also the scoring order
+        "categories": list(categories.values()),
+        # Chunk N holds questions [N * chunkSize, (N + 1) * chunkSize) in chunk_path(N)
+        "chunkDir": CHUNK_DIR,
+        "chunkSize": chunk_size,
+        "chunkCount": -(-len(questions) // chunk_size),
+    }
+
+
+def chunk_path(number):
+    """Manifest-relative path of a chunk script (mirrored by chunkFile() in script.js)"""
+    return f"{CHUNK_DIR}/chunk-{number:03d}.js"
+
+
+def compile_chunk_lookup(questions, start):
+    """Lookup tables for one chunk: question id -> bank position, and weight -> option text per question"""
+    return {
+        "idToIndex": {str(question["id"]): start + offset for offset, question in enumerate(questions)},
+        "optionText": [
+            {str(option["weight"]): option["text"] for option in question["options"]}
+            for question in questions
+        ],
+    }
+
+
+def render_index(index):
+    """Render the manifest as the bank-index.js script"""
+    body = json.dumps(index, indent=4, ensure_ascii=False)
+    return f"{HEADER}const questionBankIndex = {body};\n"
+
+
+def render_chunk(number, questions, lookup):
+    """Render one chunk script; it hands its questions and lookup tables to registerQuestionChunk() in script.js"""
+    body = json.dumps(questions, indent=4, ensure_ascii=False)
+    tables = json.dumps(lookup, indent=4, ensure_ascii=False)
+    return f"{HEADER}registerQuestionChunk({number}, {body}, {tables});\n"
+
+
+def render_bank(questions, chunk_size=CHUNK_SIZE):
+    """Render the manifest and every chunk as {relative path: file content}"""
+    index = compile_index(questions, chunk_size)
+    files = {"bank-index.js": render_index(index)}
+    for number in range(index["chunkCount"]):
+        start = number * chunk_size
+        chunk = questions[start:start + chunk_size]
+        files[chunk_path(number)] = render_chunk(number, chunk, compile_chunk_lookup(chunk, start))
+    return index, files
+
+
+def read_text(path):
+    """File content, or None if it does not exist"""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data", default=DATA_JS_PATH, help="question bank (data.js)")
+    parser.add_argument("--output", default=INDEX_JS_PATH, help="manifest path; chunks go next to it in bank/")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="questions per chunk")
+    parser.add_argument("--check", action="store_true", help="verify the bank files are up to date")
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error(f"--chunk-size must be at least 1, got {args.chunk_size}")
+
+    questions = load_questions(args.data)
+    errors = validate_questions(questions)
+    if errors:
+        print(f"❌ {len(errors)} problem(s) in {args.data}:")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+
+    index, files = render_bank(questions, args.chunk_size)
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    files[os.path.basename(args.output)] = files.pop("bank-index.js")
+    chunk_dir = os.path.join(output_dir, CHUNK_DIR)
+
+    if args.check:
+        stale = [path for path, content in files.items()
+                 if read_text(os.path.join(output_dir, path)) != content]
+        if stale:
+            print(f"❌ Stale bank files: {', '.join(stale)} - run python3 compile_bank.py")
+            return 1
+        print(f"✅ {args.output} and {index['chunkCount']} chunk(s) are up to date ({index['contentHash']})")
+        return 0
+
+    # Drop chunks left over from a larger bank or a smaller chunk size
+    os.makedirs(chunk_dir, exist_ok=True)
+    for leftover in glob.glob(os.path.join(chunk_dir, "chunk-*.js")):
+        if os.path.relpath(leftover, output_dir).replace(os.sep, "/") not in files:
+            os.remove(leftover)
+
+    for path, content in files.items():
+        with open(os.path.join(output_dir, path), "w", encoding="utf-8") as handle:
+            handle.write(content)
+
+    print(f"✅ Compiled {index['questionCount']} questions → {args.output} "
+          f"+ {index['chunkCount']} chunk(s) of {args.chunk_size}")
+    print(f"  - Content hash: {index['contentHash']}")
+    for category in index["categories"]:
+        print(f"  - {category['name']}: {category['questionCount']} questions, "
+              f"scores {category['minScore']}-{category['maxScore']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+V8 Heap Snapshots for the Selenium Suites
+Takes heap snapshots of the page a WebDriver is on and compares them: object
+counts per constructor, objects that are new in a later snapshot, and the
+retaining path that keeps one of them alive
+
+Snapshots stream back as HeapProfiler.addHeapSnapshotChunk events, which
+execute_cdp_cmd() cannot receive, so they are taken over a second DevTools
+connection to the page (websocket-client, installed with selenium).
+"""
+
+import json
+import urllib.request
+from collections import Counter, deque
+
+import websocket
+
+# Node types counted per constructor name (strings, code and hidden internals are left out)
+COUNTED_TYPES = {"object", "closure", "native", "array"}
+# Edges that do not keep their target alive
+WEAK_EDGE_TYPES = {"weak"}
+
+
+def page_websocket_url(driver):
+    """DevTools websocket URL of the driver's current page"""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json/list") as response:
+        targets = json.load(response)
+    pages = [target for target in targets if target.get("type") == "page"]
+    current = driver.current_url
+    for target in pages:
+        if target.get("url") == current:
+            return target["webSocketDebuggerUrl"]
+    return pages[0]["webSocketDebuggerUrl"]
+
+
+def take_heap_snapshot(driver, timeout=300):
+    """Collect garbage, then take a heap snapshot of the current page and return a HeapSnapshot"""
+    connection = websocket.create_connection(page_websocket_url(driver), timeout=timeout, suppress_origin=True)
+    try:
+        connection.send(json.dumps({"id": 1, "method": "HeapProfiler.collectGarbage"}))
+        connection.send(json.dumps({"id": 2, "method": "HeapProfiler.takeHeapSnapshot",
+                                    "params": {"reportProgress": False}}))
+        chunks = []
+        while True:
+            message = json.loads(connection.recv())
+            if message.get("method") == "HeapProfiler.addHeapSnapshotChunk":
+                chunks.append(message["params"]["chunk"])
+            elif message.get("id") == 2:
+                if "error" in message:
+                    raise RuntimeError(f"Heap snapshot failed: {message['error']}")
+                break
+    finally:
+        connection.close()
+    return HeapSnapshot(json.loads("".join(chunks)))
+
+
+class HeapSnapshot:
+    """A parsed .heapsnapshot: flat node and edge arrays, as V8 writes them"""
+
+    def __init__(self, data):
+        """Index a parsed snapshot (the JSON object HeapProfiler streams)"""
+        meta = data["snapshot"]["meta"]
+        self.node_fields = meta["node_fields"]
+        self.edge_fields = meta["edge_fields"]
+        self.node_types = meta["node_types"][0]
+        self.edge_types = meta["edge_types"][0]
+        self.nodes = data["nodes"]
+        self.edges = data["edges"]
+        self.strings = data["strings"]
+
+        self.node_size = len(self.node_fields)
+        self.edge_size = len(self.edge_fields)
+        self.node_count = len(self.nodes) // self.node_size
+        self._type = self.node_fields.index("type")
+        self._name = self.node_fields.index("name")
+        self._id = self.node_fields.index("id")
+        self._edge_count = self.node_fields.index("edge_count")
+        self._detachedness = self.node_fields.index("detachedness") if "detachedness" in self.node_fields else None
+        self._edge_type = self.edge_fields.index("type")
+        self._edge_name = self.edge_fields.index("name_or_index")
+        self._edge_to = self.edge_fields.index("to_node")
+
+        # Index of each node's first edge in the edge array
+        self.first_edge = [0] * (self.node_count + 1)
+        for node in range(self.node_count):
+            self.first_edge[node + 1] = (self.first_edge[node]
+                                         + self.nodes[node * self.node_size + self._edge_count] * self.edge_size)
+
+    def node_type(self, node):
+        """V8 node type, e.g. 'object', 'closure', 'native'"""
+        return self.node_types[self.nodes[node * self.node_size + self._type]]
+
+    def node_name(self, node):
+        """Constructor or function name of a node"""
+        return self.strings[self.nodes[node * self.node_size + self._name]]
+
+    def node_id(self, node):
+        """Heap object id of a node"""
+        return self.nodes[node * self.node_size + self._id]
+
+    def is_detached(self, node):
+        """True for DOM nodes no longer in the document (needs a snapshot with detachedness)"""
+        return self._detachedness is not None and self.nodes[node * self.node_size + self._detachedness] == 2
+
+    def node_label(self, node):
+        """Constructor name, as the DevTools Memory panel shows it"""
+        name = self.node_name(node)
+        return f"Detached {name}" if self.is_detached(node) else name
+
+    def edges_of(self, node):
+        """(edge type, edge name, target node) for each outgoing edge"""
+        for offset in range(self.first_edge[node], self.first_edge[node + 1], self.edge_size):
+            edge_type = self.edge_types[self.edges[offset + self._edge_type]]
+            name = self.edges[offset + self._edge_name]
+            if edge_type not in ("element", "hidden"):
+                name = self.strings[name]
+            yield edge_type, name, self.edges[offset + self._edge_to] // self.node_size
+
+    def counted_nodes(self):
+        """Nodes of the counted types"""
+        return [node for node in range(self.node_count) if self.node_type(node) in COUNTED_TYPES]
+
+    def counts(self):
+        """Counter of node label -> number of objects"""
+        return Counter(self.node_label(node) for node in self.counted_nodes())
+
+    def ids(self):
+        """Ids of every node (stable across snapshots of the same page)"""
+        return {self.node_id(node) for node in range(self.node_count)}
+
+    def retainers(self):
+        """
+        Shortest strong path to every node: parent[node] = (parent node, edge type, edge name)
+
+        Like the DevTools Memory panel, paths from the page's global objects
+        (Window) win over paths from internal roots such as the stack.
+        """
+        parent = {0: None}
+        user_roots = [(edge_type, name, target) for edge_type, name, target in self.edges_of(0)
+                      if self.node_type(target) != "synthetic"]
+        for edge_type, name, target in user_roots:
+            parent.setdefault(target, (0, edge_type, name))
+
+        for seeds in ([target for _, _, target in user_roots], [0]):
+            queue = deque(seeds)
+            while queue:
+                node = queue.popleft()
+                for edge_type, name, target in self.edges_of(node):
+                    if edge_type in WEAK_EDGE_TYPES or target in parent:
+                        continue
+                    parent[target] = (node, edge_type, name)
+                    queue.append(target)
+        return parent
+
+    def retaining_path(self, node, parent):
+        """Readable path from a root to node, e.g. 'Window / ... .cache → Array [3] → HTMLDivElement'"""
+        if node not in parent:
+            return "(unreachable)"
+        target = self.node_label(node)
+        steps = []
+        while parent[node] is not None:
+            holder, edge_type, name = parent[node]
+            edge = f"[{name}]" if edge_type in ("element", "hidden") else f".{name}"
+            steps.append((self.node_label(holder), edge))
+            node = holder
+        steps.reverse()
+
+        # Drop the synthetic entries in front, e.g. '(GC roots)'
+        while len(steps) > 1 and (not steps[0][0] or steps[0][0].startswith("(")):
+            steps.pop(0)
+        return " → ".join(f"{holder} {edge}" for holder, edge in steps) + f" → {target}"
+
+
+def growth(before, after, minimum=1):
+    """[(label, before count, after count)] for labels that grew by at least minimum, largest first"""
+    before_counts, after_counts = before.counts(), after.counts()
+    grown = [
+        (label, before_counts.get(label, 0), count)
+        for label, count in after_counts.items()
+        if count - before_counts.get(label, 0) >= minimum
+    ]
+    return sorted(grown, key=lambda item: item[1] - item[2])
+
+
+def new_objects(before, after, label, limit=3):
+    """Up to limit nodes in after with the given label that did not exist in before"""
+    known = before.ids()
+    found = []
+    for node in after.counted_nodes():
+        if after.node_label(node) == label and after.node_id(node) not in known:
+            found.append(node)
+            if len(found) == limit:
+                break
+    return found
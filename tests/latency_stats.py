@@ -0,0 +1,18 @@
+"""
+Latency Statistics for the Measurement Scripts
+Summaries shared by the latency tests, the benchmark and the User Timing
+harvester; no browser needed, so offline tools can import it
+"""
+
+import statistics
+
+
+def summarize(values):
+    """Median, p95 and mean of a list of milliseconds"""
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "median": statistics.median(ordered),
+        "p95": p95,
+        "mean": statistics.fmean(ordered),
+    }
@@ -0,0 +1,226 @@
+"""
+Parallel Runner for PsychologyAssessmentBot
+Spreads (strategy, seed) jobs across a pool of headless Chrome workers
+
+Each worker process launches one headless driver and keeps it for every
+job it receives; between jobs the session is reset by clearing
+localStorage instead of relaunching Chrome. On Ctrl-C the running
+sessions finish and are written, the queued ones are skipped, and the
+workers exit on their own so each quits its driver; they are only
+terminated if they are still busy after SHUTDOWN_TIMEOUT seconds.
+
+Usage:
+    python3 parallel_runner.py --seeds 25 --output runs.jsonl
+    python3 parallel_runner.py --strategies high low --seeds 10 --workers 4 --output runs.csv
+    python3 parallel_runner.py --turbo --seeds 500 --output regression.jsonl
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from multiprocessing.util import Finalize
+
+from selenium.common.exceptions import UnexpectedAlertPresentException
+
+from test_automation import PsychologyAssessmentBot
+
+STRATEGIES = ("random", "balanced", "high", "low")
+
+RESULT_FIELDS = [
+    "strategy", "seed", "worker", "elapsed", "error",
+    "final_score", "personality", "communication",
+    "leadership", "stress_management", "teamwork",
+]
+
+# Seconds to wait for the workers to exit after the last job before terminating them
+SHUTDOWN_TIMEOUT = 60
+# Error of a job that was still queued when the run was interrupted
+SKIPPED = "skipped"
+
+# One bot per worker process, created by _init_worker()
+_worker_bot = None
+# Set by the parent to skip the jobs still queued
+_stop = None
+
+
+def _init_worker(stop):
+    """Launch this worker's headless driver and quit it when the worker exits"""
+    global _worker_bot, _stop
+    # Ctrl-C is handled by the parent, so a running session is not cut short
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _stop = stop
+    # The bot serves the app from its own process's app server (static_server.py)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_bot = PsychologyAssessmentBot(headless=True)
+    Finalize(_worker_bot, _worker_bot.driver.quit, exitpriority=16)
+
+
+def _run_job(job):
+    """Run one (strategy, seed) session on this worker's driver"""
+    strategy, seed, turbo = job
+    record = {"strategy": strategy, "seed": seed, "worker": os.getpid(), "error": ""}
+    if _stop.is_set():
+        record["error"] = SKIPPED
+        return record
+
+    log = io.StringIO()
+    start = time.perf_counter()
+
+    try:
+        with contextlib.redirect_stdout(log):
+            try:
+                _worker_bot.reset_session()
+            except UnexpectedAlertPresentException:
+                # A failed job can leave a beforeunload prompt behind
+                _worker_bot.driver.switch_to.alert.accept()
+                _worker_bot.reset_session()
+
+            _worker_bot.start_assessment()
+            if turbo:
+                _worker_bot.answer_questions_turbo(strategy=strategy, seed=seed)
+            else:
+                _worker_bot.answer_questions(strategy=strategy, seed=seed)
+            _worker_bot.submit_assessment()
+            record.update(_worker_bot.capture_results())
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+
+    record["elapsed"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+class ResultWriter:
+    """Streams result records to a .jsonl or .csv file as they arrive"""
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, "w", newline="", encoding="utf-8")
+        self.csv_writer = None
+        if path.endswith(".csv"):
+            self.csv_writer = csv.DictWriter(self.handle, fieldnames=RESULT_FIELDS)
+            self.csv_writer.writeheader()
+
+    def write(self, record):
+        if self.csv_writer:
+            self.csv_writer.writerow({field: record.get(field, "") for field in RESULT_FIELDS})
+        else:
+            self.handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.handle.flush()
+
+    def close(self):
+        self.handle.close()
+
+
+def _shutdown_pool(pool, timeout=SHUTDOWN_TIMEOUT):
+    """Let the workers exit normally, which runs their driver.quit finalizers; terminate them after timeout"""
+    pool.close()
+    joiner = threading.Thread(target=pool.join, daemon=True)
+    joiner.start()
+    joiner.join(timeout)
+    if joiner.is_alive():
+        print(f"⚠️  Workers still busy after {timeout}s, terminating them (their browsers may be left running)")
+        pool.terminate()
+        joiner.join()
+
+
+def _drain(results, deadline):
+    """Yield the results still to come, until the iterator ends or the deadline (time.monotonic()) passes"""
+    while True:
+        try:
+            yield results.next(timeout=max(0, deadline - time.monotonic()))
+        except StopIteration:
+            return
+        except multiprocessing.TimeoutError:
+            return
+
+
+def run_parallel(strategies=STRATEGIES, seeds=range(10), workers=None,
+                 output="parallel_results.jsonl", turbo=False):
+    """Run every (strategy, seed) combination across a pool of driver workers; returns failed + skipped sessions"""
+    workers = workers or os.cpu_count() or 1
+    jobs = list(itertools.product(strategies, seeds, [turbo]))
+
+    print("=" * 60)
+    print("🧠 PARALLEL ASSESSMENT RUNNER")
+    print("=" * 60)
+    print(f"✓ Jobs: {len(jobs)} ({len(strategies)} strategies × {len(seeds)} seeds)")
+    print(f"✓ Workers: {workers}")
+    print(f"✓ Answer mode: {'turbo (one call per session)' if turbo else 'UI clicks'}")
+    print(f"✓ Output: {output}\n")
+
+    writer = ResultWriter(output)
+    failures = 0
+    done = 0
+    start = time.perf_counter()
+
+    stop = multiprocessing.Event()
+    pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(stop,))
+    results = pool.imap_unordered(_run_job, jobs)
+    deadline = None
+    try:
+        try:
+            for record in results:
+                done, failures = _record_result(writer, record, done, failures, len(jobs))
+        except KeyboardInterrupt:
+            print(f"\n⚠️  Interrupted after {done}/{len(jobs)} sessions; waiting for the running ones")
+            # Queued jobs now return at once; the running sessions still count
+            stop.set()
+            deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            for record in _drain(results, deadline):
+                if record["error"] != SKIPPED:
+                    done, failures = _record_result(writer, record, done, failures, len(jobs))
+    finally:
+        stop.set()
+        _shutdown_pool(pool, SHUTDOWN_TIMEOUT if deadline is None else max(0, deadline - time.monotonic()))
+        writer.close()
+
+    skipped = len(jobs) - done
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print(f"📊 {done} sessions in {elapsed:.1f}s → {done / elapsed * 60:.1f} sessions/min")
+    print(f"Failures: {failures}")
+    if skipped:
+        print(f"Skipped: {skipped}")
+    print("=" * 60)
+
+    return failures + skipped
+
+
+def _record_result(writer, record, done, failures, total):
+    """Write one finished session and report progress"""
+    writer.write(record)
+    done += 1
+    if record["error"]:
+        failures += 1
+        print(f"  ❌ {record['strategy']}/{record['seed']}: {record['error']}")
+    if done % 10 == 0 or done == total:
+        print(f"  ✓ Completed {done}/{total} sessions")
+    return done, failures
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--seeds", type=int, default=10, help="number of seeds per strategy")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--output", default="parallel_results.jsonl", help=".jsonl or .csv")
+    parser.add_argument("--turbo", action="store_true", help="answer each session in one call")
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    failures = run_parallel(args.strategies, seeds, args.workers, args.output, args.turbo)
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    exit(main())
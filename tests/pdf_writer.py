@@ -0,0 +1,197 @@
+"""
+Minimal PDF Writer for Psychology Assessment System
+Vector text, rectangles and lines on A4 pages with the built-in Helvetica
+fonts - enough for the offline reports, with no third-party dependency
+
+Coordinates are in millimetres from the top-left corner, like the jsPDF
+calls in report-pdf.js.
+"""
+
+import zlib
+
+PAGE_WIDTH = 210
+PAGE_HEIGHT = 297
+POINTS_PER_MM = 72 / 25.4
+
+FONTS = {False: ("F1", "Helvetica"), True: ("F2", "Helvetica-Bold")}
+
+# Standard Helvetica advance widths (1/1000 em) for ASCII 32-126
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+_DEFAULT_WIDTH = 556
+
+
+def _encode(text):
+    """Text as WinAnsi bytes; characters the base fonts cannot show (emoji) are dropped"""
+    return text.encode("cp1252", errors="ignore").strip()
+
+
+def _escape(data):
+    """Escape a byte string for a PDF string literal"""
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _number(value):
+    """Compact PDF number"""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+class PdfDocument:
+    """A4 document built from jsPDF-style drawing calls"""
+
+    def __init__(self):
+        self.pages = []
+        self.page = 0
+        self.font_size = 12
+        self.bold = False
+        self.fill_color = (0, 0, 0)
+        self.text_color = (0, 0, 0)
+        self.draw_color = (0, 0, 0)
+        self.add_page()
+
+    def add_page(self):
+        """Start a new page; later drawing calls go to it"""
+        self.pages.append([])
+        self.page = len(self.pages) - 1
+
+    def set_page(self, page):
+        """Draw on an existing page (0-based)"""
+        self.page = page
+
+    def _emit(self, operator):
+        self.pages[self.page].append(operator)
+
+    @staticmethod
+    def _color(rgb):
+        return " ".join(_number(channel / 255) for channel in rgb)
+
+    def set_font(self, size=None, bold=None):
+        if size is not None:
+            self.font_size = size
+        if bold is not None:
+            self.bold = bold
+
+    def set_fill_color(self, r, g, b):
+        self.fill_color = (r, g, b)
+
+    def set_text_color(self, r, g, b):
+        self.text_color = (r, g, b)
+
+    def set_draw_color(self, r, g, b):
+        self.draw_color = (r, g, b)
+
+    def text_width(self, text):
+        """Width of text in mm at the current font"""
+        widths = _HELVETICA_BOLD_WIDTHS if self.bold else _HELVETICA_WIDTHS
+        units = 0
+        for code in _encode(text):
+            units += widths[code - 32] if 32 <= code <= 126 else _DEFAULT_WIDTH
+        return units / 1000 * self.font_size / POINTS_PER_MM
+
+    def split_text(self, text, width):
+        """Word-wrap text to lines no wider than width mm"""
+        lines = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}" if current else word
+            if current and self.text_width(candidate) > width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        if current:
+            lines.append(current)
+        return lines
+
+    def text(self, x, y, text, align="left"):
+        """Draw one line of text with its baseline at y"""
+        if align == "center":
+            x -= self.text_width(text) / 2
+        elif align == "right":
+            x -= self.text_width(text)
+
+        font, _ = FONTS[self.bold]
+        self._emit(
+            f"BT /{font} {_number(self.font_size)} Tf {self._color(self.text_color)} rg "
+            f"{_number(x * POINTS_PER_MM)} {_number((PAGE_HEIGHT - y) * POINTS_PER_MM)} Td ("
+            .encode("ascii") + _escape(_encode(text)) + b") Tj ET"
+        )
+
+    def rect(self, x, y, width, height, style="F"):
+        """Draw a rectangle: style F (fill), S (stroke) or FD (both)"""
+        operator = {"F": "f", "S": "S", "FD": "B"}[style]
+        self._emit(
+            f"{self._color(self.fill_color)} rg {self._color(self.draw_color)} RG "
+            f"{_number(x * POINTS_PER_MM)} {_number((PAGE_HEIGHT - y - height) * POINTS_PER_MM)} "
+            f"{_number(width * POINTS_PER_MM)} {_number(height * POINTS_PER_MM)} re {operator}"
+            .encode("ascii")
+        )
+
+    def line(self, x1, y1, x2, y2, width=0.2):
+        """Draw a straight line"""
+        self._emit(
+            f"{self._color(self.draw_color)} RG {_number(width * POINTS_PER_MM)} w "
+            f"{_number(x1 * POINTS_PER_MM)} {_number((PAGE_HEIGHT - y1) * POINTS_PER_MM)} m "
+            f"{_number(x2 * POINTS_PER_MM)} {_number((PAGE_HEIGHT - y2) * POINTS_PER_MM)} l S"
+            .encode("ascii")
+        )
+
+    def to_bytes(self):
+        """Serialize the document"""
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            None,  # Pages tree, filled in once the page object numbers are known
+        ]
+        font_refs = []
+        for font, base_font in FONTS.values():
+            objects.append(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} /Encoding /WinAnsiEncoding >>"
+                .encode("ascii")
+            )
+            font_refs.append(f"/{font} {len(objects)} 0 R")
+
+        page_refs = []
+        width_pt = _number(PAGE_WIDTH * POINTS_PER_MM)
+        height_pt = _number(PAGE_HEIGHT * POINTS_PER_MM)
+        for operators in self.pages:
+            content = zlib.compress(b"\n".join(operators))
+            objects.append(
+                f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode("ascii")
+                + content + b"\nendstream"
+            )
+            content_ref = len(objects)
+            objects.append(
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt} {height_pt}] "
+                f"/Resources << /Font << {' '.join(font_refs)} >> >> /Contents {content_ref} 0 R >>"
+                .encode("ascii")
+            )
+            page_refs.append(f"{len(objects)} 0 R")
+
+        objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(page_refs)} >>".encode("ascii")
+
+        out = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+        xref = len(out)
+        out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+        for offset in offsets:
+            out += f"{offset:010d} 00000 n \n".encode("ascii")
+        out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii")
+        return bytes(out)
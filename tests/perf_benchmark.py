@@ -0,0 +1,279 @@
+"""
+Page Performance Benchmark for Psychology Assessment System
+Drives complete quiz sessions headlessly and times each step, then compares
+the medians and p95s with a stored baseline:
+
+    navigation load     navigationStart → loadEventEnd of index.html (cold cache)
+    start interactive   navigationStart → start-btn can show question 1
+    answer to render    option click → next question painted (every question)
+    review open         review-btn click → review page painted
+    submit to results   submit click → first score on result.html
+    results render      result.html navigationStart → first score
+
+A metric regresses when its median or p95 is more than --threshold slower
+than the baseline and by at least --min-delta ms, so sub-millisecond noise
+on fast metrics does not fail the run.
+
+--timing loads the pages with ?timing=on and prints a latency histogram of
+the performance.measure() spans user-timing.js records per app function.
+The spans add a little overhead, so compare such runs only with a baseline
+saved with --timing as well.
+
+Usage:
+    python3 perf_benchmark.py --save-baseline     # measure and store perf_baseline.json
+    python3 perf_benchmark.py                     # measure and compare; exit 1 on a regression
+    python3 perf_benchmark.py --iterations 10 --threshold 0.1
+    python3 perf_benchmark.py --timing            # also print per-function User Timing histograms
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from latency_stats import summarize
+from readiness import measure_page_load, select_option, wait_for_bank, wait_for_js, wait_for_question, wait_for_results
+from static_server import start_app_server
+from test_persistence_latency import MEASURE_CLICK_JS
+from user_timing import collect_user_timings, latency_histograms, print_histograms, with_timing
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+
+# The service worker would serve repeat loads from its cache; measure the app itself,
+# without the auto-advance pause and results animations (motion.js)
+DEFAULT_QUERY = "?sw=off&motion=fast"
+
+METRICS = (
+    "navigation load",
+    "start interactive",
+    "answer to render",
+    "review open",
+    "submit to results",
+    "results render",
+)
+
+# Clicks review-btn and reports once the review page is on screen and painted
+MEASURE_REVIEW_JS = """
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+document.getElementById('review-btn').click();
+(function check() {
+    if (!readiness.reviewOpen) {
+        setTimeout(check, 0);
+        return;
+    }
+    requestAnimationFrame(function () {
+        setTimeout(function () { done(performance.now() - start); }, 0);
+    });
+})();
+"""
+
+# Wall-clock submit time survives the navigation to result.html in sessionStorage
+SUBMIT_JS = """
+sessionStorage.setItem('benchmarkSubmitAt', String(performance.timeOrigin + performance.now()));
+document.getElementById('submit-from-review-btn').click();
+"""
+
+RESULTS_TIMING_JS = """
+return {
+    firstScoreAt: readiness.firstScoreAt,
+    submitToResults: performance.timeOrigin + readiness.firstScoreAt
+        - Number(sessionStorage.getItem('benchmarkSubmitAt'))
+};
+"""
+
+
+class PerfBenchmark:
+    """Times every step of a quiz session over several iterations"""
+
+    def __init__(self, headless=False, iterations=5, query=DEFAULT_QUERY):
+        """Initialize WebDriver"""
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.iterations = iterations
+        self.query = query
+        self.timings = []  # User Timing spans, when the query has timing=on
+        self.server = start_app_server()
+        self.index_url = self.server.url("index.html") + query
+
+        print("=" * 60)
+        print("⏱️  PAGE PERFORMANCE BENCHMARK")
+        print("=" * 60)
+        print(f"✓ App server: {self.server.base_url} (query '{query}')")
+
+    def run_session(self, samples):
+        """Run one full session and append each step's timings (ms) to samples"""
+        # Start from the welcome page with no saved progress
+        self.driver.get(self.index_url)
+        self.driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+
+        timing = measure_page_load(self.driver, self.index_url, cold=True)
+        samples["navigation load"].append(timing["load"])
+        samples["start interactive"].append(
+            wait_for_js(self.driver, "typeof readiness !== 'undefined' && readiness.interactiveAt")
+        )
+
+        self.driver.execute_script("document.getElementById('start-btn').click();")
+        wait_for_question(self.driver, 0)
+        # Keep chunk loading out of the per-answer timings
+        wait_for_bank(self.driver)
+
+        question_count = self.driver.execute_script("return questionsData.length;")
+        for index in range(question_count - 1):
+            sample = self.driver.execute_async_script(MEASURE_CLICK_JS, index % 4)
+            if sample["index"] != index + 1:
+                raise Exception(f"Expected question {index + 1}, page is on {sample['index']}")
+            samples["answer to render"].append(sample["toNext"])
+        select_option(self.driver, 0)
+
+        samples["review open"].append(self.driver.execute_async_script(MEASURE_REVIEW_JS))
+
+        self.driver.execute_script(SUBMIT_JS)
+        wait_for_results(self.driver, timeout=30)
+        results = self.driver.execute_script(RESULTS_TIMING_JS)
+        samples["submit to results"].append(results["submitToResults"])
+        samples["results render"].append(results["firstScoreAt"])
+        self.timings += collect_user_timings(self.driver)
+
+    def run(self):
+        """Run every iteration and return {metric: {median, p95, mean, samples}}"""
+        samples = {metric: [] for metric in METRICS}
+        for iteration in range(self.iterations):
+            self.run_session(samples)
+            print(f"✓ Session {iteration + 1}/{self.iterations}")
+
+        report = {}
+        for metric in METRICS:
+            report[metric] = summarize(samples[metric])
+            report[metric]["samples"] = len(samples[metric])
+        return report
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def load_baseline(path):
+    """Read a stored baseline, or None if there is none yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_baseline(path, report, iterations, query):
+    """Store the medians and p95s of a run as the new baseline"""
+    baseline = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "iterations": iterations,
+        "query": query,
+        "metrics": {
+            metric: {"median": round(stats["median"], 2), "p95": round(stats["p95"], 2)}
+            for metric, stats in report.items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(baseline, handle, indent=2)
+        handle.write("\n")
+    return baseline
+
+
+def compare(report, baseline, threshold, min_delta):
+    """List of (metric, stat, baseline ms, current ms) that regressed beyond the limits"""
+    regressions = []
+    for metric, stats in report.items():
+        stored = baseline["metrics"].get(metric)
+        if not stored:
+            continue
+        for stat in ("median", "p95"):
+            before, after = stored[stat], stats[stat]
+            if after - before >= min_delta and after > before * (1 + threshold):
+                regressions.append((metric, stat, before, after))
+    return regressions
+
+
+def print_report(report, baseline=None):
+    """Print each metric, with the change from the baseline when there is one"""
+    print("\n📊 Results\n")
+    for metric, stats in report.items():
+        line = (f"  - {metric:<18} median {stats['median']:8.2f} ms | p95 {stats['p95']:8.2f} ms"
+                f" | {stats['samples']} samples")
+        stored = baseline["metrics"].get(metric) if baseline else None
+        if stored and stored["median"] > 0:
+            change = (stats["median"] - stored["median"]) / stored["median"]
+            line += f" | median {change:+.0%} vs baseline"
+        print(line)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5, help="quiz sessions to time (default: 5)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown as a fraction of the baseline (default: 0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=5.0,
+                        help="ignore slowdowns smaller than this many ms (default: 5)")
+    parser.add_argument("--query", default=DEFAULT_QUERY,
+                        help=f"URL switches for index.html, e.g. '?persist=sync' (default: '{DEFAULT_QUERY}')")
+    parser.add_argument("--timing", action="store_true",
+                        help="record User Timing spans (?timing=on) and print per-function histograms")
+    args = parser.parse_args()
+    if args.timing:
+        args.query = with_timing(args.query)
+
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline and baseline["query"] != args.query:
+        print(f"⚠️  Baseline was measured with query '{baseline['query']}', this run uses '{args.query}'")
+
+    bot = PerfBenchmark(headless=True, iterations=args.iterations, query=args.query)
+    try:
+        report = bot.run()
+    except Exception as e:
+        print(f"\n❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+    print_report(report, baseline)
+    if bot.timings:
+        print_histograms(latency_histograms(bot.timings))
+
+    if args.save_baseline:
+        save_baseline(args.baseline, report, args.iterations, args.query)
+        print(f"\n✅ Baseline saved → {args.baseline}")
+        print("=" * 60)
+        return 0
+
+    if not baseline:
+        print(f"\n⚠️  No baseline at {args.baseline} - run with --save-baseline first")
+        print("=" * 60)
+        return 0
+
+    regressions = compare(report, baseline, args.threshold, args.min_delta)
+    print("-" * 60)
+    if regressions:
+        for metric, stat, before, after in regressions:
+            print(f"❌ {metric} {stat}: {before:.2f} ms → {after:.2f} ms ({(after - before) / before:+.0%})")
+        print(f"Total: {len(regressions)} regression(s) beyond {args.threshold:.0%} (and {args.min_delta:g} ms)")
+    else:
+        print(f"✅ No metric regressed beyond {args.threshold:.0%} of the baseline "
+              f"({baseline['created']}, {baseline['iterations']} sessions)")
+    print("=" * 60)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
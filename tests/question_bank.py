@@ -0,0 +1,137 @@
+"""
+Question Bank Loader for Psychology Assessment System
+Reads the questionsData array out of data.js so Python tools share the browser's bank
+(and other constant literals, such as the report texts in report-content.js)
+"""
+
+import json
+import os
+import re
+
+# Default location of the question bank (repository root)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_JS_PATH = os.path.join(BASE_DIR, "data.js")
+
+# Category order used by calculateResults() and result.html
+CATEGORIES = ("Communication", "Leadership", "Stress Management", "Teamwork")
+
+_IDENTIFIER = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
+
+
+def js_literal_to_json(source):
+    """
+    Convert a JavaScript object/array literal into JSON text
+
+    Handles the subset used by data.js: comments, unquoted keys,
+    single or double quoted strings and trailing commas.
+    """
+    out = []
+    i = 0
+    length = len(source)
+
+    while i < length:
+        char = source[i]
+
+        # Strings (re-emitted as JSON strings)
+        if char in ("'", '"'):
+            quote = char
+            i += 1
+            chars = []
+            while i < length and source[i] != quote:
+                if source[i] == "\\" and i + 1 < length:
+                    chars.append(source[i:i + 2])
+                    i += 2
+                    continue
+                chars.append(source[i])
+                i += 1
+            text = "".join(chars)
+            if quote == "'":
+                text = text.replace("\\'", "'").replace('"', '\\"')
+            out.append(f'"{text}"')
+            i += 1
+            continue
+
+        # Comments
+        if source.startswith("//", i):
+            newline = source.find("\n", i)
+            i = length if newline == -1 else newline
+            continue
+        if source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            continue
+
+        # Bare object keys
+        match = _IDENTIFIER.match(source, i)
+        if match:
+            word = match.group(0)
+            rest = source[match.end():].lstrip()
+            if rest.startswith(":"):
+                out.append(f'"{word}"')
+            else:
+                out.append(word)
+            i = match.end()
+            continue
+
+        out.append(char)
+        i += 1
+
+    # Drop trailing commas before closing brackets
+    return re.sub(r",(\s*[\]}])", r"\1", "".join(out))
+
+
+def extract_const_literal(source, name):
+    """Return the text of the object/array (or number/string) literal assigned to `const <name>` in JS source"""
+    scalar = re.search(rf"const\s+{re.escape(name)}\s*=\s*(-?\d+(?:\.\d+)?|'[^'\n]*'|\"[^\"\n]*\")\s*;", source)
+    if scalar:
+        return scalar.group(1)
+
+    match = re.search(rf"const\s+{re.escape(name)}\s*=\s*[\[{{]", source)
+    if not match:
+        raise ValueError(f"{name} literal not found")
+
+    start = match.end() - 1
+    depth = 0
+    quote = None
+    i = start
+
+    while i < len(source):
+        char = source[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+        elif source.startswith("//", i):
+            i = source.find("\n", i)
+            if i == -1:
+                break
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return source[start:i + 1]
+        i += 1
+
+    raise ValueError(f"Unterminated {name} literal")
+
+
+def extract_questions_literal(source):
+    """Return the text of the questionsData array literal from data.js source"""
+    return extract_const_literal(source, "questionsData")
+
+
+def load_js_constant(path, name):
+    """Load the literal assigned to `const <name>` in a JS file as Python data"""
+    with open(path, encoding="utf-8") as handle:
+        source = handle.read()
+
+    return json.loads(js_literal_to_json(extract_const_literal(source, name)))
+
+
+def load_questions(path=DATA_JS_PATH):
+    """Load questionsData from data.js as a list of dicts"""
+    return load_js_constant(path, "questionsData")
@@ -0,0 +1,162 @@
+"""
+Readiness Waits for the Selenium Suites
+Condition waits on the `readiness` state exposed by script.js and result.html,
+used instead of fixed sleeps, plus cold/warm page-load timing
+
+The suites load the app with the "fast" motion profile (motion.js), which
+drops the auto-advance pause and the results page animations; pass
+motion="normal" to with_motion() to keep them.
+"""
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from static_server import summarize_requests
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.02
+
+# Motion profile the suites load the app with (see motion.js)
+DEFAULT_MOTION = "fast"
+MOTION_PROFILES = ("normal", "reduced", "fast")
+
+# Navigation Timing for the current page, and bytes over the network for it and its resources
+PAGE_LOAD_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+return {
+    ttfb: nav.responseStart,
+    domContentLoaded: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    resources: resources.length,
+    transferred: resources.reduce(function (sum, r) { return sum + r.transferSize; }, nav.transferSize)
+};
+"""
+
+OPTION_CLICK_JS = """
+var options = document.getElementsByClassName('option');
+if (options && options.length > arguments[0]) {
+    options[arguments[0]].click();
+}
+"""
+
+# Clicks next-btn and returns the question to wait for; an auto-advance that
+# already moved on from the answered question stands in for the click
+NEXT_QUESTION_JS = """
+if (readiness.autoAdvancedTo === currentQuestionIndex) {
+    readiness.autoAdvancedTo = -1;
+    return currentQuestionIndex;
+}
+var index = currentQuestionIndex;
+document.getElementById('next-btn').click();
+return index + 1;
+"""
+
+
+def with_motion(url, profile=DEFAULT_MOTION):
+    """Add motion=<profile> to an app URL; None leaves the URL as it is"""
+    if profile is None:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}motion={profile}"
+
+
+def wait_for_js(driver, expression, timeout=DEFAULT_TIMEOUT):
+    """Wait until a JavaScript expression evaluates truthy and return its value"""
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+        lambda d: d.execute_script(f"return {expression};"),
+        f"Timed out waiting for: {expression}",
+    )
+
+
+def wait_for_question(driver, index=None, timeout=DEFAULT_TIMEOUT):
+    """Wait until question `index` (or any question, if None) is rendered on the quiz card"""
+    condition = "readiness.questionIndex >= 0" if index is None else f"readiness.questionIndex === {index}"
+    wait_for_js(driver, f"typeof readiness !== 'undefined' && !readiness.reviewOpen && {condition}", timeout)
+
+
+def wait_for_bank(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until every question bank chunk has been loaded"""
+    wait_for_js(driver, "typeof readiness !== 'undefined' && readiness.bankLoaded", timeout)
+
+
+def wait_for_review(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until the review page is on screen"""
+    wait_for_js(driver, "typeof readiness !== 'undefined' && readiness.reviewOpen", timeout)
+
+
+def select_option(driver, choice_index, timeout=DEFAULT_TIMEOUT):
+    """Click an option on the current question and wait until the answer is recorded"""
+    answers = driver.execute_script("return readiness.answers;")
+    driver.execute_script(OPTION_CLICK_JS, choice_index)
+    wait_for_js(driver, f"readiness.answers > {answers}", timeout)
+
+
+def wait_for_motion(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until no delay or animation is running (auto-advance, counting scores, score bars)"""
+    wait_for_js(driver, "typeof motion !== 'undefined' && motion.pending === 0", timeout)
+
+
+def wait_for_persisted(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until every recorded answer has been written to localStorage"""
+    wait_for_js(driver, "readiness.pendingSaves === 0", timeout)
+
+
+def go_to_next_question(driver, timeout=DEFAULT_TIMEOUT):
+    """Click next-btn (unless the auto-advance already moved on) and wait for the following question"""
+    index = driver.execute_script(NEXT_QUESTION_JS)
+    wait_for_question(driver, index, timeout)
+
+
+def wait_for_results(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until result.html has rendered, finished animating and drawn its chart"""
+    WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+        lambda d: "result.html" in d.current_url,
+        "Timed out waiting for result.html",
+    )
+    wait_for_js(
+        driver,
+        "typeof readiness !== 'undefined' && readiness.resultsRendered"
+        " && motion.pending === 0 && readiness.chartDrawn",
+        timeout,
+    )
+
+
+def measure_page_load(driver, url, cold=True, server=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Load url and return its Navigation Timing (ms) and bytes transferred
+
+    cold=True empties the browser cache first. With the StaticServer that
+    served the page, also counts the requests it saw and how many were 304s.
+    """
+    if cold:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    logged = len(server.requests) if server else 0
+
+    driver.get(url)
+    wait_for_js(
+        driver,
+        "document.readyState === 'complete' && performance.getEntriesByType('navigation')[0].loadEventEnd > 0",
+        timeout,
+    )
+    timing = driver.execute_script(PAGE_LOAD_TIMING_JS)
+    if server:
+        timing["server"] = summarize_requests(server.requests[logged:])
+    return timing
+
+
+def report_page_loads(driver, url, server=None):
+    """Measure and print a cold load followed by a warm (cached) load of url"""
+    timings = {
+        "cold": measure_page_load(driver, url, cold=True, server=server),
+        "warm": measure_page_load(driver, url, cold=False, server=server),
+    }
+
+    print("\n⏱️  Page load timings")
+    for name, timing in timings.items():
+        line = (f"  - {name}: load {timing['load']:.0f} ms | DOMContentLoaded {timing['domContentLoaded']:.0f} ms"
+                f" | TTFB {timing['ttfb']:.1f} ms | {timing['transferred'] / 1024:.1f} KB transferred")
+        if "server" in timing:
+            stats = timing["server"]
+            line += f" | {stats['requests']} requests ({stats['notModified']} × 304)"
+        print(line)
+
+    return timings
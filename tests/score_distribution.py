@@ -0,0 +1,355 @@
+"""
+Score Distribution Calculator for Psychology Assessment System
+Computes the exact distribution of every category score and of the weighted
+finalScore under a model of how people answer, and writes the percentile
+table result.html uses to say "higher than N% of respondents":
+
+    score-percentiles.js    for each distribution: its score range and the
+                            lowest score reaching each percentile 1-99
+
+No sampling: each category's distribution is the convolution of its
+questions' answer distributions (dynamic programming, or one FFT product for
+large banks), and finalScore's is the convolution of the category
+distributions scaled by their multipliers. The finalScore multipliers have
+one decimal place, so every reachable finalScore lies on a 0.1 grid and the
+table is indexed by round(finalScore * 10).
+
+The answer model ("prior") gives each option weight a relative likelihood,
+uniform by default; --prior-file overrides it per question, e.g. with option
+frequencies observed in real sessions.
+
+Usage:
+    python3 score_distribution.py                          # uniform prior → ../score-percentiles.js
+    python3 score_distribution.py --prior 1:1,2:2,3:4,4:3  # relative likelihood per option weight
+    python3 score_distribution.py --prior-file priors.json # {"<question id>": [likelihood per option]}
+    python3 score_distribution.py --verify 200000          # compare with sampled answer sheets
+    python3 score_distribution.py --check                  # fail if the table is missing or stale
+    python3 score_distribution.py --benchmark              # scaling from 50 to 1000 questions
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from batch_scoring import CATEGORY_MULTIPLIERS, BatchScorer
+from compile_bank import content_hash, read_text
+from question_bank import BASE_DIR, DATA_JS_PATH, load_questions
+
+TABLE_JS_PATH = os.path.join(BASE_DIR, "score-percentiles.js")
+TABLE_FORMAT_VERSION = 1
+
+HEADER = "// Generated by tests/score_distribution.py from data.js - do not edit by hand\n"
+
+# Direct convolution below this output length, FFT above it
+FFT_THRESHOLD = 2048
+
+BENCHMARK_SIZES = (50, 100, 200, 500, 1000)
+
+
+def parse_prior(spec):
+    """
+    Parse a prior: "uniform" or "weight:likelihood,..." (e.g. "1:1,2:2,3:4,4:3")
+
+    Returns {option weight: relative likelihood}, or None for uniform.
+    """
+    if spec == "uniform":
+        return None
+
+    prior = {}
+    for item in spec.split(","):
+        weight, _, likelihood = item.partition(":")
+        prior[int(weight)] = float(likelihood)
+    if any(likelihood < 0 for likelihood in prior.values()) or not any(prior.values()):
+        raise ValueError(f"Prior needs non-negative likelihoods, not all zero: {spec}")
+    return prior
+
+
+def answer_distributions(questions, prior=None, overrides=None):
+    """
+    Probability of each selected weight, per question
+
+    Returns a (questions x max weight + 1) array; row q, column w is the
+    chance question q is answered with an option of weight w.
+    overrides: {question id: [likelihood per option, in option order]}
+    """
+    overrides = overrides or {}
+    max_weight = max(option["weight"] for question in questions for option in question["options"])
+    distributions = np.zeros((len(questions), max_weight + 1))
+
+    for q_index, question in enumerate(questions):
+        likelihoods = overrides.get(str(question["id"]))
+        if likelihoods is None:
+            likelihoods = [1.0 if prior is None else prior.get(option["weight"], 0.0)
+                           for option in question["options"]]
+        if len(likelihoods) != len(question["options"]):
+            raise ValueError(f"Question {question['id']}: expected {len(question['options'])} likelihoods")
+
+        total = sum(likelihoods)
+        if total <= 0:
+            raise ValueError(f"Question {question['id']} has no option with a positive likelihood")
+        for option, likelihood in zip(question["options"], likelihoods):
+            distributions[q_index, option["weight"]] += likelihood / total
+
+    return distributions
+
+
+def convolve(a, b):
+    """Distribution of the sum of two independent integer variables"""
+    if len(a) + len(b) - 1 < FFT_THRESHOLD:
+        return np.convolve(a, b)
+    return fft_product([a, b])
+
+
+def fft_product(distributions):
+    """Convolve many distributions at once as one product of their spectra"""
+    length = sum(len(d) - 1 for d in distributions) + 1
+    size = 1 << (length - 1).bit_length()
+    spectrum = np.ones(size // 2 + 1, dtype=np.complex128)
+    for distribution in distributions:
+        spectrum *= np.fft.rfft(distribution, size)
+    result = np.fft.irfft(spectrum, size)[:length]
+    # Round-off leaves tiny negative values where the probability is 0
+    result = np.clip(result, 0, None)
+    return result / result.sum()
+
+
+def category_distributions(questions, distributions, method="dp"):
+    """
+    Exact distribution of each category's score
+
+    Returns {category: probability array indexed by score}, in order of first appearance.
+    method: "dp" adds one question at a time, "fft" multiplies all spectra at once.
+    """
+    rows = {}
+    for q_index, question in enumerate(questions):
+        rows.setdefault(question["category"], []).append(distributions[q_index])
+
+    result = {}
+    for category, category_rows in rows.items():
+        if method == "fft":
+            result[category] = fft_product(category_rows)
+        else:
+            total = np.ones(1)
+            for row in category_rows:
+                total = np.convolve(total, row)
+            result[category] = total
+    return result
+
+
+def multiplier_scale(multipliers):
+    """Smallest power of ten that makes every multiplier an integer"""
+    scale = 1
+    while any(abs(m * scale - round(m * scale)) > 1e-9 for m in multipliers):
+        scale *= 10
+    return scale
+
+
+def final_score_distribution(categories, multipliers=CATEGORY_MULTIPLIERS):
+    """
+    Exact distribution of finalScore = sum of category score x multiplier
+
+    Returns (scale, probability array indexed by round(finalScore * scale)).
+    """
+    scale = multiplier_scale([multipliers[category] for category in categories])
+    total = np.ones(1)
+    for category, distribution in categories.items():
+        step = round(multipliers[category] * scale)
+        spread = np.zeros((len(distribution) - 1) * step + 1)
+        spread[::step] = distribution
+        total = convolve(total, spread)
+    return scale, total
+
+
+def percentile_ranks(distribution):
+    """
+    Percentile rank (1-99) of every index of a distribution
+
+    Share of respondents scoring lower, plus half of those with the same score.
+    """
+    below = np.cumsum(distribution) - distribution
+    ranks = np.floor(100 * (below + distribution / 2) + 0.5)
+    return np.clip(ranks, 1, 99).astype(np.int64)
+
+
+def percentile_table(distribution, scale=1):
+    """
+    Compact table for one distribution
+
+    thresholds[p - 1] is the offset from min of the lowest score whose
+    percentile rank is at least p, so the rank of a score is the number of
+    thresholds at or below its offset. result.html expands this once into a
+    dense array and then looks scores up by index. min/max bound the scores
+    with a non-negligible probability; scores outside them rank 1 or 99.
+    """
+    support = np.flatnonzero(distribution > 1e-15)
+    low, high = int(support[0]), int(support[-1])
+    ranks = percentile_ranks(distribution[low:high + 1])
+    return {
+        "scale": scale,
+        "min": low,
+        "max": high,
+        "thresholds": np.searchsorted(ranks, np.arange(1, 100), side="left").tolist(),
+    }
+
+
+def describe_distribution(distribution, scale=1):
+    """Mean and standard deviation, in score units"""
+    values = np.arange(len(distribution)) / scale
+    mean = float(values @ distribution)
+    return mean, float(np.sqrt(((values - mean) ** 2) @ distribution))
+
+
+def compute_tables(questions, prior=None, overrides=None, prior_label="uniform", method="dp"):
+    """Build the score-percentiles.js content dict for a bank and prior"""
+    distributions = answer_distributions(questions, prior, overrides)
+    categories = category_distributions(questions, distributions, method)
+    scale, final = final_score_distribution(categories)
+    return {
+        "version": TABLE_FORMAT_VERSION,
+        "contentHash": content_hash(questions),
+        "prior": prior_label,
+        "finalScore": percentile_table(final, scale),
+        "categories": {category: percentile_table(distribution)
+                       for category, distribution in categories.items()},
+    }, categories, (scale, final)
+
+
+def render_table(table):
+    """Render the table dict as the score-percentiles.js script"""
+    body = json.dumps(table, ensure_ascii=False)
+    return f"{HEADER}const scorePercentiles = {body};\n"
+
+
+def verify(questions, distributions, categories, final, samples, seed=0):
+    """
+    Score sampled answer sheets with BatchScorer and compare with the exact result
+
+    Returns the largest gap between the sampled and exact cumulative
+    distributions, for each category and for finalScore.
+    """
+    rng = np.random.default_rng(seed)
+    scorer = BatchScorer(questions)
+
+    # Draw one weight per question from its answer distribution
+    cumulative = np.cumsum(distributions, axis=1)
+    cumulative[:, -1] = 1.0
+    draws = rng.random((samples, len(questions)))
+    weights = np.empty((samples, len(questions)), dtype=np.int8)
+    for q_index in range(len(questions)):
+        weights[:, q_index] = np.searchsorted(cumulative[q_index], draws[:, q_index], side="right")
+    batch = scorer.score(weights)
+
+    def gap(exact, sampled_indexes):
+        counts = np.bincount(sampled_indexes, minlength=len(exact))[:len(exact)]
+        return float(np.max(np.abs(np.cumsum(counts) / samples - np.cumsum(exact))))
+
+    gaps = {category: gap(distribution, batch["categoryScores"][:, c_index])
+            for c_index, (category, distribution) in enumerate(categories.items())}
+    scale, final_distribution = final
+    gaps["finalScore"] = gap(final_distribution, np.rint(batch["finalScore"] * scale).astype(np.int64))
+    return gaps
+
+
+def synthetic_bank(size, seed=0):
+    """A bank of size questions spread over the four categories, weights 1-4"""
+    rng = np.random.default_rng(seed)
+    names = list(CATEGORY_MULTIPLIERS)
+    return [{
+        "id": number + 1,
+        "category": names[number % len(names)],
+        "question": f"Question {number + 1}",
+        "options": [{"text": f"Option {weight}", "weight": int(weight)}
+                    for weight in rng.permutation([1, 2, 3, 4])],
+    } for number in range(size)]
+
+
+def run_benchmark(sizes=BENCHMARK_SIZES, repeats=5):
+    """Time both methods on synthetic banks and check they agree"""
+    print("=" * 60)
+    print("⏱️  SCORE DISTRIBUTION BENCHMARK")
+    print("=" * 60)
+    print(f"{'questions':>10} {'dp ms':>9} {'fft ms':>9} {'table entries':>14} {'max |dp - fft|':>15}")
+
+    for size in sizes:
+        questions = synthetic_bank(size)
+        timings = {}
+        for method in ("dp", "fft"):
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                table, _, (_, final) = compute_tables(questions, method=method)
+                best = min(best, time.perf_counter() - start)
+            timings[method] = (best * 1000, final)
+
+        difference = np.max(np.abs(timings["dp"][1] - timings["fft"][1]))
+        entries = table["finalScore"]["max"] - table["finalScore"]["min"] + 1
+        print(f"{size:>10} {timings['dp'][0]:>9.2f} {timings['fft'][0]:>9.2f} {entries:>14} {difference:>15.1e}")
+
+    print("=" * 60)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data", default=DATA_JS_PATH, help="question bank (data.js)")
+    parser.add_argument("--output", default=TABLE_JS_PATH, help="percentile table script")
+    parser.add_argument("--prior", default="uniform", help='"uniform" or "weight:likelihood,..."')
+    parser.add_argument("--prior-file", help="JSON {question id: [likelihood per option]}")
+    parser.add_argument("--method", choices=("dp", "fft"), default="dp")
+    parser.add_argument("--verify", type=int, default=0, metavar="N", help="compare with N sampled sheets")
+    parser.add_argument("--check", action="store_true", help="verify the table is up to date")
+    parser.add_argument("--benchmark", action="store_true", help="time synthetic banks of 50-1000 questions")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark()
+        return 0
+
+    questions = load_questions(args.data)
+    prior = parse_prior(args.prior)
+    overrides = None
+    prior_label = args.prior
+    if args.prior_file:
+        with open(args.prior_file, encoding="utf-8") as handle:
+            overrides = json.load(handle)
+        prior_label = f"{args.prior} + {os.path.basename(args.prior_file)}"
+
+    table, categories, final = compute_tables(questions, prior, overrides, prior_label, args.method)
+    content = render_table(table)
+
+    if args.check:
+        if read_text(args.output) != content:
+            print(f"❌ {args.output} is missing or stale - run python3 score_distribution.py")
+            return 1
+        print(f"✅ {args.output} is up to date ({table['contentHash']}, prior: {prior_label})")
+        return 0
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        handle.write(content)
+
+    scale, final_distribution = final
+    print(f"✅ Percentile table for {len(questions)} questions → {args.output} ({len(content)} bytes)")
+    print(f"  - Prior: {prior_label}")
+    mean, deviation = describe_distribution(final_distribution, scale)
+    print(f"  - finalScore: mean {mean:.2f}, sd {deviation:.2f}, "
+          f"{table['finalScore']['max'] - table['finalScore']['min'] + 1} table entries")
+    for category, distribution in categories.items():
+        mean, deviation = describe_distribution(distribution)
+        print(f"  - {category}: mean {mean:.2f}, sd {deviation:.2f}")
+
+    if args.verify:
+        distributions = answer_distributions(questions, prior, overrides)
+        gaps = verify(questions, distributions, categories, final, args.verify)
+        print(f"\n📊 Largest CDF gap vs {args.verify} sampled sheets (expect about {1 / np.sqrt(args.verify):.4f}):")
+        for name, value in gaps.items():
+            print(f"  - {name}: {value:.4f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
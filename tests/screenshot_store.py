@@ -0,0 +1,390 @@
+"""
+Content-Addressed Screenshot Store for the Selenium Suites
+Keeps each distinct screenshot once, a small JSON index per run, and an
+approved baseline per screenshot name; new screenshots are compared with
+their baseline by a NumPy perceptual diff
+
+Layout (under tests/screenshots/):
+    baselines.json              approved image hash per screenshot name (commit this)
+    baselines/<hash>.png        the approved images (commit these)
+    store/objects/<hash>.png    every distinct image seen, stored once
+    store/objects/<hash>.npy    its block-luminance signature, so diffs skip PNG decoding
+    store/runs/<run>.json       {name: {hash, width, height, diff}} for one run
+    store/runs/<run>/*.png      diff masks of the shots that failed
+
+Images are keyed by the SHA-256 of their decoded pixels, so re-encoded copies
+of the same frame share an object. The store keeps the newest --keep runs
+(default 20); prune() drops older run indexes and objects no run needs.
+
+The diff averages luminance over BLOCK x BLOCK pixel blocks, so antialiasing
+and subpixel text rendering do not count, and fails when more than
+MAX_CHANGED of the blocks moved by more than TOLERANCE levels.
+
+Usage:
+    python3 screenshot_store.py list                      # runs and baselines
+    python3 screenshot_store.py approve                   # approve every shot of the latest run
+    python3 screenshot_store.py approve 20260108_151038 result_screenshot
+    python3 screenshot_store.py diff old.png new.png      # diff two files, write new.diff.png
+    python3 screenshot_store.py prune --keep 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+SCREENSHOTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "screenshots")
+
+# Perceptual diff: luminance averaged over BLOCK x BLOCK pixels, change threshold in 0-255 levels
+BLOCK = 8
+TOLERANCE = 12
+# Share of blocks allowed to change before the shot fails (0.1%)
+MAX_CHANGED = 0.001
+# Runs kept by prune()
+KEEP_RUNS = 20
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Channels per PNG color type: gray, RGB, gray + alpha, RGBA
+PNG_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+# ITU-R BT.601 luma weights for R, G, B
+LUMA = np.array([0.299, 0.587, 0.114], np.float32)
+
+
+def _unfilter(filters, filtered):
+    """
+    Undo the PNG scanline filters of an (h, w, channels) uint8 array
+
+    Each pixel depends on its left, upper and upper-left neighbours, so pixels
+    on the same anti-diagonal (row + column) are independent: rows are skewed
+    so every diagonal becomes one vectorized step instead of a per-pixel loop.
+    """
+    height, width, channels = filtered.shape
+    rows, cols = np.indices((height, width))
+    diagonal = rows + cols
+
+    skewed = np.zeros((width + height - 1, height, channels), np.int16)
+    skewed[diagonal, rows] = filtered
+    # recon[d + 2, r + 1] is pixel (r, d - r); the padding holds the zeros PNG uses off the edges
+    recon = np.zeros((width + height + 1, height + 1, channels), np.int16)
+    # Per-row 0/1 weights for the Sub, Up, Average and Paeth predictors
+    sub, up_only, average, paeth_rows = (
+        (filters == kind).astype(np.int16)[:, None] for kind in (1, 2, 3, 4)
+    )
+
+    for d in range(width + height - 1):
+        lo, hi = max(0, d - width + 1), min(height - 1, d) + 1
+        left = recon[d + 1, lo + 1:hi + 1]
+        up = recon[d + 1, lo:hi]
+        up_left = recon[d, lo:hi]
+
+        pa = np.abs(up - up_left)
+        pb = np.abs(left - up_left)
+        pc = np.abs(left + up - 2 * up_left)
+        paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, up_left))
+        predictor = (sub[lo:hi] * left + up_only[lo:hi] * up
+                     + average[lo:hi] * ((left + up) >> 1) + paeth_rows[lo:hi] * paeth)
+        recon[d + 2, lo + 1:hi + 1] = (skewed[d, lo:hi] + predictor) & 0xFF
+
+    return recon[diagonal + 2, rows + 1].astype(np.uint8)
+
+
+def decode_png(data):
+    """Decode 8-bit, non-interlaced PNG bytes (what Chrome screenshots are) to an (h, w, channels) array"""
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError("Not a PNG file")
+
+    header, compressed, pos = None, [], 8
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"IDAT":
+            compressed.append(body)
+        elif kind == b"IEND":
+            break
+        pos += 12 + length
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or interlace or color_type not in PNG_CHANNELS:
+        raise ValueError(f"Unsupported PNG (bit depth {bit_depth}, color type {color_type}, interlace {interlace})")
+
+    channels = PNG_CHANNELS[color_type]
+    raw = np.frombuffer(zlib.decompress(b"".join(compressed)), np.uint8).reshape(height, 1 + width * channels)
+    return _unfilter(raw[:, 0], raw[:, 1:].reshape(height, width, channels))
+
+
+def encode_png(pixels):
+    """Encode an (h, w, 3) uint8 array as PNG bytes (no filtering; used for diff masks)"""
+    height, width, _ = pixels.shape
+    scanlines = np.concatenate([np.zeros((height, 1), np.uint8), pixels.reshape(height, -1)], axis=1)
+
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    return (PNG_SIGNATURE
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6))
+            + chunk(b"IEND", b""))
+
+
+def image_hash(pixels):
+    """SHA-256 of the decoded pixels and their shape"""
+    digest = hashlib.sha256(str(pixels.shape).encode())
+    digest.update(np.ascontiguousarray(pixels).tobytes())
+    return digest.hexdigest()
+
+
+def signature(pixels, block=BLOCK):
+    """Mean luminance of each block x block tile (partial tiles at the edges are dropped)"""
+    height, width = (pixels.shape[0] // block) * block, (pixels.shape[1] // block) * block
+    tiles = pixels[:height, :width].astype(np.float32)
+    luminance = tiles[..., :3] @ LUMA if tiles.shape[2] >= 3 else tiles[..., 0]
+    return luminance.reshape(height // block, block, width // block, block).mean(axis=(1, 3))
+
+
+def perceptual_diff(baseline, current, tolerance=TOLERANCE, max_changed=MAX_CHANGED):
+    """
+    Compare two signatures
+
+    Returns {passed, changed (share of blocks), blocks, mask (bool per block,
+    None when the sizes differ), ms}.
+    """
+    start = time.perf_counter()
+    if baseline.shape != current.shape:
+        return {"passed": False, "changed": 1.0, "blocks": current.size, "mask": None,
+                "ms": (time.perf_counter() - start) * 1000}
+
+    mask = np.abs(current - baseline) > tolerance
+    changed = float(mask.mean())
+    return {"passed": changed <= max_changed, "changed": changed, "blocks": int(mask.sum()), "mask": mask,
+            "ms": (time.perf_counter() - start) * 1000}
+
+
+def diff_image(pixels, mask, block=BLOCK):
+    """The screenshot dimmed, with changed blocks painted red"""
+    shown = (pixels[..., :3] if pixels.shape[2] >= 3 else np.repeat(pixels[..., :1], 3, axis=2)) // 3
+    covered = np.repeat(np.repeat(mask, block, axis=0), block, axis=1)
+    height, width = covered.shape
+    shown[:height, :width][covered] = (255, 0, 0)
+    return shown
+
+
+class ScreenshotStore:
+    """Deduplicated screenshot objects, per-run indexes and approved baselines"""
+
+    def __init__(self, root=SCREENSHOTS_DIR, run=None, keep=KEEP_RUNS):
+        """Open (or create) the store; run names this run's index (default: a timestamp)"""
+        self.root = root
+        self.objects_dir = os.path.join(root, "store", "objects")
+        self.runs_dir = os.path.join(root, "store", "runs")
+        self.baselines_dir = os.path.join(root, "baselines")
+        self.baselines_path = os.path.join(root, "baselines.json")
+        self.run = run or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.keep = keep
+        self.index = {}
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.runs_dir, exist_ok=True)
+
+    def object_path(self, digest, ext="png"):
+        """Path of a stored object"""
+        return os.path.join(self.objects_dir, f"{digest}.{ext}")
+
+    def baseline_path(self, digest):
+        """Path of an approved image"""
+        return os.path.join(self.baselines_dir, f"{digest}.png")
+
+    def load_baselines(self):
+        """{name: hash} of the approved images"""
+        if not os.path.exists(self.baselines_path):
+            return {}
+        with open(self.baselines_path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def load_signature(self, digest, path):
+        """Signature of a stored image, computed from its PNG once and cached next to the object"""
+        cached = self.object_path(digest, "npy")
+        if os.path.exists(cached):
+            return np.load(cached)
+        with open(path, "rb") as handle:
+            sig = signature(decode_png(handle.read()))
+        np.save(cached, sig)
+        return sig
+
+    def add(self, name, png):
+        """
+        Store a screenshot under name in this run and diff it against its baseline
+
+        Returns the run index entry: {hash, width, height, path, diff}; diff is
+        None when the name has no approved baseline yet.
+        """
+        pixels = decode_png(png)
+        digest = image_hash(pixels)
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            with open(path, "wb") as handle:
+                handle.write(png)
+            np.save(self.object_path(digest, "npy"), signature(pixels))
+
+        entry = {"hash": digest, "width": pixels.shape[1], "height": pixels.shape[0], "path": path, "diff": None}
+        approved = self.load_baselines().get(name)
+        if approved:
+            baseline = self.load_signature(approved, self.baseline_path(approved))
+            result = perceptual_diff(baseline, self.load_signature(digest, path))
+            entry["diff"] = {key: result[key] for key in ("passed", "changed", "blocks", "ms")}
+            entry["diff"]["baseline"] = approved
+            if not result["passed"] and result["mask"] is not None:
+                entry["diff"]["mask"] = self.save_diff_mask(name, pixels, result["mask"])
+
+        self.index[name] = entry
+        self.save_index()
+        self.prune()
+        return entry
+
+    def save_diff_mask(self, name, pixels, mask):
+        """Write the diff mask of a failed shot next to this run's index; returns its path"""
+        run_dir = os.path.join(self.runs_dir, self.run)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, f"{name}.diff.png")
+        with open(path, "wb") as handle:
+            handle.write(encode_png(diff_image(pixels, mask)))
+        return path
+
+    def save_index(self):
+        """Write this run's index"""
+        shots = {name: {key: value for key, value in entry.items() if key != "path"}
+                 for name, entry in self.index.items()}
+        with open(os.path.join(self.runs_dir, f"{self.run}.json"), "w", encoding="utf-8") as handle:
+            json.dump({"run": self.run, "shots": shots}, handle, indent=2)
+
+    def runs(self):
+        """Run names, oldest first"""
+        return sorted(name[:-5] for name in os.listdir(self.runs_dir) if name.endswith(".json"))
+
+    def load_run(self, run):
+        """{name: entry} of a run"""
+        with open(os.path.join(self.runs_dir, f"{run}.json"), encoding="utf-8") as handle:
+            return json.load(handle)["shots"]
+
+    def approve(self, run=None, names=None):
+        """Make shots of a run (default: the latest, all of its shots) the baselines; returns {name: hash}"""
+        run = run or self.runs()[-1]
+        shots = self.load_run(run)
+        baselines = self.load_baselines()
+        os.makedirs(self.baselines_dir, exist_ok=True)
+
+        approved = {}
+        for name in names or shots:
+            digest = shots[name]["hash"]
+            if not os.path.exists(self.baseline_path(digest)):
+                shutil.copyfile(self.object_path(digest), self.baseline_path(digest))
+            baselines[name] = approved[name] = digest
+
+        # Drop approved images no name points at any more
+        for filename in os.listdir(self.baselines_dir):
+            if filename[:-4] not in baselines.values():
+                os.remove(os.path.join(self.baselines_dir, filename))
+
+        with open(self.baselines_path, "w", encoding="utf-8") as handle:
+            json.dump(baselines, handle, indent=2, sort_keys=True)
+        return approved
+
+    def prune(self, keep=None):
+        """Keep the newest runs; delete older indexes, their diff masks and unreferenced objects"""
+        keep = self.keep if keep is None else keep
+        runs = self.runs()
+        removed = runs[:max(0, len(runs) - keep)]
+        for run in removed:
+            os.remove(os.path.join(self.runs_dir, f"{run}.json"))
+            shutil.rmtree(os.path.join(self.runs_dir, run), ignore_errors=True)
+
+        referenced = set(self.load_baselines().values())
+        for run in self.runs():
+            referenced.update(entry["hash"] for entry in self.load_run(run).values())
+        for filename in os.listdir(self.objects_dir):
+            if filename.split(".")[0] not in referenced:
+                os.remove(os.path.join(self.objects_dir, filename))
+        return removed
+
+
+def print_shot(name, entry):
+    """One line per stored screenshot: new object or duplicate, and its diff verdict"""
+    diff = entry["diff"]
+    if diff is None:
+        print(f"  🆕 {name}: {entry['hash'][:12]} (no baseline yet; approve with screenshot_store.py approve)")
+    elif diff["passed"]:
+        print(f"  ✅ {name}: matches baseline ({diff['changed']:.3%} of blocks changed, {diff['ms']:.1f} ms)")
+    else:
+        print(f"  ❌ {name}: visual change, {diff['changed']:.3%} of blocks ({diff['ms']:.1f} ms)")
+        if "mask" in diff:
+            print(f"     Diff mask: {diff['mask']}")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", default=SCREENSHOTS_DIR, help="screenshots folder (default: tests/screenshots)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list runs and baselines")
+    approve = commands.add_parser("approve", help="approve a run's shots as baselines")
+    approve.add_argument("run", nargs="?", help="run name (default: the latest)")
+    approve.add_argument("names", nargs="*", help="screenshot names (default: all)")
+    diff = commands.add_parser("diff", help="perceptual diff of two PNG files")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--tolerance", type=float, default=TOLERANCE,
+                      help=f"luminance change that counts, 0-255 (default: {TOLERANCE})")
+    diff.add_argument("--max-changed", type=float, default=MAX_CHANGED,
+                      help=f"share of blocks allowed to change (default: {MAX_CHANGED})")
+    prune = commands.add_parser("prune", help="drop old runs and unreferenced objects")
+    prune.add_argument("--keep", type=int, default=KEEP_RUNS, help=f"runs to keep (default: {KEEP_RUNS})")
+    args = parser.parse_args()
+
+    if args.command == "diff":
+        images = []
+        for path in (args.baseline, args.current):
+            with open(path, "rb") as handle:
+                images.append(decode_png(handle.read()))
+        result = perceptual_diff(signature(images[0]), signature(images[1]), args.tolerance, args.max_changed)
+        status = "✅ Match" if result["passed"] else "❌ Visual change"
+        print(f"{status}: {result['changed']:.3%} of blocks changed ({result['ms']:.2f} ms)")
+        if result["mask"] is not None and result["blocks"]:
+            mask_path = os.path.splitext(args.current)[0] + ".diff.png"
+            with open(mask_path, "wb") as handle:
+                handle.write(encode_png(diff_image(images[1], result["mask"])))
+            print(f"   Diff mask: {mask_path}")
+        return 0 if result["passed"] else 1
+
+    store = ScreenshotStore(args.root)
+    if args.command == "list":
+        for run in store.runs():
+            shots = store.load_run(run)
+            print(f"📁 {run}")
+            for name, entry in shots.items():
+                print_shot(name, entry)
+        print("\n📌 Baselines")
+        for name, digest in sorted(store.load_baselines().items()):
+            print(f"  - {name}: {digest[:12]}")
+    elif args.command == "approve":
+        if not store.runs():
+            print("❌ No runs to approve")
+            return 1
+        for name, digest in store.approve(args.run, args.names).items():
+            print(f"✅ Approved {name}: {digest[:12]}")
+    elif args.command == "prune":
+        removed = store.prune(args.keep)
+        print(f"✅ Removed {len(removed)} run(s); {len(store.runs())} kept")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
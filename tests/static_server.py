@@ -0,0 +1,291 @@
+"""
+Static App Server for Psychology Assessment System
+Serves the repository root over HTTP the way a production static host would,
+so the Selenium suites load the app from http:// instead of file://
+
+- Text assets (HTML, JS, CSS, JSON, SVG) are compressed once, up front, to
+  gzip and - when the optional `brotli` package is installed - brotli, and
+  sent according to the request's Accept-Encoding
+- Every response carries a content ETag; If-None-Match gets a 304
+- Cache-Control: HTML is always revalidated, other assets are cacheable for
+  max_age seconds, so a warm load only revalidates the pages
+- Each request is logged with its status, encoding, size and handling time
+
+Usage:
+    python3 static_server.py                 # serve the app on a free port
+    python3 static_server.py --port 8000 -v  # fixed port, print every request
+
+From Python (one shared server per process, stopped at exit):
+    from static_server import start_app_server
+    index_url = start_app_server().url("index.html")
+"""
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import http.server
+import mimetypes
+import os
+import statistics
+import threading
+import time
+import urllib.parse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The app lives in the repository root, one level above tests/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMPRESSIBLE_TYPES = (
+    "text/html", "text/css", "text/javascript", "application/javascript",
+    "application/json", "image/svg+xml", "text/plain",
+)
+# Skip compressing tiny files; the headers would outweigh the savings
+MIN_COMPRESS_BYTES = 256
+DEFAULT_MAX_AGE = 300
+
+mimetypes.add_type("text/javascript", ".js")
+
+
+class Asset:
+    """One file with its precompressed variants and their ETags"""
+
+    def __init__(self, path):
+        self.mtime = os.path.getmtime(path)
+        with open(path, "rb") as handle:
+            data = handle.read()
+
+        self.content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        digest = hashlib.sha1(data).hexdigest()[:16]
+        self.variants = {"identity": (data, f'"{digest}"')}
+
+        if self.content_type in COMPRESSIBLE_TYPES and len(data) >= MIN_COMPRESS_BYTES:
+            self.variants["gzip"] = (gzip.compress(data, 9, mtime=0), f'"{digest}-gz"')
+            if brotli is not None:
+                self.variants["br"] = (brotli.compress(data), f'"{digest}-br"')
+
+    def negotiate(self, accept_encoding):
+        """Pick the smallest variant the client accepts"""
+        accepted = {part.split(";")[0].strip() for part in accept_encoding.split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+
+class AssetCache:
+    """Assets by absolute path, reloaded when the file changes on disk"""
+
+    def __init__(self, root):
+        self.root = root
+        self.assets = {}
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        """The Asset for path, or None if it is not a servable file"""
+        if not os.path.isfile(path):
+            return None
+        mtime = os.path.getmtime(path)
+        with self.lock:
+            asset = self.assets.get(path)
+            if asset is None or asset.mtime != mtime:
+                asset = self.assets[path] = Asset(path)
+            return asset
+
+    def precompress(self):
+        """Load and compress every app file up front; returns the file count"""
+        for directory, subdirectories, files in os.walk(self.root):
+            # Skip tests/ and hidden folders (.git, ...)
+            subdirectories[:] = [name for name in subdirectories
+                                 if not name.startswith(".") and name != "tests"]
+            for name in files:
+                self.get(os.path.join(directory, name))
+        return len(self.assets)
+
+
+class AppRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves files from the AssetCache with compression and caching headers"""
+
+    server_version = "PsychAppServer/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def serve(self, send_body):
+        start = time.perf_counter()
+        path = self.translate_path(urllib.parse.urlsplit(self.path).path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+
+        relative = os.path.relpath(path, self.server.root)
+        hidden = any(part.startswith(".") for part in relative.split(os.sep))
+        asset = None if hidden else self.server.cache.get(path)
+        if asset is None:
+            self.send_error(404, "File not found")
+            self.server.record(self, 404, "identity", 0, start)
+            return
+
+        encoding = asset.negotiate(self.headers.get("Accept-Encoding", ""))
+        body, etag = asset.variants[encoding]
+        if asset.content_type == "text/html":
+            cache_control = "no-cache"
+        else:
+            cache_control = f"public, max-age={self.server.max_age}"
+
+        not_modified = etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+        status = 304 if not_modified else 200
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        if not not_modified:
+            self.send_header("Content-Type", asset.content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+        else:
+            self.send_header("Content-Length", "0")
+        self.end_headers()
+
+        sent = 0
+        if send_body and not not_modified:
+            self.wfile.write(body)
+            sent = len(body)
+        self.server.record(self, status, encoding, sent, start)
+
+    def log_message(self, format, *args):
+        """Requests are recorded by AppServer.record() instead"""
+
+
+class AppServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server holding the asset cache and the request log"""
+
+    daemon_threads = True
+
+    def __init__(self, address, root, max_age, verbose):
+        super().__init__(address, AppRequestHandler)
+        self.root = root
+        self.max_age = max_age
+        self.verbose = verbose
+        self.cache = AssetCache(root)
+        self.requests = []
+        self.log_lock = threading.Lock()
+
+    def finish_request(self, request, client_address):
+        AppRequestHandler(request, client_address, self, directory=self.root)
+
+    def record(self, handler, status, encoding, sent, start):
+        """Log one request with its handling time"""
+        entry = {
+            "method": handler.command,
+            "path": handler.path,
+            "status": status,
+            "encoding": encoding,
+            "bytes": sent,
+            "ms": (time.perf_counter() - start) * 1000,
+        }
+        with self.log_lock:
+            self.requests.append(entry)
+        if self.verbose:
+            print(f"  {entry['status']} {entry['method']} {entry['path']} "
+                  f"[{encoding}, {sent} B, {entry['ms']:.2f} ms]")
+
+
+class StaticServer:
+    """Runs an AppServer on a background thread"""
+
+    def __init__(self, root=REPO_ROOT, host="127.0.0.1", port=0,
+                 max_age=DEFAULT_MAX_AGE, verbose=False):
+        self.httpd = AppServer((host, port), root, max_age, verbose)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def requests(self):
+        """The request log: dicts with method, path, status, encoding, bytes and ms"""
+        return self.httpd.requests
+
+    def url(self, path="index.html"):
+        """Absolute URL of a repository-relative path"""
+        return self.base_url + path.lstrip("/")
+
+    def start(self):
+        """Precompress the assets and start serving; port 0 picks a free port"""
+        self.httpd.cache.precompress()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        if self.thread:
+            self.httpd.shutdown()
+            self.thread = None
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def summarize_requests(entries):
+    """Request count, bytes sent, 304 count and handling time for part of the log"""
+    times = sorted(entry["ms"] for entry in entries) or [0.0]
+    return {
+        "requests": len(entries),
+        "bytes": sum(entry["bytes"] for entry in entries),
+        "notModified": sum(1 for entry in entries if entry["status"] == 304),
+        "medianMs": statistics.median(times),
+        "maxMs": times[-1],
+    }
+
+
+# One server per process, created on first use by start_app_server()
+_app_server = None
+
+
+def start_app_server():
+    """Start (once) and return this process's shared server on a free port"""
+    global _app_server
+    if _app_server is None:
+        _app_server = StaticServer().start()
+        atexit.register(_app_server.stop)
+    return _app_server
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=0, help="default: a free port")
+    parser.add_argument("--max-age", type=int, default=DEFAULT_MAX_AGE, help="Cache-Control max-age for non-HTML assets")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every request")
+    args = parser.parse_args()
+
+    server = StaticServer(port=args.port, max_age=args.max_age, verbose=args.verbose).start()
+    print(f"✅ Serving {REPO_ROOT} at {server.url()} "
+          f"({len(server.httpd.cache.assets)} files, brotli {'on' if brotli else 'off'})")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        print("\n🔒 Server stopped")
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
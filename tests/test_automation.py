@@ -8,15 +8,37 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
+from selenium.common.exceptions import TimeoutException
 import random
 import os
-from datetime import datetime
+import sys
+
+from readiness import (
+    DEFAULT_MOTION, go_to_next_question, report_page_loads, select_option, wait_for_bank, wait_for_question,
+    wait_for_results, with_motion,
+)
+from screenshot_store import ScreenshotStore, print_shot
+from static_server import start_app_server
+
+def choose_option(strategy, rng=random):
+    """Pick a 0-based option index for one question based on strategy"""
+    if strategy == "random":
+        return rng.randint(0, 3)
+    elif strategy == "high":
+        return 3  # Always select option 4 (weight 4)
+    elif strategy == "low":
+        return 0  # Always select option 1 (weight 1)
+    elif strategy == "balanced":
+        # Mix of options 2 and 3, occasionally 4
+        return rng.choices([1, 2, 3], weights=[30, 40, 30])[0]
+    else:
+        return rng.randint(0, 3)
+
 
 class PsychologyAssessmentBot:
     """Automated testing bot for Psychology Assessment System"""
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, motion=DEFAULT_MOTION):
         """Initialize the Selenium WebDriver"""
         self.options = Options()
         
@@ -34,33 +56,46 @@ class PsychologyAssessmentBot:
         self.driver.maximize_window()
         self.wait = WebDriverWait(self.driver, 10)
         
-        # Get the current directory and construct file path
+        # Screenshots go to the deduplicated store in screenshots/; the app is served over HTTP from the repo root
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.index_url = f"file://{self.base_dir}/index.html"
+        self.screenshots = ScreenshotStore()
+        self.server = start_app_server()
+        # Motion profile for the app (motion.js); "normal" keeps the auto-advance pause and animations
+        self.index_url = with_motion(self.server.url("index.html"), motion)
         
         print(f"✓ WebDriver initialized")
         print(f"✓ Base directory: {self.base_dir}")
+        print(f"✓ App server: {self.server.base_url}")
+    
+    def report_page_loads(self):
+        """Print cold and warm load timings of the welcome page"""
+        return report_page_loads(self.driver, self.index_url, self.server)
     
     def start_assessment(self):
         """Navigate to the assessment and click start"""
         try:
             print("\n🚀 Starting assessment...")
             self.driver.get(self.index_url)
-            time.sleep(2)
             
             # Click "Start Assessment" button
             start_button = self.wait.until(
                 EC.element_to_be_clickable((By.ID, "start-btn"))
             )
             start_button.click()
+            wait_for_question(self.driver, 0)
             print("✓ Assessment started")
-            time.sleep(1)
             
         except Exception as e:
             print(f"❌ Error starting assessment: {e}")
             raise
     
-    def answer_questions(self, strategy="balanced"):
+    def reset_session(self):
+        """Return to the welcome screen with empty localStorage, reusing the browser"""
+        self.driver.get(self.index_url)
+        self.driver.execute_script("localStorage.clear();")
+        self.driver.refresh()
+    
+    def answer_questions(self, strategy="balanced", seed=None):
         """
         Answer all 50 questions based on strategy
         
@@ -69,36 +104,22 @@ class PsychologyAssessmentBot:
         - 'balanced': Mix of good and moderate answers (scores 80-130)
         - 'high': All excellent answers (score > 130)
         - 'low': All low answers (score < 80)
+        
+        Pass a seed to make 'random' and 'balanced' runs reproducible.
         """
+        rng = random.Random(seed) if seed is not None else random
         try:
             print(f"\n📝 Answering questions with '{strategy}' strategy...")
             
             for question_num in range(1, 51):
                 # Wait for question to load
-                time.sleep(0.7)
+                wait_for_question(self.driver, question_num - 1)
                 
                 # Select answer index based on strategy
-                if strategy == "random":
-                    choice_index = random.randint(0, 3)
-                elif strategy == "high":
-                    choice_index = 3  # Always select option 4 (weight 4)
-                elif strategy == "low":
-                    choice_index = 0  # Always select option 1 (weight 1)
-                elif strategy == "balanced":
-                    # Mix of options 2 and 3, occasionally 4
-                    choice_index = random.choices([1, 2, 3], weights=[30, 40, 30])[0]
-                else:
-                    choice_index = random.randint(0, 3)
+                choice_index = choose_option(strategy, rng)
                 
-                # Use JavaScript to click the option to avoid stale element issues
-                js_click = f"""
-                var options = document.getElementsByClassName('option');
-                if (options && options.length > {choice_index}) {{
-                    options[{choice_index}].click();
-                }}
-                """
-                self.driver.execute_script(js_click)
-                time.sleep(0.8)  # Longer wait to ensure selection registers
+                # Use JavaScript to click the option and wait until the answer is saved
+                select_option(self.driver, choice_index)
                 
                 # Progress indicator
                 if question_num % 10 == 0:
@@ -107,31 +128,55 @@ class PsychologyAssessmentBot:
                 # Click next button manually (not on last question)
                 if question_num < 50:
                     try:
-                        next_btn_click = "document.getElementById('next-btn').click();"
-                        self.driver.execute_script(next_btn_click)
-                        time.sleep(0.5)
+                        go_to_next_question(self.driver)
                     except Exception as e:
                         print(f"  ⚠️  Warning clicking next on question {question_num}: {e}")
                 else:
-                    # Last question - wait longer and verify submit button is enabled
+                    # Last question - verify submit button is enabled
                     print(f"  ✓ Answered final question {question_num}/50")
-                    time.sleep(2)
                     # Check if submit button is enabled
                     submit_enabled = self.driver.execute_script("return !document.getElementById('submit-btn').disabled;")
                     print(f"  Submit button enabled: {submit_enabled}")
             
             print(f"✓ All 50 questions answered!")
-            time.sleep(1)
             
         except Exception as e:
             print(f"❌ Error answering questions: {e}")
             raise
     
+    def answer_questions_turbo(self, strategy="balanced", seed=None):
+        """
+        Answer all questions in a single round trip ("turbo" mode)
+        
+        Sends the whole answer plan to runAnswerPlan() in script.js, which
+        runs each answer through the real selectOption/saveProgress path.
+        Use for high-volume scoring and regression runs; answer_questions()
+        remains the end-to-end UI click path.
+        
+        Returns the page's userAnswers and quizProgress snapshot.
+        """
+        rng = random.Random(seed) if seed is not None else random
+        try:
+            print(f"\n⚡ Answering questions with '{strategy}' strategy (turbo)...")
+            
+            # runAnswerPlan() needs every question bank chunk
+            wait_for_bank(self.driver)
+            question_count = self.driver.execute_script("return questionsData.length;")
+            plan = [choose_option(strategy, rng) for _ in range(question_count)]
+            snapshot = self.driver.execute_script("return runAnswerPlan(arguments[0]);", plan)
+            
+            answered = len(snapshot['userAnswers'])
+            print(f"✓ {answered}/{question_count} questions answered in one call")
+            return snapshot
+            
+        except Exception as e:
+            print(f"❌ Error answering questions (turbo): {e}")
+            raise
+    
     def submit_assessment(self):
         """Submit the assessment"""
         try:
             print("\n📤 Submitting assessment...")
-            time.sleep(2)
             
             # Check how many answers are recorded
             answer_count = self.driver.execute_script("return Object.keys(userAnswers).length;")
@@ -155,7 +200,6 @@ class PsychologyAssessmentBot:
             
             # Scroll to button
             self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-            time.sleep(0.5)
             
             # Click the submit button normally
             submit_button.click()
@@ -163,7 +207,10 @@ class PsychologyAssessmentBot:
             print("✓ Submit button clicked successfully")
             
             # Wait for page navigation
-            time.sleep(3)
+            try:
+                self.wait.until(EC.url_contains("result.html"))
+            except TimeoutException:
+                pass
             
             print(f"Current URL after submit: {self.driver.current_url}")
             
@@ -187,14 +234,14 @@ class PsychologyAssessmentBot:
         try:
             print("\n📊 Capturing results...")
             
-            # Wait for page transition to result.html
-            time.sleep(4)
+            # Wait for page transition, animations and chart to finish
+            try:
+                wait_for_results(self.driver, timeout=15)
+            except TimeoutException:
+                print("⚠️  Results page did not report ready; capturing anyway")
             
             print(f"Current URL: {self.driver.current_url}")
             
-            # Wait for animations and chart to load
-            time.sleep(2)
-            
             # Try to get final score with longer wait
             try:
                 final_score_element = WebDriverWait(self.driver, 15).until(
@@ -258,17 +305,19 @@ class PsychologyAssessmentBot:
             print(f"Page source preview: {self.driver.page_source[:500]}")
             raise
     
-    def save_screenshot(self, filename=None):
-        """Save screenshot of results page"""
+    def save_screenshot(self, filename="result_screenshot.png"):
+        """
+        Store a screenshot of the current page and diff it against its approved baseline
+        
+        Identical images are stored once (screenshot_store.py); returns the
+        run index entry, whose 'diff' says whether the page visibly changed.
+        """
         try:
-            if filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"result_screenshot_{timestamp}.png"
-            
-            filepath = os.path.join(self.base_dir, filename)
-            self.driver.save_screenshot(filepath)
-            print(f"\n📸 Screenshot saved: {filename}")
-            return filepath
+            name = os.path.splitext(filename)[0]
+            entry = self.screenshots.add(name, self.driver.get_screenshot_as_png())
+            print(f"\n📸 Screenshot stored: {name} (run {self.screenshots.run})")
+            print_shot(name, entry)
+            return entry
             
         except Exception as e:
             print(f"❌ Error saving screenshot: {e}")
@@ -278,7 +327,6 @@ class PsychologyAssessmentBot:
         """Close the browser"""
         try:
             print("\n🔒 Closing browser...")
-            time.sleep(2)  # Give time to view results
             self.driver.quit()
             print("✓ Browser closed")
         except Exception as e:
@@ -296,23 +344,34 @@ def main():
     
     try:
         # Run the assessment
+        bot.report_page_loads()
         bot.start_assessment()
-        bot.answer_questions(strategy="balanced")  # Change to 'high', 'low', or 'random'
+        # Fixed seed: the same answers every run, so the results screenshot can be diffed against its baseline
+        bot.answer_questions(strategy="balanced", seed=0)  # Change to 'high', 'low', or 'random'
         bot.submit_assessment()
         
         # Capture and display results
         results = bot.capture_results()
         
-        # Save screenshot
-        bot.save_screenshot()
+        # Store the screenshot and compare it with the approved baseline
+        shot = bot.save_screenshot()
+        if not shot:
+            print("\n❌ Automation failed: the results screenshot could not be stored")
+            return 1
+        if shot["diff"] and not shot["diff"]["passed"]:
+            print("\n❌ Visual regression: the results page no longer matches its baseline")
+            print("   Approve it with 'python3 screenshot_store.py approve' if the change is intended")
+            return 1
         
         print("\n✅ Automation completed successfully!")
-        print("\n💡 Tip: Check the screenshot file for visual results")
+        print("\n💡 Tip: 'python3 screenshot_store.py list' shows the stored screenshots and their diffs")
+        return 0
         
     except Exception as e:
         print(f"\n❌ Automation failed: {e}")
         # Save error screenshot
         bot.save_screenshot("error_screenshot.png")
+        return 1
         
     finally:
         # Close browser
@@ -320,4 +379,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -7,8 +7,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
-import os
+
+from readiness import report_page_loads, wait_for_js, wait_for_persisted, wait_for_question
+from static_server import start_app_server
 
 def diagnostic_test():
     """Run quick diagnostic"""
@@ -20,16 +21,16 @@ def diagnostic_test():
     driver.maximize_window()
     wait = WebDriverWait(driver, 10)
     
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    index_url = f"file://{base_dir}/index.html"
+    server = start_app_server()
+    index_url = server.url("index.html")
     
     print("🔍 DIAGNOSTIC TEST")
     print("=" * 60)
+    print(f"✓ App server: {server.base_url}")
     
     try:
-        # Load page
-        driver.get(index_url)
-        time.sleep(2)
+        # Load page (cold, then warm from the browser cache)
+        report_page_loads(driver, index_url, server)
         
         # Check for JavaScript errors
         logs = driver.get_log('browser')
@@ -63,7 +64,7 @@ def diagnostic_test():
         print("\n🚀 Testing quiz start...")
         start_btn = wait.until(EC.element_to_be_clickable((By.ID, "start-btn")))
         start_btn.click()
-        time.sleep(2)
+        wait_for_question(driver, 0)
         
         # Check if quiz screen is visible
         quiz_screen = driver.find_element(By.ID, "quiz-screen")
@@ -78,9 +79,11 @@ def diagnostic_test():
         if len(options) > 0:
             print(f"  ✅ Found {len(options)} options")
             
-            # Click first option
+            # Click first option and wait until the answer is saved
+            answers = driver.execute_script("return readiness.answers;")
             options[0].click()
-            time.sleep(1)
+            wait_for_js(driver, f"readiness.answers > {answers}")
+            wait_for_persisted(driver)
             
             # Check if answer was recorded
             answer_count = driver.execute_script("return Object.keys(userAnswers).length;")
@@ -114,7 +117,6 @@ def diagnostic_test():
         traceback.print_exc()
     
     finally:
-        time.sleep(2)
         driver.quit()
         print("🔒 Browser closed")
 
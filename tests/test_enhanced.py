@@ -9,13 +9,18 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
 import os
 
+from readiness import (
+    DEFAULT_MOTION, go_to_next_question, report_page_loads, select_option, wait_for_js, wait_for_persisted,
+    wait_for_question, wait_for_results, wait_for_review, with_motion,
+)
+from static_server import start_app_server
+
 class EnhancedAssessmentTest:
     """Enhanced automated testing for new features"""
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, motion=DEFAULT_MOTION):
         """Initialize WebDriver"""
         self.options = Options()
         if headless:
@@ -31,13 +36,16 @@ class EnhancedAssessmentTest:
         self.wait = WebDriverWait(self.driver, 10)
         
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.index_url = f"file://{self.base_dir}/index.html"
+        self.server = start_app_server()
+        # Motion profile for the app (motion.js); "normal" keeps the auto-advance pause and animations
+        self.index_url = with_motion(self.server.url("index.html"), motion)
         
         print("=" * 60)
         print("🧪 ENHANCED PSYCHOLOGY ASSESSMENT TEST (v2.0)")
         print("=" * 60)
         print(f"✓ WebDriver initialized")
-        print(f"✓ Base directory: {self.base_dir}\n")
+        print(f"✓ Base directory: {self.base_dir}")
+        print(f"✓ App server: {self.server.base_url}\n")
     
     def test_fresh_start(self):
         """Test 1: Fresh start without saved progress"""
@@ -48,11 +56,9 @@ class EnhancedAssessmentTest:
             # Clear localStorage first
             self.driver.get(self.index_url)
             self.driver.execute_script("localStorage.clear();")
-            time.sleep(1)
             
             # Reload page
             self.driver.refresh()
-            time.sleep(2)
             
             # Check that progress alert is hidden
             progress_alert = self.driver.find_element(By.ID, "progress-alert")
@@ -69,8 +75,8 @@ class EnhancedAssessmentTest:
                 EC.element_to_be_clickable((By.ID, "start-btn"))
             )
             start_btn.click()
+            wait_for_question(self.driver, 0)
             print("✓ Assessment started successfully")
-            time.sleep(1)
             
             return True
             
@@ -87,24 +93,15 @@ class EnhancedAssessmentTest:
             # Answer first 5 questions
             print("Answering first 5 questions...")
             for i in range(5):
-                time.sleep(0.5)
-                
                 # Click option 2 for all
-                js_click = """
-                var options = document.getElementsByClassName('option');
-                if (options && options.length > 1) {
-                    options[1].click();
-                }
-                """
-                self.driver.execute_script(js_click)
-                time.sleep(0.8)
+                select_option(self.driver, 1)
                 
                 # Click next (except on 5th question)
                 if i < 4:
-                    self.driver.execute_script("document.getElementById('next-btn').click();")
-                    time.sleep(0.5)
+                    go_to_next_question(self.driver)
             
             print("✓ Answered 5 questions")
+            wait_for_persisted(self.driver)
             
             # Check localStorage for saved progress
             saved_data = self.driver.execute_script("""
@@ -116,7 +113,11 @@ class EnhancedAssessmentTest:
                 
                 # Parse and validate
                 progress = self.driver.execute_script("""
-                    var data = JSON.parse(localStorage.getItem('quizProgress'));
+                    var data = applyProgressLog(
+                        decodeProgress(localStorage.getItem('quizProgress'), questionsData),
+                        localStorage.getItem('quizProgressLog'),
+                        questionsData
+                    );
                     return {
                         currentIndex: data.currentQuestionIndex,
                         answerCount: Object.keys(data.userAnswers).length
@@ -149,7 +150,6 @@ class EnhancedAssessmentTest:
             # Reload page (simulating browser close/reopen)
             print("Reloading page to simulate browser restart...")
             self.driver.refresh()
-            time.sleep(2)
             
             # Check if progress alert is visible
             progress_alert = self.driver.find_element(By.ID, "progress-alert")
@@ -166,8 +166,8 @@ class EnhancedAssessmentTest:
                 EC.element_to_be_clickable((By.ID, "resume-btn"))
             )
             resume_btn.click()
+            wait_for_question(self.driver)
             print("✓ Clicked 'Resume' button")
-            time.sleep(2)
             
             # Check if quiz resumed at correct position
             current_index = self.driver.execute_script("return currentQuestionIndex;")
@@ -196,28 +196,19 @@ class EnhancedAssessmentTest:
             # Answer more questions to have enough data
             print("Answering questions 6-10...")
             for i in range(5):
-                time.sleep(0.5)
-                self.driver.execute_script("""
-                    var options = document.getElementsByClassName('option');
-                    if (options && options.length > 2) {
-                        options[2].click();
-                    }
-                """)
-                time.sleep(0.8)
+                select_option(self.driver, 2)
                 if i < 4:
-                    self.driver.execute_script("document.getElementById('next-btn').click();")
-                    time.sleep(0.5)
+                    go_to_next_question(self.driver)
             
             print("✓ Answered 10 questions total")
-            time.sleep(1)
             
             # Click Review button
             review_btn = self.wait.until(
                 EC.element_to_be_clickable((By.ID, "review-btn"))
             )
             review_btn.click()
+            wait_for_review(self.driver)
             print("✓ Clicked 'Review Answers' button")
-            time.sleep(2)
             
             # Check if review page is displayed
             try:
@@ -242,7 +233,7 @@ class EnhancedAssessmentTest:
                         # Click on an answered question to test navigation
                         print("Testing navigation back to question...")
                         answered[0].click()
-                        time.sleep(2)
+                        wait_for_question(self.driver)
                         
                         # Check if we're back at quiz
                         question_text = self.driver.find_element(By.ID, "question-text")
@@ -276,34 +267,31 @@ class EnhancedAssessmentTest:
             # Click review button to go back to review page
             review_btn = self.driver.find_element(By.ID, "review-btn")
             review_btn.click()
-            time.sleep(2)
+            wait_for_review(self.driver)
             
             # Answer all remaining questions from review page
             print("Answering remaining 40 questions...")
-            unanswered = self.driver.find_elements(By.CSS_SELECTOR, ".review-item.unanswered")
             
-            for idx, item in enumerate(unanswered[:40]):  # Answer all remaining
-                item.click()
-                time.sleep(0.5)
+            for idx in range(40):  # Answer all remaining
+                # Re-find each pass: answered items drop out of the unanswered list
+                unanswered = self.driver.find_elements(By.CSS_SELECTOR, ".review-item.unanswered")
+                if not unanswered:
+                    break
+                question_index = int(unanswered[0].get_attribute("data-question-index"))
+                unanswered[0].click()
+                wait_for_question(self.driver, question_index)
                 
                 # Select an option
-                self.driver.execute_script("""
-                    var options = document.getElementsByClassName('option');
-                    if (options && options.length > 1) {
-                        options[1].click();
-                    }
-                """)
-                time.sleep(0.5)
+                select_option(self.driver, 1)
                 
                 # Go back to review
                 self.driver.execute_script("document.getElementById('review-btn').click();")
-                time.sleep(0.5)
+                wait_for_review(self.driver)
                 
                 if (idx + 1) % 10 == 0:
                     print(f"  ✓ Answered {idx + 11}/50 questions")
             
             print("✓ All 50 questions answered")
-            time.sleep(1)
             
             # Submit from review page
             submit_from_review = self.driver.find_element(By.ID, "submit-from-review-btn")
@@ -312,14 +300,17 @@ class EnhancedAssessmentTest:
                 print("✓ Submit button enabled on review page")
                 submit_from_review.click()
                 print("✓ Quiz submitted")
-                time.sleep(3)
+                try:
+                    self.wait.until(EC.url_contains("result.html"))
+                except TimeoutException:
+                    pass
                 
                 # Check if we're on results page
                 if "result.html" in self.driver.current_url:
                     print("✓ Redirected to results page")
                     
                     # Wait for results to load
-                    time.sleep(3)
+                    wait_for_results(self.driver)
                     
                     # Get final score
                     final_score = self.driver.execute_script("""
@@ -336,7 +327,7 @@ class EnhancedAssessmentTest:
                             # Click PDF button
                             pdf_btn.click()
                             print("✓ PDF download button clicked")
-                            time.sleep(3)
+                            wait_for_js(self.driver, "!document.getElementById('download-pdf-btn').disabled")
                             
                             # Check button text change
                             button_text = pdf_btn.text
@@ -368,6 +359,8 @@ class EnhancedAssessmentTest:
         print("\n🚀 Starting Enhanced Test Suite...")
         print("=" * 60)
         
+        report_page_loads(self.driver, self.index_url, self.server)
+        
         results = {}
         
         # Test 1: Fresh Start
@@ -0,0 +1,200 @@
+"""
+Memory Soak Test for Psychology Assessment System
+Cycles quiz → review page → question thousands of times without reloading,
+as a kiosk does all day, and fails if the JS heap, DOM nodes or event
+listeners keep growing
+
+After a warm-up (the review grid and option slots are built once), every
+batch of cycles is followed by a garbage collection and a sample of
+Memory.getDOMCounters, Performance.getMetrics and performance.memory. Heap
+snapshots before and after the soak name the constructors whose objects
+grew, with the retaining path of a few new ones.
+
+Usage:
+    python3 test_memory_soak.py                   # 2000 cycles
+    python3 test_memory_soak.py --cycles 10000 --batch 500
+    python3 test_memory_soak.py --max-heap-growth 512 --max-node-growth 50
+"""
+
+import argparse
+import sys
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from heap_snapshot import growth, new_objects, take_heap_snapshot
+from readiness import wait_for_bank, wait_for_question
+from static_server import start_app_server
+
+# One cycle per iteration, through the real click handlers:
+# open the review page, go back to a question (review item or "Back to Quiz"),
+# answer it, move on. Answers alternate so every review item gets patched.
+SOAK_CYCLES_JS = """
+var cycles = arguments[0], offset = arguments[1];
+for (var i = offset; i < offset + cycles; i++) {
+    document.getElementById('review-btn').click();
+    if (i % 2 === 0) {
+        reviewItems[(i / 2) % reviewItems.length].item.click();
+    } else {
+        document.getElementById('back-to-quiz-btn').click();
+    }
+    var options = optionsContainer.querySelectorAll('.option');
+    options[i % options.length].click();
+    cancelAutoAdvance();
+    document.getElementById('next-btn').click();
+}
+flushProgress();
+return readiness.renders;
+"""
+
+# performance.memory is exact with --enable-precise-memory-info
+MEMORY_JS = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+class MemorySoakTest:
+    """Runs review cycles in batches and samples memory after each batch"""
+
+    def __init__(self, headless=False, cycles=2000, batch=100, warmup=200):
+        """Initialize WebDriver"""
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+        self.options.add_argument('--enable-precise-memory-info')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.cycles = cycles
+        self.batch = batch
+        self.warmup = warmup
+        self.server = start_app_server()
+        self.index_url = self.server.url("index.html?sw=off&motion=fast")
+        self.samples = []
+
+        print("=" * 60)
+        print("🧠 MEMORY SOAK TEST")
+        print("=" * 60)
+        print(f"✓ App server: {self.server.base_url}")
+
+    def sample(self, cycles_done):
+        """Collect garbage, then record heap, DOM node and listener counts"""
+        self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        counters = self.driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+        metrics = {
+            metric["name"]: metric["value"]
+            for metric in self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        }
+        sample = {
+            "cycles": cycles_done,
+            "heap": metrics["JSHeapUsedSize"],
+            "performanceMemory": self.driver.execute_script(MEMORY_JS),
+            "nodes": counters["nodes"],
+            "listeners": counters["jsEventListeners"],
+            "documents": counters["documents"],
+        }
+        self.samples.append(sample)
+        return sample
+
+    def run_cycles(self, count, offset):
+        """Run count cycles in batches, sampling after each batch"""
+        done = 0
+        while done < count:
+            size = min(self.batch, count - done)
+            self.driver.execute_script(SOAK_CYCLES_JS, size, offset + done)
+            done += size
+            sample = self.sample(offset + done)
+            print(f"  {sample['cycles']:>6} cycles | heap {sample['heap'] / 1024:8.1f} KB | "
+                  f"{sample['nodes']:>6} nodes | {sample['listeners']:>4} listeners")
+
+    def run(self):
+        """Warm up, snapshot, soak, snapshot; returns (first sample, last sample, before, after)"""
+        self.driver.get(self.index_url)
+        self.driver.execute_script("localStorage.clear();")
+        self.driver.get(self.index_url)
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        wait_for_bank(self.driver)
+        self.driver.execute_script("document.getElementById('start-btn').click();")
+        wait_for_question(self.driver, 0)
+
+        print(f"\n🔥 Warm-up: {self.warmup} cycles")
+        self.run_cycles(self.warmup, 0)
+        first = self.samples[-1] if self.samples else self.sample(0)
+        before = take_heap_snapshot(self.driver)
+
+        print(f"\n🔁 Soak: {self.cycles} cycles")
+        self.run_cycles(self.cycles, self.warmup)
+        last = self.samples[-1]
+        after = take_heap_snapshot(self.driver)
+        return first, last, before, after
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def print_leaks(before, after, min_growth, paths=3):
+    """Print constructors whose object count grew, with retaining paths of new objects"""
+    grown = growth(before, after, min_growth)
+    if not grown:
+        print(f"✓ No constructor grew by {min_growth} or more objects")
+        return grown
+
+    print(f"\n🔍 Objects that grew by {min_growth} or more")
+    parent = after.retainers()
+    for label, count_before, count_after in grown[:10]:
+        print(f"  - {label}: {count_before} → {count_after} (+{count_after - count_before})")
+    for label, _, _ in grown[:paths]:
+        print(f"\n  Retaining paths of new {label} objects:")
+        for node in new_objects(before, after, label):
+            print(f"    {after.retaining_path(node, parent)}")
+    return grown
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000, help="soak cycles after the warm-up (default: 2000)")
+    parser.add_argument("--batch", type=int, default=100, help="cycles between samples (default: 100)")
+    parser.add_argument("--warmup", type=int, default=200, help="cycles before the first sample (default: 200)")
+    parser.add_argument("--max-heap-growth", type=float, default=1024,
+                        help="allowed JS heap growth in KB (default: 1024)")
+    parser.add_argument("--max-node-growth", type=int, default=100, help="allowed DOM node growth (default: 100)")
+    parser.add_argument("--max-listener-growth", type=int, default=10,
+                        help="allowed event listener growth (default: 10)")
+    parser.add_argument("--min-object-growth", type=int, default=100,
+                        help="report constructors that gained at least this many objects (default: 100)")
+    args = parser.parse_args()
+
+    bot = MemorySoakTest(headless=True, cycles=args.cycles, batch=args.batch, warmup=args.warmup)
+    try:
+        first, last, before, after = bot.run()
+    except Exception as e:
+        print(f"\n❌ Soak test failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+    checks = [
+        ("JS heap", (last["heap"] - first["heap"]) / 1024, args.max_heap_growth, " KB"),
+        ("DOM nodes", last["nodes"] - first["nodes"], args.max_node_growth, ""),
+        ("Event listeners", last["listeners"] - first["listeners"], args.max_listener_growth, ""),
+    ]
+
+    print("\n" + "-" * 60)
+    print(f"Growth over {args.cycles} cycles:")
+    for name, grown, limit, unit in checks:
+        status = "✅" if grown <= limit else "❌"
+        print(f"{status} {name}: {grown:+.1f}{unit} (limit {limit:g}{unit})")
+
+    print_leaks(before, after, args.min_object_growth)
+
+    passed = all(grown <= limit for _, grown, limit, _ in checks)
+    print("=" * 60)
+    print("✅ No leak found" if passed else "❌ Memory grew beyond the limits")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Offline Cache Test for Psychology Assessment System
+Checks the service worker precache: after the first visit, loading the quiz
+and results pages again makes no network requests, and the quiz still
+starts with the network switched off
+"""
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+from readiness import wait_for_bank, wait_for_js, wait_for_question
+from static_server import start_app_server
+from test_results_latency import STORE_RESULTS_JS
+
+# Requests the browser makes to look for a new app version, not to load the page
+UPDATE_CHECK_FILES = ("service-worker.js", "precache-manifest.js")
+
+
+class OfflineCacheTest:
+    """Loads each page twice and counts what reaches the app server"""
+
+    def __init__(self, headless=False):
+        """Initialize WebDriver"""
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.server = start_app_server()
+        self.index_url = self.server.url("index.html")
+
+        print("=" * 60)
+        print("📡 OFFLINE CACHE TEST")
+        print("=" * 60)
+        print(f"✓ App server: {self.server.base_url}")
+
+    def reset(self):
+        """Remove the service worker, its caches and the HTTP cache for the app origin"""
+        self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": self.server.base_url.rstrip("/"),
+            "storageTypes": "all",
+        })
+        self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+    def install(self):
+        """First visit: load the quiz page and wait until the precache is installed"""
+        self.driver.get(self.index_url)
+        wait_for_js(self.driver, "typeof offlineSupport !== 'undefined' && offlineSupport.ready", timeout=30)
+        print("✓ Service worker installed and precache ready")
+
+    def load_and_count(self, url, wait):
+        """Load url, run wait(driver), and return the page requests and update checks the server saw"""
+        logged = len(self.server.requests)
+        self.driver.get(url)
+        wait(self.driver)
+        requests = self.server.requests[logged:]
+        update_checks = [r for r in requests if r["path"].lstrip("/").split("?")[0] in UPDATE_CHECK_FILES]
+        page_requests = [r for r in requests if r not in update_checks]
+        return page_requests, update_checks
+
+    def check_second_load(self, name, url, wait):
+        """Pass if a repeat load of url made no page requests"""
+        page_requests, update_checks = self.load_and_count(url, wait)
+        passed = not page_requests
+        status = "✅" if passed else "❌"
+        print(f"{status} Second load of {name}: {len(page_requests)} network request(s)"
+              f" (+{len(update_checks)} service worker update check(s))")
+        for request in page_requests:
+            print(f"  - {request['status']} {request['path']}")
+        return passed
+
+    def check_offline(self):
+        """With the network off, the quiz starts and unknown pages get the offline page"""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": True, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1,
+        })
+        try:
+            self.driver.get(self.index_url)
+            self.driver.execute_script("localStorage.clear();")
+            self.driver.find_element(By.ID, "start-btn").click()
+            wait_for_question(self.driver, 0)
+            print("✅ Offline: quiz started and question 1 is on screen")
+
+            self.driver.get(self.server.url("missing-page.html"))
+            fallback = "Offline" in self.driver.title
+            print(f"{'✅' if fallback else '❌'} Offline: unknown page shows the offline fallback"
+                  f" (title: '{self.driver.title}')")
+            return fallback
+        except Exception as e:
+            print(f"❌ Offline: quiz did not start: {e}")
+            return False
+        finally:
+            self.driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+                "offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1,
+            })
+
+    def run(self):
+        """Run every check; returns True if all passed"""
+        self.reset()
+        self.install()
+
+        # The results page needs stored results, or it redirects to index.html
+        self.driver.execute_script(STORE_RESULTS_JS)
+
+        results = {
+            "index.html": self.check_second_load("index.html", self.index_url, wait_for_bank),
+            "result.html": self.check_second_load(
+                "result.html", self.server.url("result.html"),
+                lambda driver: wait_for_js(driver, "typeof readiness !== 'undefined' && readiness.resultsRendered"),
+            ),
+            "offline": self.check_offline(),
+        }
+
+        passed = sum(results.values())
+        print("-" * 60)
+        print(f"Total: {passed}/{len(results)} checks passed")
+        print("=" * 60)
+        return all(results.values())
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def main():
+    """Main execution"""
+    bot = OfflineCacheTest(headless=True)
+    try:
+        return 0 if bot.run() else 1
+    except Exception as e:
+        print(f"\n❌ Offline cache test failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,126 @@
+"""
+Persistence Latency Measurement for Psychology Assessment System
+Compares click-to-next-question latency with synchronous saves (?persist=sync)
+against the default idle-time delta log
+"""
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+from latency_stats import summarize
+from readiness import report_page_loads, wait_for_bank, wait_for_question
+from static_server import start_app_server
+
+MODES = {
+    "sync (before)": "?persist=sync",
+    "idle log (after)": "",
+}
+
+# Clicks an option, then next-btn, and reports once the next question has painted
+MEASURE_CLICK_JS = """
+var done = arguments[arguments.length - 1];
+var options = document.getElementById('options-container').querySelectorAll('.option');
+var start = performance.now();
+options[arguments[0]].click();
+var handlerEnd = performance.now();
+document.getElementById('next-btn').click();
+requestAnimationFrame(function () {
+    setTimeout(function () {
+        done({
+            handler: handlerEnd - start,
+            toNext: performance.now() - start,
+            index: currentQuestionIndex
+        });
+    }, 0);
+});
+"""
+
+
+class PersistenceLatencyTest:
+    """Measures per-answer latency for each persistence mode"""
+
+    def __init__(self, headless=False, sessions=3):
+        """Initialize WebDriver"""
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.sessions = sessions
+        self.server = start_app_server()
+        self.index_url = self.server.url("index.html")
+
+        print("=" * 60)
+        print("⏱️  PERSISTENCE LATENCY MEASUREMENT")
+        print("=" * 60)
+
+    def measure_session(self, query):
+        """Answer every question but the last, timing each click"""
+        self.driver.get(self.index_url + query)
+        self.driver.execute_script("localStorage.clear();")
+        self.driver.refresh()
+        self.driver.find_element(By.ID, "start-btn").click()
+        wait_for_question(self.driver, 0)
+        # Keep chunk loading out of the per-click timings
+        wait_for_bank(self.driver)
+
+        question_count = self.driver.execute_script("return questionsData.length;")
+        samples = []
+        for index in range(question_count - 1):
+            sample = self.driver.execute_async_script(MEASURE_CLICK_JS, index % 4)
+            if sample["index"] != index + 1:
+                raise Exception(f"Expected question {index + 1}, page is on {sample['index']}")
+            samples.append(sample)
+        return samples
+
+    def run(self):
+        """Measure every mode and print a comparison"""
+        report_page_loads(self.driver, self.index_url, self.server)
+        report = {}
+
+        for mode, query in MODES.items():
+            handler, to_next = [], []
+            for _ in range(self.sessions):
+                for sample in self.measure_session(query):
+                    handler.append(sample["handler"])
+                    to_next.append(sample["toNext"])
+            report[mode] = {
+                "click handler": summarize(handler),
+                "click to next question": summarize(to_next),
+            }
+
+        print(f"\n📊 {self.sessions} sessions per mode\n")
+        for mode, metrics in report.items():
+            print(f"{mode}:")
+            for metric, stats in metrics.items():
+                print(f"  - {metric:<24} median {stats['median']:.2f} ms | "
+                      f"p95 {stats['p95']:.2f} ms | mean {stats['mean']:.2f} ms")
+        print("=" * 60)
+
+        return report
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def main():
+    """Main execution"""
+    bot = PersistenceLatencyTest(headless=True)
+    try:
+        bot.run()
+        return 0
+    except Exception as e:
+        print(f"\n❌ Measurement failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,97 @@
+"""
+Results Page Latency Measurement for Psychology Assessment System
+Compares time-to-first-score on result.html with the old blocking <head>
+scripts (?libs=eager) against the default on-demand library loading
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from latency_stats import summarize
+from readiness import report_page_loads, wait_for_js
+from static_server import start_app_server
+
+MODES = {
+    "blocking <head> scripts (before)": "?libs=eager",
+    "on demand (after)": "",
+}
+
+# A fixed results record, stored through the app's own encoder
+STORE_RESULTS_JS = """
+localStorage.setItem('assessmentResults', encodeResults({
+    totalScore: 127,
+    finalScore: 161.3,
+    categoryScores: {'Communication': 33, 'Leadership': 30, 'Stress Management': 34, 'Teamwork': 30},
+    classification: 'Strong Professional Personality',
+    timeTaken: 300,
+    timestamp: new Date().toISOString(),
+    totalQuestions: 50,
+    answeredQuestions: 50
+}));
+"""
+
+
+class ResultsLatencyTest:
+    """Measures time-to-first-score for each loading mode"""
+
+    def __init__(self, headless=False, loads=10):
+        """Initialize WebDriver"""
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.loads = loads
+        self.server = start_app_server()
+
+        print("=" * 60)
+        print("⏱️  RESULTS PAGE LATENCY MEASUREMENT")
+        print("=" * 60)
+
+    def measure_load(self, query):
+        """Load result.html once; ms from navigation start until the scores were on the page"""
+        self.driver.get(self.server.url("result.html") + query)
+        return wait_for_js(self.driver, "typeof readiness !== 'undefined' && readiness.firstScoreAt", timeout=30)
+
+    def run(self):
+        """Measure every mode and print a comparison"""
+        # Seed results once; result.html redirects to index.html without them
+        report_page_loads(self.driver, self.server.url("index.html"), self.server)
+        self.driver.execute_script(STORE_RESULTS_JS)
+
+        report = {}
+        for mode, query in MODES.items():
+            report[mode] = summarize([self.measure_load(query) for _ in range(self.loads)])
+
+        print(f"\n📊 Time to first score, {self.loads} loads per mode\n")
+        for mode, stats in report.items():
+            print(f"{mode}:")
+            print(f"  - median {stats['median']:.1f} ms | p95 {stats['p95']:.1f} ms | mean {stats['mean']:.1f} ms")
+        print("=" * 60)
+
+        return report
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def main():
+    """Main execution"""
+    bot = ResultsLatencyTest(headless=True)
+    try:
+        bot.run()
+        return 0
+    except Exception as e:
+        print(f"\n❌ Measurement failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+
+if __name__ == "__main__":
+    exit(main())
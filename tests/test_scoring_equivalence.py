@@ -0,0 +1,388 @@
+"""
+Scoring Equivalence Fuzzer for Psychology Assessment System
+Scores tens of thousands of generated answer sheets with calculateResults()
+inside one loaded page (a single execute_script call), compares every
+result with an independent pure-Python implementation, and shrinks each
+disagreement to a minimal sheet
+
+A sheet is an answer history: [question id, weight] events replayed through
+recordAnswer(), so changed answers exercise the running tallies too.
+
+    random       every question answered with a random probability and weight
+    revised      random sheets where some answers change before the end
+    extremes     no answers, all lowest, all highest, one answer alone
+    boundaries   category totals whose weighted score is 80 or 130 exactly,
+                 or within 1.5 of either (the classification boundaries)
+
+Usage:
+    python3 test_scoring_equivalence.py                     # 20000 sheets in the browser
+    python3 test_scoring_equivalence.py --sheets 100000 --seed 7
+    python3 test_scoring_equivalence.py --offline           # reference vs batch_scoring.py, no browser
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+
+import numpy as np
+
+from batch_scoring import (
+    CATEGORY_MULTIPLIERS, CLASSIFICATIONS, NEEDS_IMPROVEMENT_BELOW, STRONG_ABOVE, BatchScorer,
+)
+from question_bank import BASE_DIR, CATEGORIES, load_js_constant, load_questions
+
+BANK_INDEX_PATH = os.path.join(BASE_DIR, "bank-index.js")
+
+# Score every sheet through the real tally path, then put the page's own answers back
+SCORE_SHEETS_JS = """
+var sheets = arguments[0];
+var saved = userAnswers;
+var results = new Array(sheets.length);
+for (var s = 0; s < sheets.length; s++) {
+    resetAnswers({});
+    var events = sheets[s];
+    for (var e = 0; e < events.length; e++) {
+        recordAnswer(events[e][0], events[e][1]);
+    }
+    var r = calculateResults();
+    results[s] = [
+        r.totalScore,
+        r.finalScore,
+        bankIndex.categories.map(function (category) { return r.categoryScores[category.name]; }),
+        r.classification,
+        r.answeredQuestions
+    ];
+}
+resetAnswers(saved);
+return results;
+"""
+
+# Scaled weighted scores (score x 100) of the classification boundaries
+BOUNDARIES = (NEEDS_IMPROVEMENT_BELOW * 100, STRONG_ABOVE * 100)
+BOUNDARY_WINDOW = 150
+MULTIPLIERS_X100 = {name: round(multiplier * 100) for name, multiplier in CATEGORY_MULTIPLIERS.items()}
+
+
+class ScoringSpec:
+    """The question bank as the reference scorer needs it"""
+
+    def __init__(self, questions=None):
+        """Read questions (data.js) and the category order of the compiled bank (bank-index.js)"""
+        self.questions = questions if questions is not None else load_questions()
+        self.categories = [c["name"] for c in load_js_constant(BANK_INDEX_PATH, "questionBankIndex")["categories"]]
+        self.category_of = {q["id"]: q["category"] for q in self.questions}
+        self.weights = {q["id"]: sorted(option["weight"] for option in q["options"]) for q in self.questions}
+        self.by_category = {
+            name: [q["id"] for q in self.questions if q["category"] == name] for name in self.categories
+        }
+
+
+def js_round(value):
+    """Math.round(): the nearest integer, halves toward +∞"""
+    whole = math.floor(value)
+    return whole + 1 if value - whole >= 0.5 else whole
+
+
+def reference_score(events, spec):
+    """
+    Score one sheet the way calculateResults() is specified
+
+    Returns (totalScore, finalScore, category scores in bank order,
+    classification, answeredQuestions).
+    """
+    answers = {}
+    for question_id, weight in events:
+        answers[question_id] = weight
+
+    totals = {name: 0 for name in spec.categories}
+    for question_id, weight in answers.items():
+        totals[spec.category_of[question_id]] += weight
+
+    # Summed in bank category order with the same float operations as the page
+    final = 0
+    for name in spec.categories:
+        final = final + totals[name] * CATEGORY_MULTIPLIERS.get(name, 1)
+
+    # The classification uses the unrounded score; only the stored score is rounded
+    if final < NEEDS_IMPROVEMENT_BELOW:
+        classification = CLASSIFICATIONS[0]
+    elif final <= STRONG_ABOVE:
+        classification = CLASSIFICATIONS[1]
+    else:
+        classification = CLASSIFICATIONS[2]
+
+    return (
+        sum(totals.values()),
+        js_round(final * 100) / 100,
+        [totals[name] for name in spec.categories],
+        classification,
+        len(answers),
+    )
+
+
+# ===========================
+# Sheet Generators
+# ===========================
+def random_sheet(spec, rng):
+    """Each question answered with one probability per sheet, in random order"""
+    probability = rng.choice((1.0, 1.0, rng.random()))
+    events = [[q["id"], rng.choice(spec.weights[q["id"]])] for q in spec.questions if rng.random() < probability]
+    rng.shuffle(events)
+    return events
+
+
+def revised_sheet(spec, rng):
+    """A random sheet with some answers changed (possibly back) before the end"""
+    events = random_sheet(spec, rng)
+    revisions = [[question_id, rng.choice(spec.weights[question_id])]
+                 for question_id, _ in events if rng.random() < 0.3]
+    return events + revisions
+
+
+def extreme_sheets(spec):
+    """No answers, all lowest, all highest, and every single answer on its own"""
+    sheets = [
+        [],
+        [[q["id"], spec.weights[q["id"]][0]] for q in spec.questions],
+        [[q["id"], spec.weights[q["id"]][-1]] for q in spec.questions],
+    ]
+    for q in spec.questions:
+        for weight in (spec.weights[q["id"]][0], spec.weights[q["id"]][-1]):
+            sheets.append([[q["id"], weight]])
+    return sheets
+
+
+def category_sheet(spec, name, target, rng):
+    """Answers within one category that add up to target, or None if none were found"""
+    events = []
+    remaining = target
+    question_ids = list(spec.by_category[name])
+    rng.shuffle(question_ids)
+    for question_id in question_ids:
+        fitting = [weight for weight in spec.weights[question_id] if weight <= remaining]
+        if remaining and fitting:
+            events.append([question_id, fitting[-1]])
+            remaining -= fitting[-1]
+    return events if remaining == 0 else None
+
+
+def boundary_sheets(spec, rng, limit):
+    """Sheets whose category totals put the weighted score at or near 80 and 130"""
+    maxima = [sum(spec.weights[qid][-1] for qid in spec.by_category[name]) for name in spec.categories]
+    scales = [MULTIPLIERS_X100.get(name, 100) for name in spec.categories]
+    if len(scales) != 4:
+        return []
+
+    # Integer arithmetic: the exact weighted score x 100 of each combination of totals
+    exact, near = [], []
+    for a in range(maxima[0] + 1):
+        for b in range(maxima[1] + 1):
+            for c in range(maxima[2] + 1):
+                partial = a * scales[0] + b * scales[1] + c * scales[2]
+                for boundary in BOUNDARIES:
+                    low = max(0, math.ceil((boundary - BOUNDARY_WINDOW - partial) / scales[3]))
+                    high = min(maxima[3], (boundary + BOUNDARY_WINDOW - partial) // scales[3])
+                    for d in range(low, high + 1):
+                        bucket = exact if partial + d * scales[3] == boundary else near
+                        bucket.append((a, b, c, d))
+
+    # Every exact hit is worth testing; fill the rest with near misses
+    chosen = exact if len(exact) <= limit else rng.sample(exact, limit)
+    chosen += rng.sample(near, min(len(near), limit - len(chosen)))
+
+    sheets = []
+    for totals in chosen:
+        parts = [category_sheet(spec, name, total, rng) for name, total in zip(spec.categories, totals)]
+        if all(part is not None for part in parts):
+            sheet = [event for part in parts for event in part]
+            rng.shuffle(sheet)
+            sheets.append(sheet)
+    return sheets
+
+
+def generate_sheets(spec, count, seed):
+    """[(kind, sheet)]: extremes, a quarter boundaries, the rest random and revised"""
+    rng = random.Random(seed)
+    sheets = [("extremes", sheet) for sheet in extreme_sheets(spec)]
+    sheets += [("boundaries", sheet) for sheet in boundary_sheets(spec, rng, count // 4)]
+    while len(sheets) < count:
+        kind = rng.choice(("random", "revised"))
+        sheets.append((kind, random_sheet(spec, rng) if kind == "random" else revised_sheet(spec, rng)))
+    return sheets[:count]
+
+
+# ===========================
+# Evaluators
+# ===========================
+def browser_evaluator(driver):
+    """Score sheets with calculateResults() in the page the driver has loaded"""
+    def evaluate(sheets):
+        return [tuple(result) for result in driver.execute_script(SCORE_SHEETS_JS, sheets)]
+    return evaluate
+
+
+def batch_evaluator(spec):
+    """Score sheets with batch_scoring.BatchScorer (the NumPy port), in bank category order"""
+    scorer = BatchScorer(spec.questions)
+    column = {question_id: index for index, question_id in enumerate(scorer.question_ids)}
+    category_columns = [CATEGORIES.index(name) for name in spec.categories]
+
+    def evaluate(sheets):
+        weights = np.zeros((len(sheets), scorer.num_questions), dtype=np.int8)
+        for row, events in enumerate(sheets):
+            for question_id, weight in events:
+                weights[row, column[question_id]] = weight
+        batch = scorer.score(weights)
+        results = []
+        for row in range(len(sheets)):
+            result = scorer.to_result(batch, row)
+            results.append((
+                result["totalScore"],
+                result["finalScore"],
+                [int(batch["categoryScores"][row, index]) for index in category_columns],
+                result["classification"],
+                result["answeredQuestions"],
+            ))
+        return results
+    return evaluate
+
+
+def normalize(result):
+    """Comparable form of a result tuple"""
+    total, final, categories, classification, answered = result
+    return (int(total), float(final), tuple(int(score) for score in categories), classification, int(answered))
+
+
+def shrink(sheet, spec, evaluate):
+    """
+    Smallest sheet that still disagrees with the reference
+
+    Greedy: drop one event, or lower one weight, as long as the sheet keeps
+    failing. Each round evaluates all candidates in one evaluate() call.
+    """
+    def failing(candidates):
+        results = evaluate(candidates)
+        return [candidate for candidate, result in zip(candidates, results)
+                if normalize(result) != normalize(reference_score(candidate, spec))]
+
+    while True:
+        removals = [sheet[:index] + sheet[index + 1:] for index in range(len(sheet))]
+        lowered = []
+        for index, (question_id, weight) in enumerate(sheet):
+            lower = [w for w in spec.weights[question_id] if w < weight]
+            if lower:
+                lowered.append(sheet[:index] + [[question_id, lower[-1]]] + sheet[index + 1:])
+
+        still_failing = failing(removals) or failing(lowered)
+        if not still_failing:
+            return sheet
+        sheet = still_failing[0]
+
+
+def describe_sheet(sheet, spec):
+    """One line per event: question, category, weight"""
+    return [f"Q{question_id} ({spec.category_of[question_id]}) = {weight}" for question_id, weight in sheet]
+
+
+def run_fuzz(spec, evaluate, sheets, max_reports=3):
+    """Compare every sheet; print counts per kind and shrunk mismatches. Returns the number of mismatches."""
+    results = evaluate([sheet for _, sheet in sheets])
+
+    counts = {}
+    mismatches = []
+    for (kind, sheet), result in zip(sheets, results):
+        counts[kind] = counts.get(kind, 0) + 1
+        if normalize(result) != normalize(reference_score(sheet, spec)):
+            mismatches.append((kind, sheet))
+
+    print("\n📊 Sheets per kind")
+    for kind, count in counts.items():
+        failed = sum(1 for mismatch_kind, _ in mismatches if mismatch_kind == kind)
+        print(f"  - {kind:<11} {count:>7,} sheets, {failed} mismatch(es)")
+
+    for kind, sheet in mismatches[:max_reports]:
+        minimal = shrink(sheet, spec, evaluate)
+        print(f"\n❌ Mismatch ({kind}), shrunk from {len(sheet)} to {len(minimal)} event(s):")
+        for line in describe_sheet(minimal, spec):
+            print(f"    {line}")
+        print(f"    implementation: {normalize(evaluate([minimal])[0])}")
+        print(f"    reference:      {normalize(reference_score(minimal, spec))}")
+
+    return len(mismatches)
+
+
+class ScoringEquivalenceTest:
+    """Loads the quiz once and scores every sheet in it"""
+
+    def __init__(self, headless=False):
+        """Initialize WebDriver and load the quiz"""
+        # Selenium is only needed here, so --offline runs without it
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        from readiness import wait_for_bank
+        from static_server import start_app_server
+
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.server = start_app_server()
+        self.driver.get(self.server.url("index.html?sw=off"))
+        self.driver.execute_script("localStorage.clear();")
+        wait_for_bank(self.driver)
+        # Thousands of sheets in one call take longer than the default script timeout
+        self.driver.set_script_timeout(600)
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sheets", type=int, default=20000, help="sheets to generate (default: 20000)")
+    parser.add_argument("--seed", type=int, default=1, help="generator seed (default: 1)")
+    parser.add_argument("--offline", action="store_true",
+                        help="compare the reference with batch_scoring.py instead of the browser")
+    args = parser.parse_args()
+
+    spec = ScoringSpec()
+    sheets = generate_sheets(spec, args.sheets, args.seed)
+
+    print("=" * 60)
+    print("🎲 SCORING EQUIVALENCE FUZZ")
+    print("=" * 60)
+    print(f"✓ {len(sheets):,} sheets (seed {args.seed}), reference vs "
+          f"{'batch_scoring.py' if args.offline else 'calculateResults() in the browser'}")
+
+    bot = None
+    try:
+        if args.offline:
+            evaluate = batch_evaluator(spec)
+        else:
+            bot = ScoringEquivalenceTest(headless=True)
+            evaluate = browser_evaluator(bot.driver)
+        mismatches = run_fuzz(spec, evaluate, sheets)
+    except Exception as e:
+        print(f"\n❌ Fuzzing failed: {e}")
+        return 1
+    finally:
+        if bot:
+            bot.close()
+
+    print("=" * 60)
+    print("✅ Every sheet matched the reference" if not mismatches else f"❌ {mismatches:,} mismatching sheet(s)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
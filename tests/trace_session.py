@@ -0,0 +1,435 @@
+"""
+Trace Capture for Psychology Assessment System
+Runs one quiz session in Chrome with DevTools tracing on, saves the trace,
+and summarizes the main-thread work of each step:
+
+    load              index.html navigation until the question bank is in
+    startQuiz         start-btn click until question 1 is on screen
+    displayQuestion   answering every question (option click → next question)
+    review page       review-btn click until the review page is on screen
+    submitQuiz        submit click until result.html starts parsing
+    results render    result.html until its scores, chart and animations are done
+
+The summary lists long tasks (≥50 ms on the renderer main thread), layouts
+and style recalculations, and script time per entry point for every step.
+Entry points are the outermost FunctionCall/EvaluateScript events, i.e. the
+event handler or timer callback the browser called; the app functions they
+call are not in these categories, and handlers show as '(anonymous)
+script.js:NNN'. With --timing the page runs with ?timing=on, and the
+performance.measure() spans of user-timing.js (recorded under
+blink.user_timing) are summed per app function as well. The saved trace is
+Chrome's JSON trace format; open it in the DevTools Performance panel or
+https://ui.perfetto.dev for the full timeline.
+
+Usage:
+    python3 trace_session.py                          # trace a session → traces/session_<time>.json
+    python3 trace_session.py --timing                 # ... with time per app function
+    python3 trace_session.py --output kiosk.json
+    python3 trace_session.py --summarize kiosk.json   # summarize a saved trace again
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from user_timing import with_timing
+
+TRACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "traces")
+
+# Main-thread tasks, JS entry points, layout/style and the console.timeStamp() step markers
+TRACE_CATEGORIES = ",".join((
+    "toplevel",
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "v8.execute",
+    "blink.user_timing",
+))
+
+LONG_TASK_MS = 50
+TASK_EVENTS = {"RunTask", "ThreadControllerImpl::RunTask", "ThreadControllerImpl::DoWork"}
+LAYOUT_EVENTS = {"Layout"}
+STYLE_EVENTS = {"UpdateLayoutTree", "RecalculateStyles"}
+SCRIPT_EVENTS = {"FunctionCall", "EvaluateScript", "v8.evaluateModule"}
+USER_TIMING_CATEGORY = "blink.user_timing"
+
+STEP_PREFIX = "step:"
+END_STEP = "end"
+# Navigating to result.html starts the last step; the page cannot be stamped before it renders
+RESULTS_STEP = ("results render", "result.html")
+
+
+def enable_tracing(options):
+    """Have ChromeDriver record a DevTools trace, read back with collect_trace()"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": False,
+        "enablePage": False,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+
+
+def collect_trace(driver):
+    """Trace events recorded since the last call (ChromeDriver flushes the trace on get_log)"""
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] == "Tracing.dataCollected":
+            events.append(message["params"])
+    return events
+
+
+def mark_step(driver, name):
+    """Start a step: a console.timeStamp() marker, which the trace records as a TimeStamp event"""
+    driver.execute_script("console.timeStamp(arguments[0]);", STEP_PREFIX + name)
+
+
+def complete_events(events):
+    """Events with a duration (µs): complete ("X") events plus matched begin/end ("B"/"E") pairs"""
+    complete = []
+    stacks = {}
+    for event in sorted(events, key=lambda e: e.get("ts", 0)):
+        phase = event.get("ph")
+        if phase == "X":
+            complete.append(dict(event, dur=event.get("dur", 0)))
+        elif phase == "B":
+            stacks.setdefault((event.get("pid"), event.get("tid")), []).append(event)
+        elif phase == "E":
+            stack = stacks.get((event.get("pid"), event.get("tid")))
+            if stack:
+                begin = stack.pop()
+                complete.append(dict(begin, ph="X", dur=event["ts"] - begin["ts"]))
+    return complete
+
+
+def user_timing_spans(events):
+    """performance.measure() spans (µs) from their async begin/end ("b"/"e" or "S"/"F") events"""
+    spans = []
+    open_spans = {}
+    for event in sorted(events, key=lambda e: e.get("ts", 0)):
+        if USER_TIMING_CATEGORY not in event.get("cat", "").split(","):
+            continue
+        key = (event.get("pid"), event.get("name"), event.get("id"), json.dumps(event.get("id2"), sort_keys=True))
+        phase = event.get("ph")
+        if phase in ("b", "S"):
+            open_spans.setdefault(key, []).append(event)
+        elif phase in ("e", "F") and open_spans.get(key):
+            begin = open_spans[key].pop()
+            spans.append(dict(begin, ph="X", dur=event["ts"] - begin["ts"]))
+    return spans
+
+
+def outermost(events):
+    """Drop events nested inside an earlier one on the same thread (e.g. RunTask within RunTask)"""
+    kept = []
+    ends = {}
+    for event in sorted(events, key=lambda e: (e["ts"], -e["dur"])):
+        thread = (event.get("pid"), event.get("tid"))
+        if event["ts"] < ends.get(thread, float("-inf")):
+            continue
+        kept.append(event)
+        ends[thread] = event["ts"] + event["dur"]
+    return kept
+
+
+def main_threads(events):
+    """(pid, tid) of every renderer main thread in the trace"""
+    return {
+        (event.get("pid"), event.get("tid"))
+        for event in events
+        if event.get("ph") == "M" and event.get("name") == "thread_name"
+        and event.get("args", {}).get("name") == "CrRendererMain"
+    }
+
+
+def step_boundaries(events):
+    """Sorted [(start ts, step name)] from the step markers and the result.html navigation"""
+    boundaries = []
+    for event in events:
+        data = event.get("args", {}).get("data", {})
+        if event.get("name") == "TimeStamp" and str(data.get("message", "")).startswith(STEP_PREFIX):
+            boundaries.append((event["ts"], data["message"][len(STEP_PREFIX):]))
+
+    results_name, results_page = RESULTS_STEP
+    parses = [
+        event["ts"] for event in events
+        if event.get("name") == "ParseHTML"
+        and results_page in event.get("args", {}).get("beginData", {}).get("url", "")
+    ]
+    if parses:
+        boundaries.append((min(parses), results_name))
+    return sorted(boundaries)
+
+
+def step_at(boundaries, ts):
+    """Name of the step running at ts (None before the first marker or after the end marker)"""
+    name = None
+    for start, step in boundaries:
+        if start > ts:
+            break
+        name = step
+    return None if name == END_STEP else name
+
+
+def script_label(event):
+    """Function name and location of a script event, e.g. 'selectOption script.js:543'"""
+    data = event.get("args", {}).get("data", {})
+    source = os.path.basename(data.get("url", "").split("?")[0]) or "(inline)"
+    if event["name"] == "FunctionCall":
+        name = data.get("functionName") or "(anonymous)"
+        line = data.get("lineNumber")
+        return f"{name} {source}:{line + 1}" if isinstance(line, int) else f"{name} {source}"
+    return f"(evaluate) {source}"
+
+
+def new_step_summary():
+    """Empty per-step counters"""
+    return {
+        "tasks": 0, "taskMs": 0.0,
+        "longTasks": 0, "longTaskMs": 0.0,
+        "layouts": 0, "layoutMs": 0.0,
+        "styleRecalcs": 0, "styleMs": 0.0,
+        "scriptMs": 0.0,
+        "functions": {},
+        "measures": {},
+    }
+
+
+def summarize_trace(events, long_task_ms=LONG_TASK_MS):
+    """
+    Per-step summary of the renderer main thread
+
+    Returns {"steps": {step: counters}, "longTasks": [...]}; each long task
+    carries its step and the script that took most of it. "functions" is
+    time per script entry point; "measures" is {name: {"calls", "ms"}} per
+    user-timing.js span, and stays empty unless the session ran with
+    ?timing=on. Spans are inclusive, so a wrapped function that calls
+    another counts the callee's time too.
+    """
+    threads = main_threads(events)
+    boundaries = step_boundaries(events)
+    timed = [
+        event for event in complete_events(events)
+        if (event.get("pid"), event.get("tid")) in threads or not threads
+    ]
+
+    # Nested tasks and script entries would count the same time twice
+    tasks = outermost([event for event in timed if event["name"] in TASK_EVENTS])
+    scripts = outermost([event for event in timed if event["name"] in SCRIPT_EVENTS])
+    rendering = [event for event in timed if event["name"] in LAYOUT_EVENTS | STYLE_EVENTS]
+    pages = {pid for pid, _ in threads}
+    measures = [event for event in user_timing_spans(events) if event.get("pid") in pages or not threads]
+
+    steps = {}
+    long_tasks = []
+    for event in tasks + scripts + rendering:
+        step = step_at(boundaries, event["ts"])
+        if step is None:
+            continue
+        summary = steps.setdefault(step, new_step_summary())
+        ms = event["dur"] / 1000
+        name = event["name"]
+
+        if name in TASK_EVENTS:
+            summary["tasks"] += 1
+            summary["taskMs"] += ms
+            if ms >= long_task_ms:
+                summary["longTasks"] += 1
+                summary["longTaskMs"] += ms
+                inside = [s for s in scripts if event["ts"] <= s["ts"] < event["ts"] + event["dur"]]
+                top = max(inside, key=lambda s: s["dur"], default=None)
+                long_tasks.append({
+                    "step": step,
+                    "ms": ms,
+                    "script": script_label(top) if top else None,
+                })
+        elif name in LAYOUT_EVENTS:
+            summary["layouts"] += 1
+            summary["layoutMs"] += ms
+        elif name in STYLE_EVENTS:
+            summary["styleRecalcs"] += 1
+            summary["styleMs"] += ms
+        elif name in SCRIPT_EVENTS:
+            summary["scriptMs"] += ms
+            label = script_label(event)
+            summary["functions"][label] = summary["functions"].get(label, 0.0) + ms
+
+    for event in measures:
+        step = step_at(boundaries, event["ts"])
+        if step is None:
+            continue
+        measure = steps.setdefault(step, new_step_summary())["measures"].setdefault(
+            event["name"], {"calls": 0, "ms": 0.0})
+        measure["calls"] += 1
+        measure["ms"] += event["dur"] / 1000
+
+    # Steps in the order the session ran them
+    order = {step: index for index, (_, step) in enumerate(boundaries)}
+    return {
+        "steps": dict(sorted(steps.items(), key=lambda item: order.get(item[0], len(order)))),
+        "longTasks": sorted(long_tasks, key=lambda task: -task["ms"]),
+    }
+
+
+def print_summary(summary, top_functions=5):
+    """Print the per-step table, the slowest functions per step and the longest tasks"""
+    print("\n📊 Main thread per step\n")
+    print(f"  {'step':<16} {'tasks':>6} {'long tasks':>16} {'layouts':>15} {'style recalcs':>15} {'script':>10}")
+    for step, stats in summary["steps"].items():
+        print(f"  {step:<16} {stats['tasks']:>6} "
+              f"{stats['longTasks']:>4} / {stats['longTaskMs']:6.1f} ms "
+              f"{stats['layouts']:>4} / {stats['layoutMs']:5.1f} ms "
+              f"{stats['styleRecalcs']:>4} / {stats['styleMs']:5.1f} ms "
+              f"{stats['scriptMs']:7.1f} ms")
+
+    print("\n🔍 Script time per entry point\n")
+    for step, stats in summary["steps"].items():
+        functions = sorted(stats["functions"].items(), key=lambda item: -item[1])[:top_functions]
+        if not functions:
+            continue
+        print(f"{step}:")
+        for label, ms in functions:
+            print(f"  - {ms:8.2f} ms  {label}")
+
+    if any(stats["measures"] for stats in summary["steps"].values()):
+        print("\n⏱️  Time per app function (user-timing.js spans, inclusive)\n")
+        for step, stats in summary["steps"].items():
+            measures = sorted(stats["measures"].items(), key=lambda item: -item[1]["ms"])[:top_functions]
+            if not measures:
+                continue
+            print(f"{step}:")
+            for name, measure in measures:
+                print(f"  - {measure['ms']:8.2f} ms  {name} ({measure['calls']} calls)")
+    else:
+        print("\n💡 Entry points only; trace with --timing for time per app function")
+
+    long_tasks = summary["longTasks"]
+    print(f"\n🐢 Long tasks (≥{LONG_TASK_MS} ms): {len(long_tasks)}")
+    for task in long_tasks[:10]:
+        print(f"  - {task['ms']:7.1f} ms in {task['step']}" + (f" ← {task['script']}" if task["script"] else ""))
+
+
+def save_trace(events, path):
+    """Write events in Chrome's JSON trace format"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"traceEvents": events, "metadata": {"source": "tests/trace_session.py"}}, handle)
+
+
+def load_trace(path):
+    """Events of a saved trace (object or bare-array format)"""
+    with open(path, "r", encoding="utf-8") as handle:
+        trace = json.load(handle)
+    return trace["traceEvents"] if isinstance(trace, dict) else trace
+
+
+class TraceSession:
+    """Runs one quiz session with tracing on and marks each step"""
+
+    def __init__(self, headless=False, query="?sw=off&motion=fast"):
+        """Initialize WebDriver with ChromeDriver's performance log tracing"""
+        # Selenium is only needed here, so --summarize runs without it
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        from static_server import start_app_server
+
+        self.options = Options()
+        if headless:
+            self.options.add_argument('--headless')
+
+        self.options.add_argument('--no-sandbox')
+        self.options.add_argument('--disable-dev-shm-usage')
+        self.options.add_argument('--window-size=1920,1080')
+        enable_tracing(self.options)
+
+        self.driver = webdriver.Chrome(options=self.options)
+        self.server = start_app_server()
+        self.index_url = self.server.url("index.html") + query
+
+        print("=" * 60)
+        print("🔬 TRACE CAPTURE")
+        print("=" * 60)
+        print(f"✓ App server: {self.server.base_url}")
+
+    def run(self):
+        """Run the session and return its trace events"""
+        from readiness import (
+            go_to_next_question, select_option, wait_for_bank, wait_for_question, wait_for_review, wait_for_results,
+        )
+
+        # Start from a fresh welcome page, and drop what was traced getting there
+        self.driver.get(self.index_url)
+        self.driver.execute_script("localStorage.clear();")
+        collect_trace(self.driver)
+
+        mark_step(self.driver, "load")
+        self.driver.get(self.index_url)
+        wait_for_bank(self.driver)
+
+        mark_step(self.driver, "startQuiz")
+        self.driver.execute_script("document.getElementById('start-btn').click();")
+        wait_for_question(self.driver, 0)
+
+        mark_step(self.driver, "displayQuestion")
+        question_count = self.driver.execute_script("return questionsData.length;")
+        for index in range(question_count):
+            select_option(self.driver, index % 4)
+            if index < question_count - 1:
+                go_to_next_question(self.driver)
+        print(f"✓ Answered {question_count} questions")
+
+        mark_step(self.driver, "review page")
+        self.driver.execute_script("document.getElementById('review-btn').click();")
+        wait_for_review(self.driver)
+
+        mark_step(self.driver, "submitQuiz")
+        self.driver.execute_script("document.getElementById('submit-from-review-btn').click();")
+        wait_for_results(self.driver, timeout=30)
+        mark_step(self.driver, END_STEP)
+        print("✓ Results rendered")
+
+        return collect_trace(self.driver)
+
+    def close(self):
+        """Close the browser"""
+        self.driver.quit()
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="trace file (default: traces/session_<time>.json)")
+    parser.add_argument("--summarize", metavar="TRACE", help="summarize a saved trace instead of running a session")
+    parser.add_argument("--query", default="?sw=off&motion=fast",
+                        help="URL switches for index.html (default: '?sw=off&motion=fast')")
+    parser.add_argument("--timing", action="store_true",
+                        help="add timing=on, so the summary has time per app function")
+    args = parser.parse_args()
+
+    if args.summarize:
+        print_summary(summarize_trace(load_trace(args.summarize)))
+        return 0
+
+    query = with_timing(args.query) if args.timing else args.query
+    bot = TraceSession(headless=True, query=query)
+    try:
+        events = bot.run()
+    except Exception as e:
+        print(f"\n❌ Trace capture failed: {e}")
+        return 1
+    finally:
+        bot.close()
+
+    output = args.output or os.path.join(TRACE_DIR, f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    save_trace(events, output)
+    print(f"✓ {len(events)} trace events → {output}")
+
+    print_summary(summarize_trace(events))
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+User Timing Harvester for the Selenium Suites
+Reads the performance.measure() spans that user-timing.js records when a
+page is opened with ?timing=on, and prints a latency histogram per function
+"""
+
+import bisect
+
+from latency_stats import summarize
+
+# Returns every span since the last call, including pages the tab has left
+COLLECT_USER_TIMINGS_JS = "return typeof collectUserTimings === 'function' ? collectUserTimings() : [];"
+
+# Upper bucket edges (ms); the last bucket is everything slower
+HISTOGRAM_EDGES = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+BAR_WIDTH = 30
+
+
+def with_timing(query):
+    """Add timing=on to a URL query string ('' or '?...')"""
+    return f"{query}&timing=on" if query else "?timing=on"
+
+
+def collect_user_timings(driver):
+    """Spans recorded since the last collection, as [{name, start, duration, page}]"""
+    return driver.execute_script(COLLECT_USER_TIMINGS_JS)
+
+
+def bucket_labels(edges=HISTOGRAM_EDGES):
+    """Display label of each histogram bucket"""
+    return [f"≤{edge:g} ms" for edge in edges] + [f">{edges[-1]:g} ms"]
+
+
+def latency_histograms(timings, edges=HISTOGRAM_EDGES):
+    """{function name: {"counts": per-bucket counts, "stats": median/p95/mean/max}}"""
+    durations = {}
+    for timing in timings:
+        durations.setdefault(timing["name"], []).append(timing["duration"])
+
+    histograms = {}
+    for name, values in durations.items():
+        counts = [0] * (len(edges) + 1)
+        for value in values:
+            counts[bisect.bisect_left(edges, value)] += 1
+        stats = summarize(values)
+        stats["max"] = max(values)
+        stats["calls"] = len(values)
+        histograms[name] = {"counts": counts, "stats": stats}
+    return histograms
+
+
+def print_histograms(histograms, edges=HISTOGRAM_EDGES):
+    """Print each function's call count, summary and non-empty buckets as bars"""
+    labels = bucket_labels(edges)
+    print("\n📊 User Timing spans per function\n")
+    for name, histogram in sorted(histograms.items(), key=lambda item: -item[1]["stats"]["p95"]):
+        stats = histogram["stats"]
+        print(f"{name}: {stats['calls']} calls | median {stats['median']:.2f} ms | "
+              f"p95 {stats['p95']:.2f} ms | max {stats['max']:.2f} ms")
+        peak = max(histogram["counts"])
+        for label, count in zip(labels, histogram["counts"]):
+            if count:
+                bar = "█" * max(1, round(BAR_WIDTH * count / peak))
+                print(f"  {label:>10} {bar} {count}")
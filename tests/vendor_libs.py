@@ -0,0 +1,79 @@
+"""
+Vendored Library Fetcher for Psychology Assessment System
+Downloads the pinned Chart.js and jsPDF builds into ../vendor/ so
+result.html can load them without network access
+
+result.html and pdf-worker.js only load vendor/<file> when
+precache-manifest.js lists it, and use the pinned CDN URL otherwise. After
+a download this script rebuilds the manifest (build_precache.py), so the
+copies are used and precached straight away.
+
+Usage:
+    python3 vendor_libs.py            # download missing libraries
+    python3 vendor_libs.py --force    # re-download all of them
+"""
+
+import argparse
+import os
+import sys
+import urllib.request
+
+from build_precache import MANIFEST_JS_PATH, write_manifest
+
+# The app lives in the repository root, one level above tests/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VENDOR_DIR = os.path.join(REPO_ROOT, "vendor")
+
+# Keep in step with LIBRARIES in result.html
+LIBRARIES = {
+    "chart.umd.min.js": "https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js",
+    "jspdf.umd.min.js": "https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js",
+}
+
+
+def fetch(url, path):
+    """Download url to path, writing to a temporary file first"""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        body = response.read()
+
+    partial = path + ".part"
+    with open(partial, "wb") as handle:
+        handle.write(body)
+    os.replace(partial, path)
+    return len(body)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="re-download existing files")
+    args = parser.parse_args()
+
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    failures = 0
+    downloaded = 0
+
+    for filename, url in LIBRARIES.items():
+        path = os.path.join(VENDOR_DIR, filename)
+        if os.path.exists(path) and not args.force:
+            print(f"✓ {filename} already vendored")
+            continue
+
+        try:
+            size = fetch(url, path)
+            downloaded += 1
+            print(f"✅ {filename} ({size / 1024:.0f} KB) ← {url}")
+        except OSError as e:
+            failures += 1
+            print(f"❌ {filename}: {e}")
+
+    # The pages only use the copies precache-manifest.js lists
+    if downloaded:
+        manifest = write_manifest()
+        print(f"✅ Precache manifest → {MANIFEST_JS_PATH} (version {manifest['version']})")
+
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+/**
+ * Psychological Assessment System - User Timing
+ * Wraps named app functions in performance.measure() spans, so the time
+ * spent in each can be read back with performance.getEntriesByType('measure')
+ *
+ * Off by default, and free when off: functions are only wrapped with
+ * ?timing=on. The switch is kept in sessionStorage for the rest of the tab,
+ * so the results page after a submit is measured too; ?timing=off clears it.
+ * Spans of a page that is left are carried over in sessionStorage until
+ * collectUserTimings() reads them (see tests/user_timing.py).
+ */
+
+const USER_TIMING_KEY = 'userTiming';
+const USER_TIMING_LOG_KEY = 'userTimingLog';
+
+const userTiming = {
+    enabled: (() => {
+        const param = new URLSearchParams(window.location.search).get('timing');
+        if (param === 'on') {
+            sessionStorage.setItem(USER_TIMING_KEY, 'on');
+        } else if (param === 'off') {
+            sessionStorage.removeItem(USER_TIMING_KEY);
+        }
+        return sessionStorage.getItem(USER_TIMING_KEY) === 'on';
+    })()
+};
+
+/**
+ * Wrap a function so every call is recorded as a measure named after it
+ * A promise result is measured until it settles.
+ */
+function timedFunction(name, fn) {
+    return function (...args) {
+        const start = performance.now();
+        let result;
+        try {
+            result = fn.apply(this, args);
+            return result;
+        } finally {
+            if (result && typeof result.then === 'function') {
+                const measure = () => performance.measure(name, { start });
+                result.then(measure, measure);
+            } else {
+                performance.measure(name, { start });
+            }
+        }
+    };
+}
+
+/**
+ * Replace the named global functions with timed versions (no-op when timing is off)
+ * Call it before the functions are handed to addEventListener; function
+ * declarations are hoisted, so the top of the page script works.
+ */
+function instrumentFunctions(names) {
+    if (!userTiming.enabled) return;
+
+    names.forEach(name => {
+        if (typeof window[name] === 'function') {
+            window[name] = timedFunction(name, window[name]);
+        }
+    });
+}
+
+/**
+ * Spans of this page as { name, start, duration, page }
+ */
+function currentPageTimings() {
+    const page = window.location.pathname.split('/').pop() || 'index.html';
+    return performance.getEntriesByType('measure').map(entry => ({
+        name: entry.name,
+        start: entry.startTime,
+        duration: entry.duration,
+        page
+    }));
+}
+
+/**
+ * Every span recorded since the last call, including pages already left
+ */
+function collectUserTimings() {
+    const timings = JSON.parse(sessionStorage.getItem(USER_TIMING_LOG_KEY) || '[]').concat(currentPageTimings());
+    sessionStorage.removeItem(USER_TIMING_LOG_KEY);
+    performance.clearMeasures();
+    return timings;
+}
+
+// Carry this page's spans over to the next page in the tab
+if (userTiming.enabled) {
+    window.addEventListener('pagehide', () => {
+        const log = JSON.parse(sessionStorage.getItem(USER_TIMING_LOG_KEY) || '[]');
+        sessionStorage.setItem(USER_TIMING_LOG_KEY, JSON.stringify(log.concat(currentPageTimings())));
+        performance.clearMeasures();
+    });
+}